@@ -0,0 +1,150 @@
+"""Memoized analyze_cv_standalone() results.
+
+Reanalysis, analyse-only uploads, analyze_cv_only() and extension profile
+builds all run the same extracted text through the NLP analyzers.  Results
+are cached by (sha256 of the text, nlp_service.analysis_version()):
+
+- an in-process LRU (ANALYSIS_CACHE_SIZE entries, default 256) in front of
+- the shared `cv_analysis_cache` table (when an app context is active)
+
+Resume studio editor resumes are also analysed section by section:
+analyze_sections() keeps nlp_service.analyze_section() facts per section
+hash (in-process only), so live scoring re-runs the expensive analyzers
+for edited sections only.
+
+Bumping nlp_service.NLP_VERSION invalidates every entry; old rows are
+purged at startup.  Entries are stored as JSON and every call returns a
+fresh copy, since callers (llm_service) mutate the result.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_CACHE_SIZE = int(os.environ.get('ANALYSIS_CACHE_SIZE', '256'))
+SECTION_CACHE_SIZE = int(os.environ.get('ANALYSIS_SECTION_CACHE_SIZE', '4096'))
+
+
+def text_hash(cv_text: str) -> str:
+    return hashlib.sha256(cv_text.encode('utf-8', 'replace')).hexdigest()
+
+
+class _LRU:
+    """Thread-safe least-recently-used map."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_analyses = _LRU(ANALYSIS_CACHE_SIZE)      # (text hash, version) -> JSON text
+_sections = _LRU(SECTION_CACHE_SIZE)       # (section hash, NLP_VERSION) -> analyze_section()
+
+
+def _db_get(digest, version):
+    from flask import has_app_context
+    if not has_app_context():
+        return None
+    from models import CVAnalysisCache
+    try:
+        row = CVAnalysisCache.query.filter_by(text_hash=digest, nlp_version=version).first()
+    except Exception as e:
+        logger.warning('Analysis cache lookup failed: %s', e)
+        return None
+    return row.results_json if row else None
+
+
+def _db_put(digest, version, payload):
+    from flask import has_app_context
+    if not has_app_context():
+        return
+    from models import db, CVAnalysisCache
+    from job_search import _insert_ignore
+    try:
+        _insert_ignore(CVAnalysisCache, [{
+            'text_hash': digest, 'nlp_version': version, 'results_json': payload,
+        }])
+        db.session.commit()
+    except Exception as e:
+        logger.warning('Analysis cache store failed: %s', e)
+        db.session.rollback()
+
+
+def analyze_cv(cv_text: str, timeout: float = 60) -> dict:
+    """analyze_cv_standalone(cv_text), served from cache when possible.
+
+    Misses run in the NLP process pool.  Always returns a new dict.
+    """
+    import nlp_pool
+    import nlp_service
+
+    version = nlp_service.analysis_version()
+    digest = text_hash(cv_text)
+    key = (digest, version)
+
+    payload = _analyses.get(key)
+    if payload is None:
+        payload = _db_get(digest, version)
+        if payload is None:
+            results = nlp_pool.submit(nlp_service.analyze_cv_standalone, cv_text, timeout=timeout)
+            payload = json.dumps(results)
+            _db_put(digest, version, payload)
+        _analyses.put(key, payload)
+    return json.loads(payload)
+
+
+def analyze_sections(section_texts: list, timeout: float = 10):
+    """analyze_cv_standalone()-shaped results for a CV given as sections.
+
+    Returns (results, rescored) where rescored is how many sections missed
+    the per-section cache and were analysed this call.
+    """
+    import nlp_pool
+    import nlp_service
+
+    keys = [(text_hash(t), nlp_service.NLP_VERSION) for t in section_texts]
+    partials = [_sections.get(k) for k in keys]
+    missing = [i for i, p in enumerate(partials) if p is None]
+    if missing:
+        fresh = nlp_pool.submit(nlp_service.analyze_sections_many,
+                                [section_texts[i] for i in missing], timeout=timeout)
+        for i, partial in zip(missing, fresh):
+            partials[i] = partial
+            _sections.put(keys[i], partial)
+    return nlp_service.analyze_cv_incremental(section_texts, partials), len(missing)
+
+
+def purge_stale():
+    """Delete rows from older NLP versions (needs an app context)."""
+    from models import db, CVAnalysisCache
+    from nlp_service import NLP_VERSION
+
+    deleted = CVAnalysisCache.query.filter(
+        ~CVAnalysisCache.nlp_version.like(f'{NLP_VERSION}.%')
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
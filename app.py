@@ -19,7 +19,7 @@ load_dotenv()  # Load .env file (GROQ_API_KEY, etc.)
 import requests as http_requests
 from bs4 import BeautifulSoup
 from flask import (Flask, Response, flash, jsonify, redirect, render_template,
-                   request, send_file, session, url_for)
+                   request, send_file, session, stream_with_context, url_for)
 from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.utils import secure_filename
 
@@ -250,6 +250,66 @@ with app.app_context():
         logger.info('Migration check (job_pool source): %s', e)
         db.session.rollback()
 
+    # Migration: create jd_features table + add desc_hash column to job_pool
+    try:
+        from sqlalchemy import inspect as _jf_inspect, text as _jf_text
+        from models import JDFeatures
+        _jf_insp = _jf_inspect(db.engine)
+        if 'jd_features' not in _jf_insp.get_table_names():
+            JDFeatures.__table__.create(db.engine)
+            logger.info('Migration: created jd_features table')
+        if 'job_pool' in _jf_insp.get_table_names():
+            _jf_cols = [c['name'] for c in _jf_insp.get_columns('job_pool')]
+            if 'desc_hash' not in _jf_cols:
+                db.session.execute(_jf_text("ALTER TABLE job_pool ADD COLUMN desc_hash VARCHAR(64) DEFAULT ''"))
+                db.session.execute(_jf_text('CREATE INDEX IF NOT EXISTS ix_job_pool_desc_hash ON job_pool (desc_hash)'))
+                db.session.commit()
+                logger.info('Migration: added desc_hash column to job_pool')
+    except Exception as e:
+        logger.info('Migration check (jd_features): %s', e)
+        db.session.rollback()
+
+    # Migration: create corpus_keyword_models table
+    try:
+        from sqlalchemy import inspect as _kw_inspect
+        from models import CorpusKeywordModel
+        if 'corpus_keyword_models' not in _kw_inspect(db.engine).get_table_names():
+            CorpusKeywordModel.__table__.create(db.engine)
+            logger.info('Migration: created corpus_keyword_models table')
+    except Exception as e:
+        logger.info('Migration check (corpus_keyword_models): %s', e)
+        db.session.rollback()
+
+    # Migration: full-text index on job_pool (tsvector + GIN / FTS5)
+    try:
+        import job_pool_fts
+        job_pool_fts.setup()
+    except Exception as e:
+        logger.info('Migration check (job_pool full-text): %s', e)
+        db.session.rollback()
+
+    # Migration: create job_catalogs table
+    try:
+        from sqlalchemy import inspect as _jc_inspect
+        from models import JobCatalog
+        if 'job_catalogs' not in _jc_inspect(db.engine).get_table_names():
+            JobCatalog.__table__.create(db.engine)
+            logger.info('Migration: created job_catalogs table')
+    except Exception as e:
+        logger.info('Migration check (job_catalogs): %s', e)
+        db.session.rollback()
+
+    # Migration: create cv_analysis_cache table
+    try:
+        from sqlalchemy import inspect as _ac_inspect
+        from models import CVAnalysisCache
+        if 'cv_analysis_cache' not in _ac_inspect(db.engine).get_table_names():
+            CVAnalysisCache.__table__.create(db.engine)
+            logger.info('Migration: created cv_analysis_cache table')
+    except Exception as e:
+        logger.info('Migration check (cv_analysis_cache): %s', e)
+        db.session.rollback()
+
     # Migration: add resume editor columns to user_resumes table
     try:
         from sqlalchemy import inspect as _re_inspect, text as _re_text
@@ -270,6 +330,20 @@ with app.app_context():
         logger.info('Migration check (resume editor): %s', e)
         db.session.rollback()
 
+    # Migration: add nlp_profile_json column to user_resumes table
+    try:
+        from sqlalchemy import inspect as _np_inspect, text as _np_text
+        _np_insp = _np_inspect(db.engine)
+        if 'user_resumes' in _np_insp.get_table_names():
+            _np_cols = [c['name'] for c in _np_insp.get_columns('user_resumes')]
+            if 'nlp_profile_json' not in _np_cols:
+                db.session.execute(_np_text('ALTER TABLE user_resumes ADD COLUMN nlp_profile_json TEXT'))
+                logger.info('Migration: added nlp_profile_json column to user_resumes')
+            db.session.commit()
+    except Exception as e:
+        logger.info('Migration check (user_resumes nlp_profile_json): %s', e)
+        db.session.rollback()
+
     # Migration: create user_profiles table if missing
     try:
         from sqlalchemy import inspect as _up_inspect
@@ -370,10 +444,40 @@ with app.app_context():
         db.session.commit()
         if _deleted:
             logger.info('Job pool cleanup: removed %d stale entries', _deleted)
+            import job_pool_fts
+            job_pool_fts.purge()
     except Exception as e:
         logger.info('Job pool cleanup: %s', e)
         db.session.rollback()
 
+    # Cleanup: drop cached CV analyses from older NLP versions
+    try:
+        import analysis_cache
+        _stale_analyses = analysis_cache.purge_stale()
+        if _stale_analyses:
+            logger.info('Analysis cache cleanup: removed %d stale entries', _stale_analyses)
+    except Exception as e:
+        logger.info('Analysis cache cleanup: %s', e)
+        db.session.rollback()
+
+    # Keyword model: pull the shared corpus IDF artifact for NLP processes
+    try:
+        import keyword_model
+        keyword_model.sync_from_db()
+    except Exception as e:
+        logger.info('Keyword model sync: %s', e)
+        db.session.rollback()
+
+# Bulk job catalogs (RemoteOK, Remotive) are refreshed off the request path
+if os.environ.get('JOB_CATALOG_REFRESHER', '1') != '0':
+    import job_catalogs
+    job_catalogs.start(app)
+
+# The best-match matrix is built and refreshed off the request path
+if os.environ.get('JOB_MATRIX_REFRESHER', '1') != '0':
+    import job_matrix
+    job_matrix.start(app)
+
 # ---------------------------------------------------------------------------
 # Google OAuth (optional — only if credentials are set)
 # ---------------------------------------------------------------------------
@@ -526,7 +630,7 @@ def _build_extension_profile(resume):
     # --- Uploaded resumes: extract from text ---
     elif resume.extracted_text:
         text = resume.extracted_text
-        from nlp_service import (extract_candidate_name, extract_skills_from_cv,
+        from nlp_service import (extract_candidate_name,
                                  _EMAIL_RE, _PHONE_RE, _LINKEDIN_RE, _GITHUB_RE)
 
         # Name
@@ -555,7 +659,8 @@ def _build_extension_profile(resume):
 
         # Skills
         try:
-            skills_result = extract_skills_from_cv(text)
+            from analysis_cache import analyze_cv
+            skills_result = analyze_cv(text, timeout=10).get('skills', {})
             profile['skills'] = skills_result.get('skills_found', [])[:30]
         except Exception:
             pass
@@ -1536,7 +1641,16 @@ def _auto_analyze_resume(resume_id: int, user_id: int, cv_text: str):
 
             try:
                 from llm_service import analyze_cv_only
-                results = analyze_cv_only(cv_text)
+                nlp_results = None
+                if _resume.resume_json:
+                    # Editor resume: reuse the per-section analyses from editing
+                    try:
+                        from analysis_cache import analyze_sections
+                        nlp_results, _ = analyze_sections(
+                            _json_resume_sections(json.loads(_resume.resume_json)))
+                    except Exception as e:
+                        logger.warning('Sectioned analysis failed, using full text: %s', e)
+                results = analyze_cv_only(cv_text, nlp_results=nlp_results)
                 _log_llm_usage(user_id, 'cv_analysis')
 
                 _resume.ats_score = results.get('cv_quality_score', 0)
@@ -2105,30 +2219,17 @@ def jobs_snapshot():
 
 @app.route('/jobs/category-tree')
 def jobs_category_tree():
-    """Return the canonical taxonomy for cascading filter UI."""
-    from skills_data import TAXONOMY, GLOBAL_LEVELS, INDIAN_CITIES
-
-    functions = {}
-    for func_id, func_data in TAXONOMY.items():
-        role_families = {}
-        for rf_id, rf_data in func_data['role_families'].items():
-            role_families[rf_id] = {
-                'label': rf_data['label'],
-                'skills': rf_data['skills'][:8],
-                'title_patterns': rf_data.get('title_patterns', []),
-            }
-        functions[func_id] = {
-            'label': func_data['label'],
-            'role_families': role_families,
-        }
+    """Return the canonical taxonomy for cascading filter UI.
 
-    levels = [{'id': lv['id'], 'label': lv['label']} for lv in GLOBAL_LEVELS]
+    The body is pre-rendered in the taxonomy artifact; clients revalidate
+    with If-None-Match and get a 304.
+    """
+    import taxonomy_artifact
+    artifact = taxonomy_artifact.load()
 
-    return jsonify({
-        'functions': functions,
-        'levels': levels,
-        'locations': INDIAN_CITIES,
-    })
+    response = Response(artifact['category_tree_json'], mimetype='application/json')
+    response.set_etag(artifact['category_tree_etag'])
+    return response.make_conditional(request)
 
 
 @app.route('/jobs/search')
@@ -2149,6 +2250,98 @@ def jobs_search():
         return jsonify({'error': f'Search failed: {str(e)}', 'jobs': [], 'total_count': 0}), 500
 
 
+def _get_resume_profile(resume):
+    """Load the resume's cached ResumeProfile, rebuilding it if stale."""
+    import nlp_pool
+    from nlp_service import ResumeProfile
+    cv_text = resume.extracted_text or ''
+    if resume.nlp_profile_json:
+        try:
+            profile = ResumeProfile.from_dict(json.loads(resume.nlp_profile_json), cv_text)
+            if profile is not None:
+                return profile
+        except (json.JSONDecodeError, TypeError):
+            pass
+    profile = nlp_pool.submit(ResumeProfile.build, cv_text, timeout=15)
+    try:
+        resume.nlp_profile_json = json.dumps(profile.to_dict())
+        db.session.commit()
+    except Exception as e:
+        logger.warning('Failed to save NLP profile for resume %s: %s', resume.id, e)
+        db.session.rollback()
+    return profile
+
+
+def _attach_ats_scores(user, primary, jobs):
+    """Add quick ATS (cached or batch-computed) and any deep ATS scores to job dicts in place."""
+    import nlp_pool
+    from nlp_service import batch_quick_ats
+    from job_search import get_cached_quick_ats, get_jd_features, store_quick_ats_scores
+    # One query for every cached score on the page
+    _cached = get_cached_quick_ats(primary.id, [j.get('job_id') for j in jobs])
+    _to_score = []
+    for job in jobs:
+        if job.get('description') and len(job['description'].strip()) >= 30:
+            cached_ats = _cached.get(job.get('job_id', ''))
+            if cached_ats:
+                job['ats_score'] = cached_ats.score
+                try:
+                    job['matched_skills'] = json.loads(cached_ats.matched_skills or '[]')[:5]
+                    job['missing_skills'] = json.loads(cached_ats.missing_skills or '[]')[:5]
+                except (json.JSONDecodeError, TypeError):
+                    job['matched_skills'] = []
+                    job['missing_skills'] = []
+                continue
+            _to_score.append(job)
+        else:
+            job['ats_score'] = None
+    # Compute fresh scores for the whole page in one batch
+    _new_scores = {}
+    if _to_score:
+        try:
+            _batch = nlp_pool.submit(
+                batch_quick_ats,
+                _get_resume_profile(primary),
+                get_jd_features([job['description'] for job in _to_score]),
+                timeout=15,
+            )
+        except Exception as _ats_err:
+            logger.warning('Quick ATS batch scoring failed: %s', _ats_err)
+            _batch = [None] * len(_to_score)
+        for job, ats in zip(_to_score, _batch):
+            if ats is None:
+                job['ats_score'] = None
+                job['matched_skills'] = []
+                job['missing_skills'] = []
+                continue
+            job['ats_score'] = ats['score']
+            job['matched_skills'] = ats['matched_skills'][:5]
+            job['missing_skills'] = ats['missing_skills'][:5]
+            if job.get('job_id'):
+                _new_scores[job['job_id']] = ats
+    # Bulk-save quick ATS cache entries (single insert-or-ignore)
+    store_quick_ats_scores(primary.id, _new_scores)
+
+    # Overlay any existing deep (LLM) scores
+    from models import JobATSScore
+    _job_ids = [j.get('job_id') for j in jobs if j.get('job_id')]
+    if _job_ids:
+        try:
+            _deep_scores = JobATSScore.query.filter(
+                JobATSScore.user_id == user.id,
+                JobATSScore.resume_id == primary.id,
+                JobATSScore.job_id.in_(_job_ids),
+            ).all()
+            _deep_map = {ds.job_id: ds for ds in _deep_scores}
+            for job in jobs:
+                ds = _deep_map.get(job.get('job_id'))
+                if ds:
+                    job['deep_ats_score'] = ds.ats_score
+                    job['has_deep_score'] = True
+        except Exception:
+            pass
+
+
 def _jobs_search_impl(user):
     """Inner implementation of /jobs/search (extracted so top-level catches all errors)."""
     use_preferences = request.args.get('use_preferences', '') == '1'
@@ -2157,26 +2350,18 @@ def _jobs_search_impl(user):
 
     if use_preferences:
         # Preference-based search: pool-first, then API fallback
-        prefs_obj = JobPreferences.query.filter_by(user_id=user.id).first()
-        if not prefs_obj or not prefs_obj.setup_completed:
-            return jsonify({'error': 'No saved preferences', 'jobs': [], 'total_count': 0})
-
-        prefs = prefs_obj.to_dict()
-
-        # Check if there's at least one meaningful filter
-        has_titles = bool(prefs.get('job_titles'))
-        has_taxonomy = bool(prefs.get('industries') or prefs.get('functional_areas'))
-        if not has_titles and not has_taxonomy:
-            return jsonify({'error': 'Please select a function/role or add job titles in your preferences',
-                            'jobs': [], 'total_count': 0})
+        prefs, error = _search_prefs(user)
+        if error:
+            return jsonify(error)
 
         from job_filter import (apply_local_filters,
                                 search_from_pool, normalize_api_params_for_cache)
         from job_search import (search_jobs_multi, get_cached_search,
-                                get_stale_cache)
+                                get_stale_cache, SEARCH_DEADLINE_SECONDS)
 
         warning = None
         sources_used = []
+        pending_sources = []
         normalized, cache_key = normalize_api_params_for_cache(prefs, page=page)
         logger.info('Search: query=%r, location=%r, titles=%r, industries=%r, func_areas=%r, cache_key=%s',
                      normalized.get('query'), normalized.get('location'),
@@ -2197,12 +2382,14 @@ def _jobs_search_impl(user):
                 jobs = pool_results
                 source = 'pool'
             else:
-                # 3. Pool miss — call all active providers in parallel
+                # 3. Pool miss — call all active providers in parallel; answer
+                #    from the fastest ones, slower ones fill cache/pool later
                 multi_results = search_jobs_multi(
                     prefs=prefs, page=page,
                     force_refresh=force_refresh,
                     cache_key=cache_key,
                     normalized_params=normalized,
+                    deadline=SEARCH_DEADLINE_SECONDS,
                 )
                 if multi_results.get('error') and not multi_results.get('jobs'):
                     # All providers failed — try stale cache as last resort
@@ -2217,6 +2404,7 @@ def _jobs_search_impl(user):
                     jobs = apply_local_filters(multi_results.get('jobs', []), prefs)
                     source = 'api'
                     sources_used = multi_results.get('sources', [])
+                    pending_sources = multi_results.get('pending_sources', [])
 
         # Sort by posted date descending (most recent first)
         jobs.sort(key=lambda j: j.get('posted_date_raw') or '', reverse=True)
@@ -2231,6 +2419,8 @@ def _jobs_search_impl(user):
         }
         if warning:
             results['warning'] = warning
+        if pending_sources:
+            results['pending_sources'] = pending_sources
 
     else:
         # Direct query search (backward compatible)
@@ -2253,99 +2443,224 @@ def _jobs_search_impl(user):
     # Compute quick ATS scores if user has a primary resume (with caching)
     primary = UserResume.query.filter_by(user_id=user.id, is_primary=True).first()
     if primary and primary.extracted_text and len(primary.extracted_text.strip()) >= 50:
-        from nlp_service import quick_ats_score
-        from models import QuickATSCache
-        _new_cache_entries = []
-        for job in results.get('jobs', []):
-            if job.get('description') and len(job['description'].strip()) >= 30:
-                job_id = job.get('job_id', '')
-                # Check quick ATS cache first
-                if job_id:
-                    cached_ats = QuickATSCache.query.filter_by(
-                        resume_id=primary.id, job_id=job_id
-                    ).first()
-                    if cached_ats:
-                        job['ats_score'] = cached_ats.score
-                        try:
-                            job['matched_skills'] = json.loads(cached_ats.matched_skills or '[]')[:5]
-                            job['missing_skills'] = json.loads(cached_ats.missing_skills or '[]')[:5]
-                        except (json.JSONDecodeError, TypeError):
-                            job['matched_skills'] = []
-                            job['missing_skills'] = []
-                        continue
-                # Compute fresh
-                try:
-                    ats = quick_ats_score(primary.extracted_text, job['description'])
-                    job['ats_score'] = ats['score']
-                    job['matched_skills'] = ats['matched_skills'][:5]
-                    job['missing_skills'] = ats['missing_skills'][:5]
-                    # Queue for cache
-                    if job_id:
-                        _new_cache_entries.append(QuickATSCache(
-                            resume_id=primary.id, job_id=job_id,
-                            score=ats['score'],
-                            matched_skills=json.dumps(ats['matched_skills'][:5]),
-                            missing_skills=json.dumps(ats['missing_skills'][:5]),
-                        ))
-                except Exception as _ats_err:
-                    logger.warning('Quick ATS score failed for job %s: %s', job_id, _ats_err)
-                    job['ats_score'] = None
-                    job['matched_skills'] = []
-                    job['missing_skills'] = []
-            else:
-                job['ats_score'] = None
-        # Bulk-save quick ATS cache entries
-        if _new_cache_entries:
-            try:
-                for entry in _new_cache_entries:
-                    db.session.add(entry)
-                db.session.commit()
-            except Exception:
-                db.session.rollback()
-
-        # Overlay any existing deep (LLM) scores
-        from models import JobATSScore
-        _job_ids = [j.get('job_id') for j in results.get('jobs', []) if j.get('job_id')]
-        if _job_ids:
-            try:
-                _deep_scores = JobATSScore.query.filter(
-                    JobATSScore.user_id == user.id,
-                    JobATSScore.resume_id == primary.id,
-                    JobATSScore.job_id.in_(_job_ids),
-                ).all()
-                _deep_map = {ds.job_id: ds for ds in _deep_scores}
-                for job in results.get('jobs', []):
-                    ds = _deep_map.get(job.get('job_id'))
-                    if ds:
-                        job['deep_ats_score'] = ds.ats_score
-                        job['has_deep_score'] = True
-            except Exception:
-                pass
+        _attach_ats_scores(user, primary, results.get('jobs', []))
 
     # Save snapshot for instant load on next visit (page 1 only)
     if use_preferences and results.get('jobs') and page == 1:
+        _save_job_snapshot(user, prefs, primary, results.get('jobs', []), results.get('source', ''))
+
+    return jsonify(results)
+
+
+def _search_prefs(user):
+    """(prefs dict, None) for a preference search, or (None, error payload)."""
+    prefs_obj = JobPreferences.query.filter_by(user_id=user.id).first()
+    if not prefs_obj or not prefs_obj.setup_completed:
+        return None, {'error': 'No saved preferences', 'jobs': [], 'total_count': 0}
+
+    prefs = prefs_obj.to_dict()
+
+    # Check if there's at least one meaningful filter
+    has_titles = bool(prefs.get('job_titles'))
+    has_taxonomy = bool(prefs.get('industries') or prefs.get('functional_areas'))
+    if not has_titles and not has_taxonomy:
+        return None, {'error': 'Please select a function/role or add job titles in your preferences',
+                      'jobs': [], 'total_count': 0}
+    return prefs, None
+
+
+def _save_job_snapshot(user, prefs, primary, jobs, source):
+    """Store page 1 of a preference search for instant load on the next visit."""
+    try:
+        import hashlib as _snap_hashlib
+        from models import UserJobSnapshot
+        _snap_prefs_hash = _snap_hashlib.sha256(
+            json.dumps(prefs, sort_keys=True).encode()
+        ).hexdigest() if prefs else ''
+        snapshot = UserJobSnapshot.query.filter_by(user_id=user.id).first()
+        if not snapshot:
+            snapshot = UserJobSnapshot(user_id=user.id)
+            db.session.add(snapshot)
+        snapshot.results_json = json.dumps(jobs)
+        snapshot.job_count = len(jobs)
+        snapshot.preferences_hash = _snap_prefs_hash
+        snapshot.resume_id = primary.id if primary else None
+        snapshot.source = source
+        snapshot.updated_at = datetime.utcnow()
+        db.session.commit()
+    except Exception as e:
+        logger.error('Failed to save job snapshot: %s', e)
+        db.session.rollback()
+
+
+_STREAMED_SCORE_FIELDS = ('ats_score', 'matched_skills', 'missing_skills',
+                          'deep_ats_score', 'has_deep_score')
+
+
+def _sse(event, data):
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'
+
+
+@app.route('/jobs/search/stream')
+def jobs_search_stream():
+    """Server-Sent Events variant of /jobs/search?use_preferences=1.
+
+    Events, in order:
+      jobs    {provider, jobs, removed}  a batch as each provider answers
+              (removed: job_ids a higher-priority duplicate replaced)
+      scores  {job_id: {ats_score, matched_skills, ...}}  after each batch
+      done    {total_count, source, sources, job_ids, warning?}
+    or a single `error` {error} event.
+    """
+    if not session.get('user_id'):
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    user = User.query.get(session['user_id'])
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+
+    force_refresh = request.args.get('force', '') == '1'
+    page = request.args.get('page', 1, type=int)
+    prefs, prefs_error = _search_prefs(user)
+
+    def _events():
+        if prefs_error:
+            yield _sse('error', prefs_error)
+            return
+
+        from job_filter import (apply_local_filters,
+                                search_from_pool, normalize_api_params_for_cache)
+        from job_search import (search_jobs_multi_stream, get_cached_search,
+                                get_stale_cache)
+
+        primary = UserResume.query.filter_by(user_id=user.id, is_primary=True).first()
+        can_score = bool(primary and primary.extracted_text
+                         and len(primary.extracted_text.strip()) >= 50)
+
+        def _newest_first(jobs):
+            jobs.sort(key=lambda j: j.get('posted_date_raw') or '', reverse=True)
+            return jobs
+
+        def _batch(jobs, provider, removed=()):
+            yield _sse('jobs', {'provider': provider, 'jobs': jobs, 'removed': list(removed)})
+            if can_score and jobs:
+                _attach_ats_scores(user, primary, jobs)
+                yield _sse('scores', {
+                    job['job_id']: {k: job[k] for k in _STREAMED_SCORE_FIELDS if k in job}
+                    for job in jobs if job.get('job_id')
+                })
+
+        warning = None
+        sources_used = []
+        normalized, cache_key = normalize_api_params_for_cache(prefs, page=page)
+
+        # Same order as /jobs/search: cache, pool, then the providers
+        cached_result, _ = (None, None) if force_refresh else get_cached_search(cache_key)
+        pool_results = None
+        if not cached_result and not (force_refresh or page > 1):
+            pool_results = search_from_pool(prefs)
+
+        if cached_result:
+            jobs = _newest_first(apply_local_filters(cached_result.get('jobs', []), prefs))
+            source = 'cache'
+            sources_used = cached_result.get('sources', [])
+            yield from _batch(jobs, source)
+        elif pool_results is not None:
+            jobs = _newest_first(pool_results)
+            source = 'pool'
+            yield from _batch(jobs, source)
+        else:
+            for update in search_jobs_multi_stream(prefs, page=page, cache_key=cache_key,
+                                                   normalized_params=normalized):
+                if update[0] == 'jobs':
+                    _, provider, added, removed = update
+                    yield from _batch(apply_local_filters(added, prefs), provider, removed)
+                    continue
+                multi_results = update[1]
+                if multi_results.get('error') and not multi_results.get('jobs'):
+                    # All providers failed — try stale cache as last resort
+                    stale_result, _ = get_stale_cache(cache_key)
+                    if not stale_result:
+                        yield _sse('error', {'error': multi_results['error']})
+                        return
+                    jobs = _newest_first(apply_local_filters(stale_result.get('jobs', []), prefs))
+                    source = 'cache'
+                    warning = multi_results.get('error', '')
+                    yield from _batch(jobs, source)
+                else:
+                    # Filters are per job, so this is exactly the streamed set
+                    jobs = apply_local_filters(multi_results.get('jobs', []), prefs)
+                    source = 'api'
+                    sources_used = multi_results.get('sources', [])
+
+        # Sort by posted date descending (most recent first)
+        _newest_first(jobs)
+        if jobs and page == 1:
+            _save_job_snapshot(user, prefs, primary, jobs, source)
+
+        done = {
+            'total_count': len(jobs),
+            'source': source,
+            'sources': sources_used,
+            'job_ids': [j.get('job_id', '') for j in jobs],
+            'page': page,
+        }
+        if warning:
+            done['warning'] = warning
+        yield _sse('done', done)
+
+    def _guarded():
         try:
-            import hashlib as _snap_hashlib
-            from models import UserJobSnapshot
-            _snap_prefs_hash = _snap_hashlib.sha256(
-                json.dumps(prefs, sort_keys=True).encode()
-            ).hexdigest() if prefs else ''
-            snapshot = UserJobSnapshot.query.filter_by(user_id=user.id).first()
-            if not snapshot:
-                snapshot = UserJobSnapshot(user_id=user.id)
-                db.session.add(snapshot)
-            snapshot.results_json = json.dumps(results.get('jobs', []))
-            snapshot.job_count = len(results.get('jobs', []))
-            snapshot.preferences_hash = _snap_prefs_hash
-            snapshot.resume_id = primary.id if primary else None
-            snapshot.source = results.get('source', '')
-            snapshot.updated_at = datetime.utcnow()
-            db.session.commit()
+            yield from _events()
         except Exception as e:
-            logger.error('Failed to save job snapshot: %s', e)
+            logger.exception('Unhandled error in /jobs/search/stream: %s', e)
             db.session.rollback()
+            yield _sse('error', {'error': f'Search failed: {str(e)}'})
+
+    return Response(stream_with_context(_guarded()), mimetype='text/event-stream',
+                    headers={'X-Accel-Buffering': 'no'})
 
-    return jsonify(results)
+
+@app.route('/jobs/best-matches')
+def jobs_best_matches():
+    """AJAX endpoint — rank every fresh pool job against the primary resume."""
+    if not session.get('user_id'):
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    user = User.query.get(session['user_id'])
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+
+    primary = UserResume.query.filter_by(user_id=user.id, is_primary=True).first()
+    if not primary or not primary.extracted_text or len(primary.extracted_text.strip()) < 50:
+        return jsonify({'error': 'Upload a primary resume to see best matches',
+                        'jobs': [], 'total_count': 0}), 400
+
+    k = max(1, min(request.args.get('k', 20, type=int), 100))
+    try:
+        from job_matrix import get_matrix
+        prefs_obj = JobPreferences.query.filter_by(user_id=user.id).first()
+        prefs = prefs_obj.to_dict() if prefs_obj else {}
+        matrix = get_matrix()
+        ranked, considered = matrix.rank(_get_resume_profile(primary), prefs, k)
+
+        rows = {j.job_id: j for j in JobPool.query.filter(
+            JobPool.job_id.in_([job_id for job_id, _ in ranked])).all()}
+        jobs = []
+        for job_id, score in ranked:
+            if job_id in rows:
+                job = rows[job_id].to_dict()
+                job['match_score'] = round(score * 100)
+                jobs.append(job)
+        _attach_ats_scores(user, primary, jobs)
+    except Exception as e:
+        logger.exception('Unhandled error in /jobs/best-matches: %s', e)
+        db.session.rollback()
+        return jsonify({'error': f'Search failed: {str(e)}', 'jobs': [], 'total_count': 0}), 500
+
+    # 'building': the worker's first matrix build has not finished yet
+    return jsonify({'jobs': jobs, 'total_count': considered, 'source': 'best_match',
+                    'building': not matrix.ready})
 
 
 @app.route('/jobs/deep-analyze', methods=['POST'])
@@ -3132,34 +3447,37 @@ def blog():
 
 
 # ── Resume Editor helper ──
-def _json_resume_to_text(data):
-    """Convert JSON Resume data to plain text for analysis compatibility."""
-    parts = []
+def _json_resume_sections(data):
+    """Split JSON Resume data into plain-text sections (one per entry).
+
+    Joining the non-empty sections with newlines gives _json_resume_to_text().
+    """
+    sections = []
+
+    def _add(*parts):
+        sections.append('\n'.join(filter(None, parts)))
+
     b = data.get('basics', {})
-    if b.get('name'): parts.append(b['name'])
-    if b.get('label'): parts.append(b['label'])
-    if b.get('summary'): parts.append(b['summary'])
+    _add(b.get('name'), b.get('label'), b.get('summary'))
     for w in data.get('work', []):
-        parts.append(f"{w.get('position', '')} at {w.get('name', '')}")
-        if w.get('summary'): parts.append(w['summary'])
-        for h in w.get('highlights', []):
-            parts.append(h)
+        _add(f"{w.get('position', '')} at {w.get('name', '')}", w.get('summary'),
+             *w.get('highlights', []))
     for e in data.get('education', []):
-        parts.append(f"{e.get('studyType', '')} in {e.get('area', '')} from {e.get('institution', '')}")
+        _add(f"{e.get('studyType', '')} in {e.get('area', '')} from {e.get('institution', '')}")
     for s in data.get('skills', []):
         kw = ', '.join(s.get('keywords', []))
         if s.get('name') or kw:
-            parts.append(f"{s.get('name', '')}: {kw}")
+            _add(f"{s.get('name', '')}: {kw}")
     for p in data.get('projects', []):
-        if p.get('name'): parts.append(p['name'])
-        if p.get('description'): parts.append(p['description'])
-        for h in p.get('highlights', []):
-            parts.append(h)
-    for a in data.get('awards', []):
-        if a.get('title'): parts.append(a['title'])
-    for c in data.get('certificates', []):
-        if c.get('name'): parts.append(c['name'])
-    return '\n'.join(filter(None, parts))
+        _add(p.get('name'), p.get('description'), *p.get('highlights', []))
+    _add(*(a.get('title') for a in data.get('awards', [])))
+    _add(*(c.get('name') for c in data.get('certificates', [])))
+    return [s for s in sections if s]
+
+
+def _json_resume_to_text(data):
+    """Convert JSON Resume data to plain text for analysis compatibility."""
+    return '\n'.join(_json_resume_sections(data))
 
 
 @app.route('/resume-studio/editor')
@@ -3226,7 +3544,8 @@ def resume_editor_save():
     resume_id = data.get('resume_id')
 
     # Convert JSON to text for analysis compatibility
-    extracted_text = _json_resume_to_text(resume_json)
+    sections = _json_resume_sections(resume_json)
+    extracted_text = '\n'.join(sections)
     json_str = json.dumps(resume_json)
     file_bytes = json_str.encode('utf-8')
 
@@ -3270,13 +3589,49 @@ def resume_editor_save():
             resume.is_primary = True
 
         db.session.commit()
-        return jsonify({'success': True, 'resume_id': resume.id})
-
     except Exception as e:
         db.session.rollback()
         logger.error('Resume editor save error: %s', e)
         return jsonify({'success': False, 'error': 'Failed to save resume'}), 500
 
+    # Quality score from the per-section cache (only edited sections re-scored)
+    response = {'success': True, 'resume_id': resume.id}
+    try:
+        from analysis_cache import analyze_sections
+        analysis, _ = analyze_sections(sections)
+        response['cv_quality_score'] = analysis['cv_quality_score']
+    except Exception as e:
+        logger.warning('Editor score failed for resume %s: %s', resume.id, e)
+    return jsonify(response)
+
+
+@app.route('/resume-studio/editor/score', methods=['POST'])
+def resume_editor_score():
+    """Live CV quality score for unsaved editor content (re-scores changed sections only)."""
+    if not session.get('user_id'):
+        return jsonify({'success': False, 'error': 'Not authenticated'}), 401
+
+    data = request.get_json(silent=True)
+    if not data or not isinstance(data.get('resume_json'), dict):
+        return jsonify({'success': False, 'error': 'Missing resume data'}), 400
+
+    sections = _json_resume_sections(data['resume_json'])
+    if not sections:
+        return jsonify({'success': True, 'cv_quality_score': 0, 'quality_breakdown': []})
+    try:
+        from analysis_cache import analyze_sections
+        analysis, rescored = analyze_sections(sections)
+    except Exception as e:
+        logger.warning('Editor live score failed: %s', e)
+        return jsonify({'success': False, 'error': 'Scoring failed'}), 500
+    return jsonify({
+        'success': True,
+        'cv_quality_score': analysis['cv_quality_score'],
+        'quality_breakdown': analysis['quality_breakdown'],
+        'sections_total': len(sections),
+        'sections_rescored': rescored,
+    })
+
 
 @app.route('/resume-studio/editor/print/<int:resume_id>')
 def resume_editor_print(resume_id):
@@ -4847,6 +5202,16 @@ def admin_llm_status():
     })
 
 
+@app.route('/admin/provider-health')
+def admin_provider_health():
+    """Show job provider breaker state and latency stats (this worker)."""
+    token = request.args.get('token', '')
+    if token != ADMIN_TOKEN:
+        return jsonify({'error': 'Unauthorized'}), 401
+    import provider_health
+    return jsonify({'pid': os.getpid(), 'providers': provider_health.snapshot()})
+
+
 # ---------------------------------------------------------------------------
 # SEO: sitemap.xml & robots.txt
 # ---------------------------------------------------------------------------
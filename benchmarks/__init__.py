@@ -0,0 +1,12 @@
+"""NLP hot-path benchmarks.
+
+    python -m benchmarks                    # run, compare with baseline.json
+    python -m benchmarks --update-baseline  # run and store a new baseline
+
+Resumes and job descriptions are generated deterministically from the
+skills_data vocabularies (see corpus.py), in size buckets, so runs on the
+same machine are comparable.  Timings are compared after scaling by a
+calibration loop (see __main__.py), which absorbs most of the difference
+between machines; for a tight gate, still regenerate baseline.json on the
+machine that runs the comparison.
+"""
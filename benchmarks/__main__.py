@@ -0,0 +1,288 @@
+"""Time the NLP hot paths and compare with a stored baseline.
+
+Each benchmark runs over every document of a size bucket, `--repeat`
+rounds, with the GC disabled (as timeit does); p50/p95 are per call.
+`best_ms` is the median over documents of each document's fastest call,
+which is what the regression check uses: it is far less sensitive to a
+noisy machine than p50.  Allocations are measured in a separate
+tracemalloc pass (tracing slows everything down, so it never overlaps
+the timed rounds): `peak_kib` is the median per-call peak of traced
+memory.
+
+Machine speed is normalised with a calibration loop: a fixed pure-Python
+workload (regex, string and dict work, like the analyzers) timed between
+the benchmarks.  Its best time is stored as `calibration_ms`, and baseline
+timings are scaled by current / baseline calibration before comparing, so
+a slower or busier machine does not read as a regression.
+
+Exit status is 1 when any best_ms (scaled) or peak_kib is more than
+`--threshold` above the baseline (and, for timings, at least
+`--min-delta-ms` slower, so sub-millisecond jitter does not fail the run).
+A timing over the threshold is re-measured up to `--recheck` times first
+and keeps its fastest result, so one burst of load on a shared machine
+does not fail the run either.
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+
+from benchmarks.corpus import corpus_hash, generate
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def _benchmarks():
+    import nlp_service
+
+    return {
+        'detect_sections': lambda cv, jd: nlp_service.detect_sections(cv),
+        'extract_skills_from_cv': lambda cv, jd: nlp_service.extract_skills_from_cv(cv),
+        'analyze_cv_standalone': lambda cv, jd: nlp_service.analyze_cv_standalone(cv),
+        'quick_ats_score': lambda cv, jd: nlp_service.quick_ats_score(cv, jd),
+    }
+
+
+_CALIBRATION_TEXT = ' '.join(f'Led team {i} to ship service-{i % 37} using Python, SQL and k8s '
+                             f'(+{i % 90}% uptime).' for i in range(400))
+_CALIBRATION_RE = re.compile(r'[a-z0-9+#.-]+')
+
+
+def _calibration_workload():
+    counts = {}
+    for token in _CALIBRATION_RE.findall(_CALIBRATION_TEXT.lower()):
+        counts[token.strip('.')] = counts.get(token.strip('.'), 0) + 1
+    return sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[:50]
+
+
+def _calibrate(rounds=10) -> float:
+    """Fastest time (ms) of the calibration workload over `rounds` calls."""
+    best = None
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter_ns()
+            _calibration_workload()
+            elapsed = time.perf_counter_ns() - start
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        gc.enable()
+    return best / 1e6
+
+
+def _percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _time(fn, docs, repeat):
+    """Call durations (ns) per document."""
+    samples = [[] for _ in docs]
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for i, (cv_text, jd_text) in enumerate(docs):
+                start = time.perf_counter_ns()
+                fn(cv_text, jd_text)
+                samples[i].append(time.perf_counter_ns() - start)
+    finally:
+        gc.enable()
+    return samples
+
+
+def _peaks(fn, docs):
+    peaks = []
+    tracemalloc.start()
+    try:
+        for cv_text, jd_text in docs:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            fn(cv_text, jd_text)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def _best_ms(per_doc) -> float:
+    return round(_percentile([min(d) for d in per_doc], 0.50) / 1e6, 3)
+
+
+def run(sizes=None, per_size: int = 8, repeat: int = 20) -> dict:
+    import nlp_service
+
+    corpus = generate(sizes, per_size)
+    nlp_service.warm_up()
+
+    results = {}
+    calibration = []
+    for name, fn in _benchmarks().items():
+        results[name] = {}
+        for size, docs in corpus.items():
+            calibration.append(_calibrate())   # interleaved, so load drift shows up in it
+            fn(*docs[0])  # first-call costs (regex caches etc.)
+            per_doc = _time(fn, docs, repeat)
+            samples = [ns for doc_samples in per_doc for ns in doc_samples]
+            results[name][size] = {
+                'p50_ms': round(_percentile(samples, 0.50) / 1e6, 3),
+                'p95_ms': round(_percentile(samples, 0.95) / 1e6, 3),
+                'best_ms': _best_ms(per_doc),
+                'peak_kib': round(_percentile(_peaks(fn, docs), 0.50) / 1024, 1),
+            }
+    return {
+        'meta': {
+            'corpus': corpus_hash(corpus),
+            'per_size': per_size,
+            'repeat': repeat,
+            'analysis_version': nlp_service.analysis_version(),
+            'python': platform.python_version(),
+            'machine': f'{platform.system()} {platform.machine()}',
+            'calibration_ms': round(min(calibration), 4),
+        },
+        'results': results,
+    }
+
+
+def speed_scale(current: dict, baseline: dict) -> float:
+    """current / baseline calibration time (1.0 if either lacks one)."""
+    new = current['meta'].get('calibration_ms')
+    old = baseline['meta'].get('calibration_ms')
+    return new / old if new and old else 1.0
+
+
+def _slow(current: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list:
+    """(name, size, expected best_ms) of every timing over the threshold."""
+    scale = speed_scale(current, baseline)
+    slow = []
+    for name, by_size in current['results'].items():
+        for size, stats in by_size.items():
+            old = baseline['results'].get(name, {}).get(size)
+            if not old:
+                continue
+            expected = old['best_ms'] * scale
+            if (stats['best_ms'] > expected * (1 + threshold)
+                    and stats['best_ms'] - expected >= min_delta_ms):
+                slow.append((name, size, expected))
+    return slow
+
+
+def recheck(current: dict, baseline: dict, threshold: float, min_delta_ms: float,
+            rounds: int) -> int:
+    """Re-time the timings over the threshold, keeping each one's fastest
+    best_ms.  Returns how many re-measurements were made."""
+    corpus = generate(list(next(iter(current['results'].values()))), current['meta']['per_size'])
+    benchmarks = _benchmarks()
+    remeasured = 0
+    for _ in range(rounds):
+        slow = _slow(current, baseline, threshold, min_delta_ms)
+        for name, size, _expected in slow:
+            stats = current['results'][name][size]
+            best = _best_ms(_time(benchmarks[name], corpus[size], current['meta']['repeat']))
+            stats['best_ms'] = min(stats['best_ms'], best)
+            remeasured += 1
+        if not slow:
+            break
+    return remeasured
+
+
+def compare(current: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list:
+    """Human-readable regressions of `current` against `baseline`."""
+    regressions = [f'{name}[{size}] best {baseline["results"][name][size]["best_ms"]} -> '
+                   f'{current["results"][name][size]["best_ms"]} ms '
+                   f'(expected {expected:.3f} at this machine speed)'
+                   for name, size, expected in _slow(current, baseline, threshold, min_delta_ms)]
+    for name, by_size in current['results'].items():
+        for size, stats in by_size.items():
+            old = baseline['results'].get(name, {}).get(size)
+            if not old:
+                continue
+            if stats['peak_kib'] > old['peak_kib'] * (1 + threshold):
+                regressions.append(f'{name}[{size}] peak {old["peak_kib"]} -> {stats["peak_kib"]} KiB')
+    return regressions
+
+
+def _print_table(current: dict, baseline: dict = None):
+    scale = speed_scale(current, baseline) if baseline else 1.0
+    print(f'{"benchmark":<24}{"size":<8}{"p50 ms":>10}{"p95 ms":>10}{"best ms":>10}'
+          f'{"peak KiB":>10}{"vs base":>10}')
+    for name, by_size in current['results'].items():
+        for size, stats in by_size.items():
+            old = (baseline or {}).get('results', {}).get(name, {}).get(size)
+            change = (f'{(stats["best_ms"] / (old["best_ms"] * scale) - 1) * 100:+.0f}%'
+                      if old and old['best_ms'] else '')
+            print(f'{name:<24}{size:<8}{stats["p50_ms"]:>10.3f}{stats["p95_ms"]:>10.3f}'
+                  f'{stats["best_ms"]:>10.3f}{stats["peak_kib"]:>10.1f}{change:>10}')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', nargs='+', help='size buckets to run (default: all)')
+    parser.add_argument('--per-size', type=int, default=8, help='documents per size bucket')
+    parser.add_argument('--repeat', type=int, default=20, help='timed rounds over each bucket')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown / growth as a fraction (default 0.25)')
+    parser.add_argument('--min-delta-ms', type=float, default=0.05,
+                        help='ignore slowdowns smaller than this')
+    parser.add_argument('--recheck', type=int, default=3,
+                        help='re-measure timings over the threshold up to this many times')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='write the results to --baseline instead of comparing')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args(argv)
+
+    # Per-call fallback warnings (e.g. RAKE without NLTK data) would swamp the table;
+    # the keyword backend in use is reported as meta.analysis_version instead
+    logging.basicConfig(level=logging.ERROR)
+    current = run(args.sizes, args.per_size, args.repeat)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(current, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(current, f, indent=2)
+            f.write('\n')
+        _print_table(current)
+        print(f'\nBaseline written to {args.baseline}')
+        return 0
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        _print_table(current)
+        print(f'\nNo baseline at {args.baseline}; run with --update-baseline to create one')
+        return 0
+
+    remeasured = recheck(current, baseline, args.threshold, args.min_delta_ms, args.recheck)
+    _print_table(current, baseline)
+    if remeasured:
+        print(f'\n{remeasured} slow timing(s) re-measured; the fastest result is shown')
+    print(f'\nmachine speed vs baseline: x{speed_scale(current, baseline):.2f} '
+          f'(calibration, baseline timings scaled by it)')
+    for key in ('corpus', 'per_size', 'analysis_version', 'python', 'machine'):
+        if baseline['meta'].get(key) != current['meta'][key]:
+            print(f'\nwarning: baseline {key} is {baseline["meta"].get(key)!r}, '
+                  f'this run is {current["meta"][key]!r}; numbers may not be comparable')
+
+    regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f'\n{len(regressions)} regression(s) over {args.threshold:.0%}:')
+        for line in regressions:
+            print(f'  {line}')
+        return 1
+    print('\nNo regressions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Synthetic resume / job-description generator.
+
+Everything is drawn from skills_data (taxonomy role families, skills,
+aliases, levels, cities) and nlp_service's verb lists with a seeded RNG,
+so the same (size, seed) always yields the same text.  Documents include
+what the analyzers look for: section headers, bullets led by strong and
+weak verbs, metrics, year ranges, contact details, skills written as
+aliases and with typos (to exercise the fuzzy matcher).
+"""
+
+import hashlib
+import random
+
+# Target word counts per size bucket
+CV_SIZES = {'small': 250, 'medium': 600, 'large': 1200, 'xlarge': 2500}
+JD_SIZES = {'small': 120, 'medium': 350, 'large': 800, 'xlarge': 1600}
+
+_FIRST_NAMES = ('Aarav', 'Priya', 'Rahul', 'Ananya', 'Vikram', 'Sneha', 'Arjun',
+                'Meera', 'Karan', 'Divya', 'Rohan', 'Isha', 'Jane', 'Alex')
+_LAST_NAMES = ('Sharma', 'Iyer', 'Patel', 'Reddy', 'Gupta', 'Nair', 'Mehta',
+               'Rao', 'Singh', 'Das', 'Doe', 'Kumar')
+_COMPANIES = ('Acme Corp', 'Infosys', 'Flipkart', 'Zoho', 'Freshworks', 'Razorpay',
+              'Swiggy', 'TCS', 'Globex', 'Initech', 'Wipro', 'Paytm', 'Atlassian')
+_DEGREES = ('B.Tech in Computer Science', 'B.E. Electronics', 'MBA, Marketing',
+            'M.Sc. Statistics', 'Bachelor of Commerce', 'M.Tech Data Science')
+_OBJECTS = ('the payments platform', 'internal tooling', 'a customer analytics pipeline',
+            'the onboarding flow', 'release processes', 'the reporting dashboard',
+            'vendor integrations', 'a recommendation service', 'the mobile app',
+            'quarterly planning', 'the search backend', 'data quality checks')
+_METRICS = ('by {n}%', 'for {n}K users', 'saving ${n}K annually', 'across {n} teams',
+            'serving {n}M requests daily', 'covering {n} projects', 'in {n} weeks')
+_FILLER = ('We are a fast-growing team building products used by millions.',
+           'You will work closely with product, design and engineering.',
+           'Our culture values ownership, curiosity and clear communication.',
+           'The role offers competitive pay, health cover and learning budgets.')
+
+
+def _vocab():
+    from nlp_service import STRONG_VERBS, WEAK_VERBS
+    from skills_data import GLOBAL_LEVELS, INDIAN_CITIES, SKILL_ALIASES, SKILL_CATEGORIES, TAXONOMY
+
+    families = [rf for func in TAXONOMY.values() for rf in func['role_families'].values()]
+    return {
+        'families': families,
+        'levels': [lv['label'].split(' / ')[0].split(' (')[0] for lv in GLOBAL_LEVELS],
+        'cities': INDIAN_CITIES,
+        'skills': sorted(set().union(*SKILL_CATEGORIES.values())),
+        'aliases': sorted(SKILL_ALIASES),
+        'strong': sorted(STRONG_VERBS),
+        'weak': sorted(WEAK_VERBS),
+    }
+
+
+def _typo(rng, word):
+    if len(word) < 6 or ' ' in word:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    return word[:i] + word[i + 1:]
+
+
+def _pick_skills(rng, vocab, family, n):
+    skills = list(family['skills'])
+    while len(skills) < n:
+        skills.append(rng.choice(vocab['skills'] + vocab['aliases']))
+    return [_typo(rng, s) if rng.random() < 0.05 else s for s in skills[:n]]
+
+
+def _bullet(rng, vocab, skills):
+    verb = rng.choice(vocab['strong'] if rng.random() < 0.7 else vocab['weak'])
+    text = f'{verb.capitalize()} {rng.choice(_OBJECTS)} using {rng.choice(skills)}'
+    if rng.random() < 0.6:
+        text += ' ' + rng.choice(_METRICS).format(n=rng.randint(2, 95))
+    return rng.choice(('- ', '• ', '* ')) + text
+
+
+def _title(rng, vocab, family):
+    return rng.choice(family['title_patterns']).format(level=rng.choice(vocab['levels']))
+
+
+def generate_cv(size: str = 'medium', seed: int = 0) -> str:
+    """A resume of roughly CV_SIZES[size] words."""
+    rng = random.Random(f'cv:{size}:{seed}')
+    vocab = _vocab()
+    family = rng.choice(vocab['families'])
+    skills = _pick_skills(rng, vocab, family, 14)
+    name = f'{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}'
+    handle = name.lower().replace(' ', '')
+
+    head = [
+        name,
+        f'{handle}@example.com | +91 98{rng.randint(10000000, 99999999)} | '
+        f'linkedin.com/in/{handle} | {rng.choice(vocab["cities"])}',
+        '',
+        'Summary',
+        f'{_title(rng, vocab, family)} with {rng.randint(1, 15)} years of experience in '
+        f'{", ".join(skills[:3])} and {skills[3]}.',
+        '',
+        'Experience',
+    ]
+    tail = [
+        '',
+        'Education',
+        f'{rng.choice(_DEGREES)}, {rng.choice(vocab["cities"])} University ({rng.randint(2005, 2020)})',
+        '',
+        'Skills',
+        ', '.join(skills),
+    ]
+    if rng.random() < 0.7:
+        tail += ['', 'Projects', _bullet(rng, vocab, skills)]
+    if rng.random() < 0.5:
+        tail += ['', 'Certifications', f'{rng.choice(skills).upper()} Certified Professional']
+
+    target = CV_SIZES[size]
+    words = sum(len(line.split()) for line in head + tail)
+    body = []
+    year = 2025
+    while words < target:
+        start = year - rng.randint(1, 4)
+        role = [f'{_title(rng, vocab, family)}, {rng.choice(_COMPANIES)} '
+                f'({start} - {"Present" if year == 2025 else year})']
+        role += [_bullet(rng, vocab, skills) for _ in range(rng.randint(3, 6))]
+        body += role + ['']
+        words += sum(len(line.split()) for line in role)
+        year = start
+    return '\n'.join(head + body + tail)
+
+
+def generate_jd(size: str = 'medium', seed: int = 0) -> str:
+    """A job description of roughly JD_SIZES[size] words."""
+    rng = random.Random(f'jd:{size}:{seed}')
+    vocab = _vocab()
+    family = rng.choice(vocab['families'])
+    skills = _pick_skills(rng, vocab, family, 10)
+
+    lines = [
+        f'{_title(rng, vocab, family)} - {rng.choice(_COMPANIES)}',
+        f'Location: {rng.choice(vocab["cities"])}{" (Hybrid)" if rng.random() < 0.3 else ""}',
+        '',
+        'Requirements',
+        f'- {rng.randint(1, 10)}+ years of experience as a {family["label"].lower()} professional',
+        f'- Strong knowledge of {", ".join(skills[:4])}',
+        "- Bachelor's degree in a relevant field",
+        f'- Experience with {" and ".join(skills[4:6])}',
+        '',
+        'Responsibilities',
+    ]
+    target = JD_SIZES[size]
+    words = sum(len(line.split()) for line in lines)
+    while words < target:
+        line = (rng.choice(_FILLER) if rng.random() < 0.3
+                else f'- {rng.choice(vocab["strong"]).capitalize()} {rng.choice(_OBJECTS)} '
+                     f'with {rng.choice(skills)} and {rng.choice(skills)}')
+        lines.append(line)
+        words += len(line.split())
+    lines += ['', f'Nice to have: {", ".join(skills[6:])}']
+    return '\n'.join(lines)
+
+
+def generate(sizes=None, per_size: int = 8) -> dict:
+    """{size: [(cv_text, jd_text), ...]} for every requested bucket."""
+    sizes = sizes or list(CV_SIZES)
+    return {size: [(generate_cv(size, seed), generate_jd(size, seed)) for seed in range(per_size)]
+            for size in sizes}
+
+
+def corpus_hash(corpus: dict) -> str:
+    """Fingerprint of a generated corpus (baselines are only valid for the same one)."""
+    digest = hashlib.sha256()
+    for size in sorted(corpus):
+        for cv_text, jd_text in corpus[size]:
+            digest.update(cv_text.encode('utf-8'))
+            digest.update(jd_text.encode('utf-8'))
+    return digest.hexdigest()[:16]
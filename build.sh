@@ -2,3 +2,10 @@
 set -o errexit
 
 pip install -r requirements.txt
+
+# Bundle NLTK corpora at build time; the app never downloads them at runtime.
+# Without NLTK_DATA, use ~/nltk_data (on NLTK's default search path, as nixpacks does)
+python -m nltk.downloader -d "${NLTK_DATA:-$HOME/nltk_data}" punkt_tab averaged_perceptron_tagger_eng stopwords
+
+# Compile the taxonomy/skill matchers into taxonomy.pkl (see taxonomy_artifact.py)
+python -m taxonomy_artifact
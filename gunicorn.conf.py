@@ -0,0 +1,40 @@
+"""Gunicorn hooks (picked up automatically from the working directory).
+
+Server flags (workers, threads, bind, timeout) stay in Procfile /
+nixpacks.toml; this file only wires per-worker startup and shutdown.
+"""
+
+import gc
+
+# Load the prebuilt taxonomy artifact in the master so every forked
+# worker shares it copy-on-write; freezing keeps the GC from touching
+# (and so copying) those pages in the workers.
+import taxonomy_artifact
+
+taxonomy_artifact.load()
+gc.freeze()
+
+
+def post_fork(server, worker):
+    # Each web worker gets its own NLP process pool (spawned, not forked)
+    import nlp_pool
+    nlp_pool.start()
+
+    # Some NLP still runs inline in the web worker; warm it before serving
+    import nlp_service
+    timings = nlp_service.warm_up()
+    server.log.info('Worker %s: NLP warm-up took %.0f ms', worker.pid, timings['total'])
+
+
+def worker_exit(server, worker):
+    import job_catalogs
+    job_catalogs.stop()
+
+    import job_matrix
+    job_matrix.stop()
+
+    import nlp_pool
+    nlp_pool.shutdown()
+
+    import provider_transport
+    provider_transport.close()
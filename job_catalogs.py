@@ -0,0 +1,333 @@
+"""Bulk job catalogs (RemoteOK, Remotive) refreshed off the request path.
+
+These providers publish whole catalogs rather than a search API, so a
+search filters a local copy instead of calling them.  A background thread
+per worker keeps the copies fresh:
+
+- `job_catalogs` holds one row per catalog (a zlib-compressed JSON list of
+  normalized jobs), shared by every worker and instance.  A catalog older
+  than its provider's cache_ttl_hours is refreshed by whichever worker
+  first takes its lease (compare-and-set on claimed_at), so each catalog
+  is downloaded once per period, not once per worker.
+- Rows are mirrored to local snapshot files.  The refresher thread loads
+  each changed snapshot and swaps in a new index for it; get() and
+  search() only read the index already built, so a search on the
+  transport loop does no I/O, decoding or indexing and never waits for a
+  download.  A catalog with no snapshot loaded yet is simply empty.
+
+Each loaded snapshot gets an inverted index (CatalogIndex), so a search
+walks the postings of its query words instead of scanning every job.
+"""
+
+import bisect
+import calendar
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import zlib
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+CATALOG_DIR = os.environ.get(
+    'JOB_CATALOG_DIR',
+    os.path.join(tempfile.gettempdir(), 'cv_analyzer_catalogs'),
+)
+CHECK_SECONDS = int(os.environ.get('JOB_CATALOG_CHECK_SECONDS', '60'))
+LEASE_SECONDS = 300          # a failed or crashed refresh is retried after this
+_NEVER = datetime(1970, 1, 1)
+
+
+def _path(name: str) -> str:
+    return os.path.join(CATALOG_DIR, f'{name}.json.z')
+
+
+def _dumps(jobs: list) -> bytes:
+    return zlib.compress(json.dumps(jobs, separators=(',', ':')).encode('utf-8'), 6)
+
+
+def _loads(blob: bytes) -> list:
+    try:
+        return json.loads(zlib.decompress(blob).decode('utf-8')) if blob else []
+    except (zlib.error, ValueError) as e:
+        logger.warning('Job catalog snapshot unreadable: %s', e)
+        return []
+
+
+# ---------------------------------------------------------------------------
+# Inverted index
+# ---------------------------------------------------------------------------
+
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+MIN_QUERY_WORD = 3   # shorter query words are ignored
+
+_TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+
+
+def _tokens(text: str) -> set:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+class CatalogIndex:
+    """Token -> {job position: weight} postings over a catalog's jobs.
+
+    A job's weight for a token is TITLE_WEIGHT if it is in the title plus
+    DESCRIPTION_WEIGHT if it is in the description.  Query words match
+    every indexed token they prefix ("dev" -> "developer", "devops").
+
+    Built only on the refresher thread, when a snapshot is written or
+    loaded; searches read a finished index and never build one.
+    """
+
+    def __init__(self, jobs: list):
+        self.jobs = jobs
+        postings = {}
+        for pos, job in enumerate(jobs):
+            weights = dict.fromkeys(_tokens(job.get('description', '')), DESCRIPTION_WEIGHT)
+            for token in _tokens(job.get('title', '')):
+                weights[token] = weights.get(token, 0) + TITLE_WEIGHT
+            for token, weight in weights.items():
+                postings.setdefault(token, {})[pos] = weight
+        self._postings = postings
+        self._vocab = sorted(postings)
+
+    def _expand(self, word: str) -> list:
+        start = bisect.bisect_left(self._vocab, word)
+        end = bisect.bisect_left(self._vocab, word + '\uffff', start)
+        return self._vocab[start:end]
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """Top jobs by query words matched, then by weight (catalog order on ties).
+
+        Without usable query words, the first `limit` jobs.
+        """
+        words = [w for w in _tokens(query or '') if len(w) >= MIN_QUERY_WORD]
+        if not words:
+            return self.jobs[:limit]
+
+        matched, score = {}, {}
+        for word in words:
+            best = {}
+            for token in self._expand(word):
+                for pos, weight in self._postings[token].items():
+                    if weight > best.get(pos, 0):
+                        best[pos] = weight
+            for pos, weight in best.items():
+                matched[pos] = matched.get(pos, 0) + 1
+                score[pos] = score.get(pos, 0) + weight
+
+        ranked = sorted(matched, key=lambda pos: (-matched[pos], -score[pos], pos))
+        return [self.jobs[pos] for pos in ranked[:limit]]
+
+
+# ---------------------------------------------------------------------------
+# Request path (prebuilt indexes only; no I/O)
+# ---------------------------------------------------------------------------
+
+_EMPTY = CatalogIndex([])
+_lock = threading.Lock()
+_indexes = {}         # name -> CatalogIndex (replaced, never mutated)
+_loaded_mtimes = {}   # name -> mtime of the snapshot behind _indexes[name]
+
+
+def _index(name: str) -> CatalogIndex:
+    with _lock:
+        return _indexes.get(name, _EMPTY)
+
+
+def get(name: str) -> list:
+    """Normalized jobs of a catalog ([] until its snapshot is loaded)."""
+    return _index(name).jobs
+
+
+def search(name: str, query: str, limit: int = 20) -> list:
+    """Best-matching jobs of a catalog for a keyword query (see CatalogIndex)."""
+    return _index(name).search(query, limit)
+
+
+def load_snapshots(names) -> int:
+    """Index every named catalog whose snapshot file changed since it was
+    last loaded (refresher thread).  Returns how many were swapped in."""
+    loaded = 0
+    for name in names:
+        try:
+            mtime = os.path.getmtime(_path(name))
+        except OSError:
+            continue
+        with _lock:
+            if _loaded_mtimes.get(name) == mtime:
+                continue
+        try:
+            with open(_path(name), 'rb') as f:
+                jobs = _loads(f.read())
+        except OSError as e:
+            logger.warning('Job catalog %s unreadable: %s', name, e)
+            continue
+        _install(name, CatalogIndex(jobs), mtime)
+        loaded += 1
+    return loaded
+
+
+def _install(name: str, index: CatalogIndex, mtime):
+    with _lock:
+        _indexes[name] = index
+        _loaded_mtimes[name] = mtime
+
+
+def _write_snapshot(name: str, blob: bytes, jobs: list):
+    """Atomically replace a local snapshot and index its jobs right away,
+    so no search sees the swap before the index is built."""
+    index = CatalogIndex(jobs)
+    os.makedirs(CATALOG_DIR, exist_ok=True)
+    tmp_path = f'{_path(name)}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp_path, _path(name))
+    _install(name, index, os.path.getmtime(_path(name)))
+
+
+# ---------------------------------------------------------------------------
+# Refresh (background thread, needs an app context)
+# ---------------------------------------------------------------------------
+
+def _catalogs():
+    """{name: (provider, params)} for every enabled bulk provider."""
+    from job_providers import get_active_providers
+
+    catalogs = {}
+    for provider in get_active_providers():
+        if provider.bulk_catalog:
+            for name, params in provider.catalogs().items():
+                catalogs[name] = (provider, params)
+    return catalogs
+
+
+def _claim(name: str, max_age: timedelta) -> bool:
+    """Take the refresh lease on a stale catalog; False if fresh or taken."""
+    from sqlalchemy import or_
+    from sqlalchemy.exc import IntegrityError
+    from models import db, JobCatalog
+
+    now = datetime.utcnow()
+    if not JobCatalog.query.filter_by(name=name).first():
+        try:
+            db.session.add(JobCatalog(name=name, data=b'', job_count=0, fetched_at=_NEVER))
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()   # another worker added it first
+    claimed = JobCatalog.query.filter(
+        JobCatalog.name == name,
+        JobCatalog.fetched_at < now - max_age,
+        or_(JobCatalog.claimed_at.is_(None),
+            JobCatalog.claimed_at < now - timedelta(seconds=LEASE_SECONDS)),
+    ).update({'claimed_at': now}, synchronize_session=False)
+    db.session.commit()
+    return bool(claimed)
+
+
+def _refresh(name: str, provider, params) -> bool:
+    import provider_health
+    import provider_transport
+    from models import db, JobCatalog
+
+    data = provider_transport.run(provider_transport.fetch_json(
+        provider.request_spec(params), f'{provider.display_name} catalog fetch',
+        provider_health.get(provider.name)))
+    if data is None:
+        return False   # lease stays; retried once it expires
+    jobs = provider.parse(data, params)
+    blob = _dumps(jobs)
+    JobCatalog.query.filter_by(name=name).update({
+        'data': blob, 'job_count': len(jobs),
+        'fetched_at': datetime.utcnow(), 'claimed_at': None,
+    }, synchronize_session=False)
+    db.session.commit()
+    try:
+        _write_snapshot(name, blob, jobs)
+    except OSError as e:
+        logger.warning('Job catalog %s snapshot write failed: %s', name, e)
+    logger.info('%s: cached %d remote jobs (%s)', provider.display_name, len(jobs), name)
+    return True
+
+
+def refresh_due() -> int:
+    """Refresh every catalog past its TTL whose lease this worker wins.
+
+    Returns the number of catalogs refreshed.
+    """
+    from models import db
+
+    refreshed = 0
+    for name, (provider, params) in _catalogs().items():
+        try:
+            if _claim(name, timedelta(hours=provider.cache_ttl_hours)):
+                refreshed += _refresh(name, provider, params)
+        except Exception as e:
+            logger.warning('Job catalog %s refresh failed: %s', name, e)
+            db.session.rollback()
+    return refreshed
+
+
+def sync_from_db():
+    """Copy catalogs refreshed by other workers to the local snapshots."""
+    from models import JobCatalog
+
+    try:
+        rows = JobCatalog.query.with_entities(JobCatalog.name, JobCatalog.fetched_at).all()
+        for name, fetched_at in rows:
+            try:
+                local_mtime = os.path.getmtime(_path(name))
+            except OSError:
+                local_mtime = None
+            if fetched_at == _NEVER or (local_mtime is not None and
+                                        calendar.timegm(fetched_at.utctimetuple()) <= local_mtime):
+                continue
+            row = JobCatalog.query.filter_by(name=name).first()
+            if row and row.data:
+                _write_snapshot(name, row.data, _loads(row.data))
+    except Exception as e:
+        logger.warning('Job catalog sync failed: %s', e)
+
+
+_thread = None
+_thread_pid = None
+_stop = threading.Event()
+
+
+def start(app):
+    """Start this process's refresher thread (idempotent; restarted after a fork)."""
+    global _thread, _thread_pid
+    if _thread is not None and _thread_pid == os.getpid():
+        return
+
+    def _run():
+        from models import db
+        while not _stop.is_set():
+            try:
+                names = list(_catalogs())
+                # Serve what is already on disk before any (slow) download
+                load_snapshots(names)
+                with app.app_context():
+                    try:
+                        refresh_due()
+                        sync_from_db()
+                    finally:
+                        db.session.remove()
+                load_snapshots(names)
+            except Exception as e:
+                logger.warning('Job catalog refresher pass failed: %s', e)
+            _stop.wait(CHECK_SECONDS)
+
+    _stop.clear()
+    _thread = threading.Thread(target=_run, name='job-catalogs', daemon=True)
+    _thread_pid = os.getpid()
+    _thread.start()
+
+
+def stop():
+    """Stop the refresher after its current pass (worker shutdown)."""
+    _stop.set()
@@ -168,20 +168,25 @@ def build_jsearch_params(prefs: dict) -> dict:
 # 2. Apply local filters (non-API-supported)
 # ---------------------------------------------------------------------------
 
-def apply_local_filters(jobs: List[dict], prefs: dict) -> List[dict]:
+def apply_local_filters(jobs: List[dict], prefs: dict,
+                        jd_features: Optional[dict] = None) -> List[dict]:
     """Apply filters NOT supported by JSearch API on pre-fetched job data.
 
     Args:
         jobs: List of job dicts (from search_jobs or JobPool.to_dict).
         prefs: User preferences dict (from JobPreferences.to_dict).
+        jd_features: Optional {job_id: extract_jd_features() dict}; jobs
+            found here are filtered on the precomputed flags instead of
+            re-scanning their description.
 
     Returns:
         Filtered list of job dicts.
     """
+    jd_features = jd_features or {}
     filtered = []
     rejected = {'work_mode': 0, 'location': 0, 'salary': 0, 'functional_area': 0}
     for job in jobs:
-        if not _passes_work_mode(job, prefs):
+        if not _passes_work_mode(job, prefs, jd_features.get(job.get('job_id'))):
             rejected['work_mode'] += 1
             continue
         if not _passes_location(job, prefs):
@@ -200,7 +205,7 @@ def apply_local_filters(jobs: List[dict], prefs: dict) -> List[dict]:
     return filtered
 
 
-def _passes_work_mode(job: dict, prefs: dict) -> bool:
+def _passes_work_mode(job: dict, prefs: dict, features: Optional[dict] = None) -> bool:
     mode = prefs.get('work_mode', 'any')
     if mode == 'any':
         return True
@@ -209,8 +214,10 @@ def _passes_work_mode(job: dict, prefs: dict) -> bool:
     if mode == 'onsite':
         return not job.get('is_remote', False)
     if mode == 'hybrid':
-        desc = (job.get('description', '') or '').lower()
         title = (job.get('title', '') or '').lower()
+        if features is not None and 'mentions_hybrid' in features:
+            return features['mentions_hybrid'] or 'hybrid' in title
+        desc = (job.get('description', '') or '').lower()
         return 'hybrid' in desc or 'hybrid' in title
     return True
 
@@ -322,21 +329,44 @@ def _passes_functional_areas(job: dict, prefs: dict) -> bool:
 def search_from_pool(prefs: dict, min_results: int = 8, max_age_days: int = 7) -> Optional[List[dict]]:
     """Search the local JobPool table using SQL queries.
 
+    Title and location filters go through the full-text index
+    (job_pool_fts, relevance-ordered) when the database has one, else
+    through LIKE scans.
+
     Returns list of job dicts if enough results found, else None
     (meaning the caller should fall back to API).
     """
+    import job_pool_fts
     from models import db, JobPool
 
     cutoff = datetime.utcnow() - timedelta(days=max_age_days)
     query = JobPool.query.filter(JobPool.fetched_at > cutoff)
 
-    # Apply SQL-level filters for job titles
     titles = prefs.get('job_titles', [])
-    if titles:
-        title_conditions = []
-        for t in titles:
-            title_conditions.append(JobPool.title_lower.contains(t.lower()))
-        query = query.filter(db.or_(*title_conditions))
+    locations = prefs.get('locations', [])
+    loc_variants = []
+    for loc in locations:
+        loc_variants.append(loc)
+        # Add alias variants for broader matching
+        for alias in _CITY_ALIASES.get(loc.lower(), []):
+            if alias != loc.lower():
+                loc_variants.append(alias)
+
+    fts_query = job_pool_fts.apply(query, titles, loc_variants)
+    if fts_query is not None:
+        query = fts_query
+    else:
+        # Apply SQL-level filters for job titles
+        if titles:
+            title_conditions = []
+            for t in titles:
+                title_conditions.append(JobPool.title_lower.contains(t.lower()))
+            query = query.filter(db.or_(*title_conditions))
+
+        # Locations (SQL LIKE on any, with alias expansion)
+        if loc_variants:
+            query = query.filter(db.or_(*[JobPool.location.ilike(f'%{loc}%')
+                                          for loc in loc_variants]))
 
     # Employment types
     emp_types = prefs.get('employment_types', [])
@@ -350,19 +380,7 @@ def search_from_pool(prefs: dict, min_results: int = 8, max_age_days: int = 7) -
     elif work_mode == 'onsite':
         query = query.filter(JobPool.is_remote == False)
 
-    # Locations (SQL LIKE on any, with alias expansion)
-    locations = prefs.get('locations', [])
-    if locations:
-        loc_conditions = []
-        for loc in locations:
-            loc_conditions.append(JobPool.location.ilike(f'%{loc}%'))
-            # Add alias variants for broader matching
-            for alias in _CITY_ALIASES.get(loc.lower(), []):
-                if alias != loc.lower():
-                    loc_conditions.append(JobPool.location.ilike(f'%{alias}%'))
-        query = query.filter(db.or_(*loc_conditions))
-
-    # Order by recency, fetch up to 50
+    # Order by relevance (full-text) then recency, fetch up to 50
     query = query.order_by(JobPool.fetched_at.desc())
     pool_jobs = query.limit(50).all()
 
@@ -373,7 +391,12 @@ def search_from_pool(prefs: dict, min_results: int = 8, max_age_days: int = 7) -
 
     # Convert to dicts and apply remaining local filters
     job_dicts = [j.to_dict() for j in pool_jobs]
-    filtered = apply_local_filters(job_dicts, prefs)
+    jd_features = None
+    if work_mode == 'hybrid':
+        from job_search import lookup_jd_features
+        by_hash = lookup_jd_features(j.desc_hash for j in pool_jobs)
+        jd_features = {j.job_id: by_hash[j.desc_hash] for j in pool_jobs if j.desc_hash in by_hash}
+    filtered = apply_local_filters(job_dicts, prefs, jd_features)
 
     if len(filtered) < min_results:
         logger.info('Job pool: %d after local filters (need %d), falling back to API',
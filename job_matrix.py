@@ -0,0 +1,463 @@
+"""In-memory job feature matrix for "best matches" ranking.
+
+search_from_pool() only hands the ATS scorer the ~50 most recent pool rows
+that match a user's filters.  This module keeps a per-worker matrix of
+every fresh JobPool row so one resume can be ranked against all of them in
+a single vectorized pass:
+
+- skills:    sparse 0/1 matrix over the interned skill IDs (skills_data),
+             from the jd_features cache's skill bitsets
+- text:      hashed log-TF vectors of title + description, L2-normalised;
+             the resume side carries the IDF (SMART lnc.ltc weighting, so
+             rows never need re-weighting as the corpus grows)
+- seniority: 0 (intern) .. 5 (director) from the title, else from the JD's
+             minimum years
+- location:  bitmask over job_filter._CITY_ALIASES keys, plus is_remote
+
+The matrix is rebuilt incrementally: each refresh appends JobPool rows past
+an id watermark and re-reads fetched_at for rows refreshed since the last
+pass; expired rows are masked out and compacted away once they pile up.
+Ids are not committed in order (concurrent ingests on Postgres), so each
+refresh also appends fresh rows in the RESCAN_IDS ids below the watermark
+that are not in the matrix yet.
+Refreshes run only on a background thread per worker (start()), every
+REFRESH_SECONDS and right after a pool ingest (refresh_soon()); requests
+rank on the last matrix built and never compute JD features themselves.
+Ranking is a few sparse mat-vecs plus np.argpartition.
+"""
+
+import logging
+import math
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+
+from skills_data import NUM_SKILLS, skill_bits_from_hex, skill_ids
+
+logger = logging.getLogger(__name__)
+
+REFRESH_SECONDS = int(os.environ.get('JOB_MATRIX_REFRESH_SECONDS', '30'))
+MAX_AGE_DAYS = 7             # same freshness window as search_from_pool
+CHUNK_ROWS = 2000            # pool rows loaded per query
+RESCAN_IDS = 5000            # late-commit window below the id watermark
+TEXT_FEATURES = 2 ** 18      # hashed text dimensions
+TERMS_PER_JOB = 48           # keep only the heaviest text terms per job
+DESC_CHARS = 1500            # description head used for the text vector
+COMPACT_RATIO = 0.25         # compact once this share of rows has expired
+
+# Score weights (sum to 1)
+W_SKILLS = 0.45
+W_TEXT = 0.35
+W_SENIORITY = 0.10
+W_LOCATION = 0.10
+
+# Title → seniority level (checked in order, first hit wins)
+_LEVEL_PATTERNS = [
+    (5, re.compile(r'\b(?:director|head of|vp|vice president|chief|cto|ceo)\b')),
+    (4, re.compile(r'\b(?:lead|principal|staff|architect|manager)\b')),
+    (3, re.compile(r'\b(?:senior|sr\.?|iii)\b')),
+    (0, re.compile(r'\b(?:intern|internship|trainee|apprentice)\b')),
+    (1, re.compile(r'\b(?:junior|jr\.?|associate|entry[- ]level|graduate|fresher)\b')),
+]
+_MID_LEVEL = 2
+
+
+def title_level(title_lower: str, min_years: int = 0) -> int:
+    """Seniority level 0-5 for a job title (JD min years when the title is silent)."""
+    for level, pattern in _LEVEL_PATTERNS:
+        if pattern.search(title_lower):
+            return level
+    if min_years:
+        return years_level(min_years)
+    return _MID_LEVEL
+
+
+def years_level(years: int) -> int:
+    """Seniority level 0-5 for years of experience."""
+    if years < 2:
+        return 1
+    if years < 5:
+        return 2
+    if years < 8:
+        return 3
+    if years < 12:
+        return 4
+    return 5
+
+
+def location_mask(location: str) -> int:
+    """Bitmask of the known cities (job_filter._CITY_ALIASES keys) in a location."""
+    from job_filter import _CITY_ALIASES
+    loc = (location or '').lower()
+    mask = 0
+    for bit, (city, aliases) in enumerate(_CITY_ALIASES.items()):
+        if city in loc or any(a in loc for a in aliases):
+            mask |= 1 << bit
+    return mask
+
+
+def _text_vectorizer():
+    from sklearn.feature_extraction.text import HashingVectorizer
+    from keyword_model import keyword_tokens
+    return HashingVectorizer(
+        n_features=TEXT_FEATURES, tokenizer=keyword_tokens, token_pattern=None,
+        lowercase=False, stop_words='english', alternate_sign=False, norm=None,
+    )
+
+
+def _prune_rows(matrix, keep):
+    """Keep the `keep` largest entries of every CSR row."""
+    import numpy as np
+    from scipy import sparse
+
+    indptr, indices, data = matrix.indptr, matrix.indices, matrix.data
+    out_indptr = [0]
+    out_indices, out_data = [], []
+    for r in range(matrix.shape[0]):
+        lo, hi = indptr[r], indptr[r + 1]
+        if hi - lo > keep:
+            top = lo + np.argpartition(data[lo:hi], -keep)[-keep:]
+            out_indices.append(indices[top])
+            out_data.append(data[top])
+        else:
+            out_indices.append(indices[lo:hi])
+            out_data.append(data[lo:hi])
+        out_indptr.append(out_indptr[-1] + len(out_data[-1]))
+    return sparse.csr_matrix(
+        (np.concatenate(out_data) if out_data else np.zeros(0, np.float32),
+         np.concatenate(out_indices) if out_indices else np.zeros(0, np.int32),
+         np.asarray(out_indptr)),
+        shape=matrix.shape,
+    )
+
+
+class JobMatrix:
+    """Feature matrix over the fresh JobPool rows of this worker process."""
+
+    def __init__(self):
+        import numpy as np
+        from scipy import sparse
+
+        self._build_lock = threading.Lock()   # one refresh at a time
+        self._lock = threading.Lock()         # consistent snapshot for rank()
+        self._vectorizer = _text_vectorizer()
+        self.pool_ids = np.zeros(0, np.int64)
+        self.job_ids = []
+        self.fetched = np.zeros(0, np.float64)
+        self.levels = np.zeros(0, np.int8)
+        self.locations = np.zeros(0, np.int64)
+        self.remote = np.zeros(0, bool)
+        self.skill_counts = np.zeros(0, np.float32)
+        self.skills = sparse.csr_matrix((0, NUM_SKILLS), dtype=np.float32)
+        self.text = sparse.csr_matrix((0, TEXT_FEATURES), dtype=np.float32)
+        self.text_df = np.zeros(TEXT_FEATURES, np.float32)
+        self.last_pool_id = 0
+        self.last_refresh_at = None   # None until the first refresh finishes
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    # -- building ---------------------------------------------------------------
+
+    @property
+    def ready(self) -> bool:
+        """Whether the first refresh has finished."""
+        return self.last_refresh_at is not None
+
+    def refresh(self) -> int:
+        """Fold new and re-fetched pool rows in (refresher thread, needs an
+        app context).  Returns rows appended."""
+        with self._build_lock:
+            started = datetime.utcnow()
+            added = self._refetch_timestamps()
+            added += self._append_late()
+            while True:
+                n = self._append_chunk()
+                added += n
+                if n < CHUNK_ROWS:
+                    break
+            self._compact()
+            self.last_refresh_at = started
+            if added:
+                logger.info('Job matrix: +%d jobs (%d rows)', added, len(self))
+            return added
+
+    def _append_late(self) -> int:
+        """Append fresh rows below the watermark that committed after it moved."""
+        from models import db, JobPool
+
+        low = self.last_pool_id - RESCAN_IDS
+        cutoff = datetime.utcnow() - timedelta(days=MAX_AGE_DAYS)
+        window = {i for (i,) in db.session.query(JobPool.id).filter(
+            JobPool.id > low, JobPool.id <= self.last_pool_id, JobPool.fetched_at > cutoff)}
+        late = window - set(self.pool_ids[self.pool_ids > low].tolist())
+        if not late:
+            return 0
+        return self._append_chunk(JobPool.id.in_(sorted(late)))
+
+    def _append_chunk(self, condition=None) -> int:
+        import numpy as np
+        from scipy import sparse
+        from models import db, JobPool
+        from job_search import get_jd_features, lookup_jd_features
+
+        query = (db.session.query(
+                    JobPool.id, JobPool.job_id, JobPool.title_lower, JobPool.location,
+                    JobPool.is_remote, JobPool.fetched_at, JobPool.description_lower,
+                    JobPool.desc_hash)
+                 .filter(condition if condition is not None else JobPool.id > self.last_pool_id)
+                 .order_by(JobPool.id))
+        rows = query.all() if condition is not None else query.limit(CHUNK_ROWS).all()
+        if not rows:
+            return 0
+
+        features = lookup_jd_features(r.desc_hash for r in rows if r.desc_hash)
+        missing = [r.id for r in rows if r.desc_hash not in features]
+        if missing:
+            # Rows ingested before the jd_features cache existed
+            descs = dict(db.session.query(JobPool.id, JobPool.description)
+                         .filter(JobPool.id.in_(missing)).all())
+            computed = get_jd_features([descs.get(pid) or '' for pid in missing])
+            by_id = dict(zip(missing, computed))
+        else:
+            by_id = {}
+
+        # Skills: one 0/1 row per job over the interned skill IDs
+        sk_indptr, sk_indices = [0], []
+        levels, locations, skill_counts = [], [], []
+        for r in rows:
+            feat = features.get(r.desc_hash) or by_id.get(r.id) or {}
+            cols = skill_ids(skill_bits_from_hex(feat['skill_bits'])) if feat else []
+            sk_indices.extend(cols)
+            sk_indptr.append(len(sk_indices))
+            skill_counts.append(len(cols))
+            levels.append(title_level(r.title_lower or '', feat.get('min_years', 0)))
+            locations.append(location_mask(r.location))
+        skills = sparse.csr_matrix(
+            (np.ones(len(sk_indices), np.float32), np.asarray(sk_indices, np.int32),
+             np.asarray(sk_indptr)),
+            shape=(len(rows), NUM_SKILLS),
+        )
+
+        # Text: log-TF over title (counted twice) + description head, pruned, L2-normalised
+        docs = [f'{r.title_lower or ""} {r.title_lower or ""} {(r.description_lower or "")[:DESC_CHARS]}'
+                for r in rows]
+        tf = self._vectorizer.transform(docs).astype(np.float32)
+        tf.data = np.log1p(tf.data)
+        tf = _prune_rows(tf.tocsr(), TERMS_PER_JOB)
+        norms = np.sqrt(tf.multiply(tf).sum(axis=1)).A1
+        norms[norms == 0] = 1.0
+        tf = sparse.csr_matrix(sparse.diags(1.0 / norms).dot(tf), dtype=np.float32)
+        text_df = self.text_df.copy()
+        np.add.at(text_df, tf.indices, 1)
+
+        new_state = {
+            'skills': sparse.vstack([self.skills, skills], format='csr'),
+            'text': sparse.vstack([self.text, tf], format='csr'),
+            'text_df': text_df,
+            'pool_ids': np.concatenate([self.pool_ids, [r.id for r in rows]]),
+            'job_ids': self.job_ids + [r.job_id for r in rows],
+            'fetched': np.concatenate([self.fetched, [r.fetched_at.timestamp() for r in rows]]),
+            'levels': np.concatenate([self.levels, np.asarray(levels, np.int8)]),
+            'locations': np.concatenate([self.locations, np.asarray(locations, np.int64)]),
+            'remote': np.concatenate([self.remote, [bool(r.is_remote) for r in rows]]),
+            'skill_counts': np.concatenate([self.skill_counts, np.asarray(skill_counts, np.float32)]),
+            'last_pool_id': max(self.last_pool_id, rows[-1].id),
+        }
+        with self._lock:
+            self.__dict__.update(new_state)
+        return len(rows)
+
+    def _refetch_timestamps(self) -> int:
+        """Pick up fetched_at bumps below the watermark.
+
+        Rows still in the matrix get the new timestamp; rows compacted away
+        after expiring (the pool keeps them longer) are appended again.
+        The window starts REFRESH_SECONDS before the last refresh began,
+        since an ingest stamps fetched_at before it commits.  Returns rows
+        appended.
+        """
+        import numpy as np
+        from models import db, JobPool
+
+        if self.last_refresh_at is None:
+            return 0
+        since = self.last_refresh_at - timedelta(seconds=REFRESH_SECONDS)
+        bumped = (db.session.query(JobPool.id, JobPool.fetched_at)
+                  .filter(JobPool.fetched_at >= since,
+                          JobPool.id <= self.last_pool_id)
+                  .all())
+        if not bumped:
+            return 0
+        ids = np.asarray([b.id for b in bumped], np.int64)
+        if len(self):
+            order = np.argsort(self.pool_ids, kind='stable')   # late rows sit out of id order
+            pos = order[np.minimum(np.searchsorted(self.pool_ids, ids, sorter=order),
+                                   len(self.pool_ids) - 1)]
+            hit = self.pool_ids[pos] == ids
+            fetched = self.fetched.copy()
+            fetched[pos[hit]] = [b.fetched_at.timestamp() for b, h in zip(bumped, hit) if h]
+            with self._lock:
+                self.fetched = fetched
+        else:
+            hit = np.zeros(len(ids), bool)
+        gone = ids[~hit]
+        if not len(gone):
+            return 0
+        return self._append_chunk(JobPool.id.in_(sorted(gone.tolist())))
+
+    def _compact(self):
+        """Drop expired rows once they make up COMPACT_RATIO of the matrix."""
+        import numpy as np
+
+        keep = self._fresh_mask()
+        if not len(self) or (~keep).sum() < COMPACT_RATIO * len(self):
+            return
+        text_df = self.text_df.copy()
+        np.subtract.at(text_df, self.text[~keep].indices, 1)
+        new_state = {
+            'skills': self.skills[keep],
+            'text': self.text[keep],
+            'text_df': text_df,
+            'pool_ids': self.pool_ids[keep],
+            'job_ids': [j for j, k in zip(self.job_ids, keep) if k],
+            'fetched': self.fetched[keep],
+            'levels': self.levels[keep],
+            'locations': self.locations[keep],
+            'remote': self.remote[keep],
+            'skill_counts': self.skill_counts[keep],
+        }
+        with self._lock:
+            self.__dict__.update(new_state)
+
+    def _fresh_mask(self):
+        cutoff = (datetime.utcnow() - timedelta(days=MAX_AGE_DAYS)).timestamp()
+        return self.fetched > cutoff
+
+    # -- ranking ------------------------------------------------------------------
+
+    def rank(self, profile, prefs: dict = None, k: int = 20):
+        """Top-k fresh jobs for a ResumeProfile.
+
+        Returns (ranked, considered): ranked is a list of (job_id, score 0-1)
+        best first; considered is the number of fresh rows scored.
+        """
+        import numpy as np
+
+        with self._lock:
+            skills, text = self.skills, self.text
+            job_ids, fetched_mask = self.job_ids, self._fresh_mask()
+            levels, locations, remote = self.levels, self.locations, self.remote
+            skill_counts, text_df = self.skill_counts, self.text_df
+            n = len(job_ids)
+        if not n:
+            return [], 0
+        prefs = prefs or {}
+
+        # Skill coverage: share of each job's skills the resume has
+        resume_skills = np.zeros(NUM_SKILLS, np.float32)
+        resume_skills[skill_ids(profile.skill_bits)] = 1.0
+        coverage = skills.dot(resume_skills) / np.maximum(skill_counts, 1.0)
+
+        # Text cosine: resume log-TF x IDF against the normalised job rows
+        query = self._vectorizer.transform([profile.cv_lower]).astype(np.float32)
+        query.data = np.log1p(query.data)
+        query.data *= np.log((1.0 + n) / (1.0 + text_df[query.indices])) + 1.0
+        qnorm = math.sqrt(float(query.data.dot(query.data))) or 1.0
+        q = np.zeros(text.shape[1], np.float32)
+        q[query.indices] = query.data / qnorm
+        cosine = text.dot(q)
+
+        # Seniority: 1 at the resume's level, 0 three or more levels away
+        if profile.experience_years:
+            gap = np.abs(levels.astype(np.int16) - years_level(profile.experience_years))
+            seniority = np.clip(1.0 - gap / 3.0, 0.0, 1.0)
+        else:
+            seniority = np.full(n, 0.5)
+
+        # Location: preferred city or remote
+        pref_mask = 0
+        for city in prefs.get('locations', []):
+            pref_mask |= location_mask(city)
+        if pref_mask:
+            location = ((locations & pref_mask) != 0) | remote
+        else:
+            location = np.ones(n, bool)
+        work_mode = prefs.get('work_mode', 'any')
+        if work_mode == 'remote':
+            fetched_mask = fetched_mask & remote
+        elif work_mode == 'onsite':
+            fetched_mask = fetched_mask & ~remote
+
+        scores = (W_SKILLS * coverage + W_TEXT * cosine
+                  + W_SENIORITY * seniority + W_LOCATION * location)
+        scores = np.where(fetched_mask, scores, -np.inf)
+        considered = int(fetched_mask.sum())
+        k = min(k, considered)
+        if k <= 0:
+            return [], considered
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(job_ids[i], float(scores[i])) for i in top], considered
+
+
+# ---------------------------------------------------------------------------
+# Per-worker instance
+# ---------------------------------------------------------------------------
+
+_matrix = None
+_matrix_lock = threading.Lock()
+
+
+def get_matrix() -> JobMatrix:
+    """This process's JobMatrix as last built (empty until the refresher's
+    first pass; see JobMatrix.ready).  Never refreshes."""
+    global _matrix
+    with _matrix_lock:
+        if _matrix is None:
+            _matrix = JobMatrix()
+    return _matrix
+
+
+_thread = None
+_thread_pid = None
+_wake = threading.Event()
+_stop = threading.Event()
+
+
+def start(app):
+    """Start this process's refresher thread (idempotent; restarted after a fork)."""
+    global _thread, _thread_pid
+    if _thread is not None and _thread_pid == os.getpid():
+        return
+
+    def _run():
+        from models import db
+        while not _stop.is_set():
+            _wake.clear()
+            with app.app_context():
+                try:
+                    get_matrix().refresh()
+                except Exception as e:
+                    logger.warning('Job matrix refresh failed: %s', e)
+                finally:
+                    db.session.remove()
+            _wake.wait(REFRESH_SECONDS)
+
+    _stop.clear()
+    _thread = threading.Thread(target=_run, name='job-matrix', daemon=True)
+    _thread_pid = os.getpid()
+    _thread.start()
+
+
+def refresh_soon():
+    """Wake the refresher so new pool rows are ranked without waiting a
+    full REFRESH_SECONDS (called after an ingest)."""
+    _wake.set()
+
+
+def stop():
+    """Stop the refresher after its current pass (worker shutdown)."""
+    _stop.set()
+    _wake.set()
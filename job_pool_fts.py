@@ -0,0 +1,190 @@
+"""Full-text index over job_pool (title, description, location).
+
+- PostgreSQL: a weighted ``search_vector`` tsvector column on job_pool
+  (title A, description B, location C) with a GIN index; matches rank by
+  ts_rank.
+- SQLite: an FTS5 table ``job_pool_fts`` keyed by job_pool.id; matches
+  rank by bm25 with the title weighted highest.
+
+Both are written at ingest (index_jobs(), from the pool ingest) and
+backfilled by setup().  Text is split on non-alphanumerics on both sides,
+so "node.js" and "C++" index and query as the same tokens.  Title and
+location words match as phrases whose last word (3+ characters) may be a
+prefix ("data eng" matches "Data Engineering").  Other dialects, or a
+database where setup() failed, get None from backend() and callers keep
+their LIKE queries.
+"""
+
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = 'job_pool_fts'
+MIN_PREFIX = 3   # shorter final words match whole words only
+_WORD_RE = re.compile(r'[^\W_]+')
+
+# Same normalisation in SQL as _words() in Python
+_PG_WORDS = "regexp_replace(coalesce({col}, ''), '[^[:alnum:]]+', ' ', 'g')"
+_PG_VECTOR = ("setweight(to_tsvector('simple', " + _PG_WORDS.format(col='title') + "), 'A') || "
+              "setweight(to_tsvector('simple', " + _PG_WORDS.format(col='description_lower') + "), 'B') || "
+              "setweight(to_tsvector('simple', " + _PG_WORDS.format(col='location') + "), 'C')")
+_SQLITE_BM25 = f'bm25({FTS_TABLE}, 10.0, 1.0, 2.0)'   # title, description, location
+
+_backend = None   # None = not checked yet, '' = unavailable
+
+
+def _words(text: str) -> list:
+    return _WORD_RE.findall((text or '').lower())
+
+
+def backend():
+    """'postgresql' or 'sqlite' if the index exists, else None."""
+    global _backend
+    if _backend is None:
+        from sqlalchemy import inspect
+        from models import db
+
+        _backend = ''
+        try:
+            dialect = db.engine.dialect.name
+            insp = inspect(db.engine)
+            if dialect == 'postgresql':
+                if 'search_vector' in [c['name'] for c in insp.get_columns('job_pool')]:
+                    _backend = dialect
+            elif dialect == 'sqlite':
+                if FTS_TABLE in insp.get_table_names():
+                    _backend = dialect
+        except Exception as e:
+            logger.warning('Job pool full-text check failed: %s', e)
+    return _backend or None
+
+
+def setup():
+    """Create and backfill the index for this dialect (startup migration)."""
+    global _backend
+    from sqlalchemy import inspect, text
+    from models import db
+
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        cols = [c['name'] for c in inspect(db.engine).get_columns('job_pool')]
+        if 'search_vector' not in cols:
+            db.session.execute(text('ALTER TABLE job_pool ADD COLUMN search_vector tsvector'))
+            logger.info('Migration: added search_vector column to job_pool')
+        db.session.execute(text('CREATE INDEX IF NOT EXISTS ix_job_pool_search_vector '
+                                'ON job_pool USING GIN (search_vector)'))
+        filled = db.session.execute(text(
+            f'UPDATE job_pool SET search_vector = {_PG_VECTOR} WHERE search_vector IS NULL')).rowcount
+    elif dialect == 'sqlite':
+        if FTS_TABLE not in inspect(db.engine).get_table_names():
+            db.session.execute(text(
+                f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+                f"title, description_lower, location, tokenize='unicode61')"))
+            logger.info('Migration: created %s table', FTS_TABLE)
+        filled = db.session.execute(text(
+            f'INSERT INTO {FTS_TABLE} (rowid, title, description_lower, location) '
+            f'SELECT id, title, description_lower, location FROM job_pool '
+            f'WHERE id NOT IN (SELECT rowid FROM {FTS_TABLE})')).rowcount
+    else:
+        _backend = ''
+        return
+    db.session.commit()
+    if filled:
+        logger.info('Job pool full-text index: backfilled %d rows', filled)
+    _backend = dialect
+
+
+def index_jobs(ids):
+    """Index job_pool rows by primary key (new rows at ingest).  Caller commits."""
+    from sqlalchemy import bindparam, text
+    from models import db
+
+    ids = list(ids)
+    kind = backend()
+    if not ids or not kind:
+        return
+    if kind == 'postgresql':
+        stmt = text(f'UPDATE job_pool SET search_vector = {_PG_VECTOR} WHERE id IN :ids')
+    else:
+        # Deleted rows' ids can be reused by SQLite; drop their old entries first
+        db.session.execute(text(f'DELETE FROM {FTS_TABLE} WHERE rowid IN :ids')
+                           .bindparams(bindparam('ids', expanding=True)), {'ids': ids})
+        stmt = text(f'INSERT INTO {FTS_TABLE} (rowid, title, description_lower, location) '
+                    f'SELECT id, title, description_lower, location FROM job_pool WHERE id IN :ids')
+    db.session.execute(stmt.bindparams(bindparam('ids', expanding=True)), {'ids': ids})
+
+
+def purge():
+    """Drop index entries of deleted job_pool rows (after the pool cleanup)."""
+    from sqlalchemy import text
+    from models import db
+
+    if backend() != 'sqlite':
+        return 0   # the tsvector lives on the row itself
+    removed = db.session.execute(text(
+        f'DELETE FROM {FTS_TABLE} WHERE rowid NOT IN (SELECT id FROM job_pool)')).rowcount
+    db.session.commit()
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def _prefix(words) -> bool:
+    return len(words[-1]) >= MIN_PREFIX   # "c" (from "C++") must not match "cloud"
+
+
+def _pg_phrase(words, weight):
+    last = len(words) - 1
+    return ' <-> '.join(f'{w}:{"*" if i == last and _prefix(words) else ""}{weight}'
+                        for i, w in enumerate(words))
+
+
+def _sqlite_phrase(words, column):
+    return f'{column} : "{" ".join(words)}"' + (' *' if _prefix(words) else '')
+
+
+def apply(query, titles, locations):
+    """Restrict a JobPool query to rows matching any title phrase and any
+    location phrase, ordered by relevance to the titles.
+
+    Returns None when the index is unavailable or no phrase has a word
+    (the caller then filters with LIKE instead).
+    """
+    from sqlalchemy import Float, Integer, func, literal_column, text
+    from models import JobPool
+
+    kind = backend()
+    title_words = [w for w in (_words(t) for t in titles) if w]
+    loc_words = [w for w in (_words(loc) for loc in locations) if w]
+    if not kind or (titles and not title_words) or (locations and not loc_words):
+        return None
+    if not title_words and not loc_words:
+        return query
+
+    if kind == 'postgresql':
+        groups = [' | '.join(f'({_pg_phrase(w, weight)})' for w in group)
+                  for group, weight in ((title_words, 'A'), (loc_words, 'C')) if group]
+        vector = literal_column('job_pool.search_vector')
+        tsquery = func.to_tsquery('simple', ' & '.join(f'({g})' for g in groups))
+        query = query.filter(vector.op('@@')(tsquery))
+        if title_words:
+            rank_words = sorted({w for words in title_words for w in words})
+            rank_query = func.to_tsquery('simple', ' | '.join(
+                f'{w}:*' if len(w) >= MIN_PREFIX else w for w in rank_words))
+            query = query.order_by(func.ts_rank(vector, rank_query).desc())
+        return query
+
+    groups = [' OR '.join(f'({_sqlite_phrase(w, column)})' for w in group)
+              for group, column in ((title_words, 'title'), (loc_words, 'location')) if group]
+    matches = (text(f'SELECT rowid AS id, {_SQLITE_BM25} AS rank FROM {FTS_TABLE} '
+                    f'WHERE {FTS_TABLE} MATCH :fts_match')
+               .bindparams(fts_match=' AND '.join(f'({g})' for g in groups))
+               .columns(id=Integer, rank=Float)
+               .subquery())
+    query = query.join(matches, JobPool.id == matches.c.id)
+    if title_words:
+        query = query.order_by(matches.c.rank)   # bm25: lower is better
+    return query
@@ -4,6 +4,15 @@ Each provider implements a common interface that normalizes API responses
 to the canonical job dict format used throughout the application.
 
 Providers auto-register based on environment variable configuration.
+
+A provider call is split in two: request_spec() describes the HTTP request
+and parse() normalizes the decoded response.  The request itself runs on
+the shared pooled transport (provider_transport), so fetch_async() can be
+awaited for many providers at once.  Every call is recorded in
+provider_health, which sets its timeout and may trip the provider's
+circuit breaker.  Bulk-catalog providers (RemoteOK, Remotive) are
+downloaded in the background by job_catalogs; their fetch_async() only
+searches the local snapshot's index.
 """
 
 import json
@@ -13,7 +22,9 @@ import re
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 
-import requests as http_requests
+import job_catalogs
+import provider_health
+import provider_transport
 
 logger = logging.getLogger(__name__)
 
@@ -169,6 +180,7 @@ class JobProvider(ABC):
     display_name: str = ''
     monthly_quota: int = 0        # 0 = unlimited
     cache_ttl_hours: int = 24
+    bulk_catalog: bool = False    # searches filter job_catalogs snapshots, no request-time HTTP
 
     @abstractmethod
     def is_configured(self) -> bool:
@@ -179,8 +191,34 @@ class JobProvider(ABC):
         """Convert user prefs to provider-specific API parameters."""
 
     @abstractmethod
-    def fetch(self, params: dict, page: int = 1) -> list:
+    def request_spec(self, params: dict, page: int = 1):
+        """Return the request spec (see provider_transport.fetch_json) for a
+        page of results, or None if there is nothing to fetch."""
+
+    @abstractmethod
+    def parse(self, data, params: dict, page: int = 1) -> list:
+        """Convert a decoded API response to a list of normalized job dicts."""
+
+    async def fetch_async(self, params: dict, page: int = 1) -> list:
         """Call the API and return a list of normalized job dicts."""
+        spec = self.request_spec(params, page)
+        if spec is None:
+            return []
+        data = await provider_transport.fetch_json(spec, self.display_name,
+                                                   provider_health.get(self.name))
+        if not data:
+            return []
+        jobs = self.parse(data, params, page)
+        logger.info('%s: fetched %d jobs (page %d)', self.display_name, len(jobs), page)
+        return jobs
+
+    def fetch(self, params: dict, page: int = 1) -> list:
+        """Blocking fetch_async() for callers outside the transport loop."""
+        return provider_transport.run(self.fetch_async(params, page))
+
+    def catalogs(self) -> dict:
+        """{catalog name: params} kept fresh by job_catalogs (bulk_catalog providers)."""
+        return {}
 
     def get_quota_limit(self):
         """Return the monthly quota limit for this provider."""
@@ -204,7 +242,7 @@ class JSearchProvider(JobProvider):
         from job_filter import build_jsearch_params
         return build_jsearch_params(prefs)
 
-    def fetch(self, params, page=1):
+    def request_spec(self, params, page=1):
         api_key = os.environ.get('RAPIDAPI_KEY', '')
         host = 'jsearch.p.rapidapi.com'
 
@@ -226,27 +264,16 @@ class JSearchProvider(JobProvider):
         if params.get('remote_jobs_only'):
             api_params['remote_jobs_only'] = 'true'
 
-        data = None
-        for attempt in range(2):
-            try:
-                resp = http_requests.get(
-                    f'https://{host}/search',
-                    headers=headers,
-                    params=api_params,
-                    timeout=25,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                break
-            except http_requests.exceptions.Timeout:
-                logger.warning('JSearch timeout (attempt %d/2)', attempt + 1)
-            except Exception as e:
-                logger.error('JSearch error: %s', e)
-                return []
-
-        if not data:
-            return []
+        # Retry once on timeout (JSearch can be slow on first call)
+        return {
+            'url': f'https://{host}/search',
+            'headers': headers,
+            'params': api_params,
+            'timeout': 25,
+            'retries': 1,
+        }
 
+    def parse(self, data, params, page=1):
         jobs = []
         for item in data.get('data', []):
             raw_emp_type = item.get('job_employment_type', '')
@@ -280,8 +307,6 @@ class JSearchProvider(JobProvider):
                 'salary_period': item.get('job_salary_period', ''),
                 'source': 'jsearch',
             })
-
-        logger.info('JSearch: fetched %d jobs (page %d)', len(jobs), page)
         return jobs
 
 
@@ -321,7 +346,7 @@ class AdzunaProvider(JobProvider):
             'salary_max': prefs.get('salary_max', ''),
         }
 
-    def fetch(self, params, page=1):
+    def request_spec(self, params, page=1):
         app_id = os.environ.get('ADZUNA_APP_ID', '')
         app_key = os.environ.get('ADZUNA_APP_KEY', '')
 
@@ -337,18 +362,13 @@ class AdzunaProvider(JobProvider):
             api_params['content-type'] = 'application/json'
             api_params['contract_time'] = params['contract_time']
 
-        try:
-            resp = http_requests.get(
-                f'https://api.adzuna.com/v1/api/jobs/in/search/{page}',
-                params=api_params,
-                timeout=20,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception as e:
-            logger.error('Adzuna error: %s', e)
-            return []
+        return {
+            'url': f'https://api.adzuna.com/v1/api/jobs/in/search/{page}',
+            'params': api_params,
+            'timeout': 20,
+        }
 
+    def parse(self, data, params, page=1):
         jobs = []
         for item in data.get('results', []):
             desc = (item.get('description', '') or '')[:3000]
@@ -375,8 +395,6 @@ class AdzunaProvider(JobProvider):
                 'salary_period': 'year',
                 'source': 'adzuna',
             })
-
-        logger.info('Adzuna: fetched %d jobs (page %d)', len(jobs), page)
         return jobs
 
 
@@ -400,7 +418,7 @@ class JoobleProvider(JobProvider):
             location = f'{location}, India'
         return {'keywords': query, 'location': location}
 
-    def fetch(self, params, page=1):
+    def request_spec(self, params, page=1):
         api_key = os.environ.get('JOOBLE_API_KEY', '')
 
         body = {
@@ -409,18 +427,14 @@ class JoobleProvider(JobProvider):
             'page': str(page),
         }
 
-        try:
-            resp = http_requests.post(
-                f'https://jooble.org/api/{api_key}',
-                json=body,
-                timeout=20,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception as e:
-            logger.error('Jooble error: %s', e)
-            return []
+        return {
+            'method': 'POST',
+            'url': f'https://jooble.org/api/{api_key}',
+            'json': body,
+            'timeout': 20,
+        }
 
+    def parse(self, data, params, page=1):
         jobs = []
         for item in data.get('jobs', []):
             snippet = (item.get('snippet', '') or '')
@@ -451,8 +465,6 @@ class JoobleProvider(JobProvider):
                 'salary_period': 'year',
                 'source': 'jooble',
             })
-
-        logger.info('Jooble: fetched %d jobs (page %d)', len(jobs), page)
         return jobs
 
     @staticmethod
@@ -471,19 +483,15 @@ class JoobleProvider(JobProvider):
 
 
 # ---------------------------------------------------------------------------
-# RemoteOK Provider (bulk catalog, cache in-memory)
+# RemoteOK Provider (bulk catalog, refreshed in the background by job_catalogs)
 # ---------------------------------------------------------------------------
 
-# In-memory catalog cache for bulk APIs
-_REMOTE_CATALOG_CACHE = {}
-REMOTE_CACHE_TTL_SECONDS = 6 * 3600  # 6 hours
-
-
 class RemoteOKProvider(JobProvider):
     name = 'remoteok'
     display_name = 'RemoteOK'
     monthly_quota = 0
     cache_ttl_hours = 6
+    bulk_catalog = True
 
     def is_configured(self):
         return os.environ.get('REMOTEOK_ENABLED', '1') != '0'
@@ -491,52 +499,25 @@ class RemoteOKProvider(JobProvider):
     def build_params(self, prefs):
         return {'query': _build_search_query(prefs)}
 
-    def fetch(self, params, page=1):
+    def catalogs(self):
+        return {'remoteok': {}}
+
+    async def fetch_async(self, params, page=1):
         # Only fetch on page 1 (RemoteOK returns all jobs at once)
         if page > 1:
             return []
 
-        all_jobs = self._get_catalog()
-        if not all_jobs:
-            return []
-
-        # Filter by user query keywords
-        query = (params.get('query', '') or '').lower()
-        query_words = [w for w in query.split() if len(w) > 2]
-
-        if not query_words:
-            return all_jobs[:20]
+        # Best matches for the user's query keywords
+        return job_catalogs.search('remoteok', params.get('query', ''))
 
-        # Score jobs by keyword relevance
-        scored = []
-        for job in all_jobs:
-            text = (job.get('title', '') + ' ' + job.get('description', '')).lower()
-            score = sum(1 for w in query_words if w in text)
-            if score > 0:
-                scored.append((score, job))
-
-        scored.sort(key=lambda x: -x[0])
-        return [job for _, job in scored[:20]]
-
-    def _get_catalog(self):
-        """Get cached RemoteOK catalog or fetch fresh."""
-        cached = _REMOTE_CATALOG_CACHE.get('remoteok')
-        now = datetime.utcnow()
-        if cached and (now - cached['fetched_at']).total_seconds() < REMOTE_CACHE_TTL_SECONDS:
-            return cached['jobs']
-
-        try:
-            resp = http_requests.get(
-                'https://remoteok.com/api',
-                headers={'User-Agent': 'LevelUpX/1.0'},
-                timeout=20,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception as e:
-            logger.error('RemoteOK catalog fetch error: %s', e)
-            return cached['jobs'] if cached else []
+    def request_spec(self, params, page=1):
+        return {
+            'url': 'https://remoteok.com/api',
+            'headers': {'User-Agent': 'LevelUpX/1.0'},
+            'timeout': 20,
+        }
 
+    def parse(self, data, params, page=1):
         jobs = []
         for item in data:
             # First element is legal notice, skip non-job items
@@ -566,17 +547,11 @@ class RemoteOKProvider(JobProvider):
                 'salary_period': 'year',
                 'source': 'remoteok',
             })
-
-        _REMOTE_CATALOG_CACHE['remoteok'] = {
-            'jobs': jobs,
-            'fetched_at': now,
-        }
-        logger.info('RemoteOK: cached %d remote jobs', len(jobs))
         return jobs
 
 
 # ---------------------------------------------------------------------------
-# Remotive Provider (bulk catalog, cache in-memory)
+# Remotive Provider (bulk catalog, refreshed in the background by job_catalogs)
 # ---------------------------------------------------------------------------
 
 class RemotiveProvider(JobProvider):
@@ -584,6 +559,7 @@ class RemotiveProvider(JobProvider):
     display_name = 'Remotive'
     monthly_quota = 0
     cache_ttl_hours = 6
+    bulk_catalog = True
 
     # Remotive category mapping
     _CATEGORY_MAP = {
@@ -623,57 +599,32 @@ class RemotiveProvider(JobProvider):
                 break
         return {'search': query, 'category': category}
 
-    def fetch(self, params, page=1):
-        if page > 1:
-            return []
+    def catalogs(self):
+        # The whole board plus one catalog per mapped category
+        return {f'remotive_{category}': {'category': category}
+                for category in sorted({''} | set(self._CATEGORY_MAP.values()))}
 
-        all_jobs = self._get_catalog(params)
-        if not all_jobs:
+    async def fetch_async(self, params, page=1):
+        if page > 1:
             return []
 
-        # Filter by search query
-        query = (params.get('search', '') or '').lower()
-        query_words = [w for w in query.split() if len(w) > 2]
-
-        if not query_words:
-            return all_jobs[:20]
-
-        scored = []
-        for job in all_jobs:
-            text = (job.get('title', '') + ' ' + job.get('description', '')).lower()
-            score = sum(1 for w in query_words if w in text)
-            if score > 0:
-                scored.append((score, job))
-
-        scored.sort(key=lambda x: -x[0])
-        return [job for _, job in scored[:20]]
+        # Best matches for the search query
+        return job_catalogs.search(f'remotive_{params.get("category", "")}',
+                                   params.get('search', ''))
 
-    def _get_catalog(self, params):
-        """Get cached Remotive catalog or fetch fresh."""
-        cache_key = f'remotive_{params.get("category", "")}'
-        cached = _REMOTE_CATALOG_CACHE.get(cache_key)
-        now = datetime.utcnow()
-        if cached and (now - cached['fetched_at']).total_seconds() < REMOTE_CACHE_TTL_SECONDS:
-            return cached['jobs']
-
-        api_params = {'limit': 100}
+    def request_spec(self, params, page=1):
+        api_params = {}
         if params.get('category'):
             api_params['category'] = params['category']
         if params.get('search'):
             api_params['search'] = params['search']
+        return {
+            'url': 'https://remotive.com/api/remote-jobs',
+            'params': api_params,
+            'timeout': 20,
+        }
 
-        try:
-            resp = http_requests.get(
-                'https://remotive.com/api/remote-jobs',
-                params=api_params,
-                timeout=20,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception as e:
-            logger.error('Remotive catalog fetch error: %s', e)
-            return cached['jobs'] if cached else []
-
+    def parse(self, data, params, page=1):
         jobs = []
         for item in data.get('jobs', []):
             desc_html = item.get('description', '')
@@ -702,13 +653,6 @@ class RemotiveProvider(JobProvider):
                 'salary_period': 'year',
                 'source': 'remotive',
             })
-
-        _REMOTE_CATALOG_CACHE[cache_key] = {
-            'jobs': jobs,
-            'fetched_at': now,
-        }
-        logger.info('Remotive: cached %d remote jobs (category=%s)',
-                     len(jobs), params.get('category', 'all'))
         return jobs
 
     @staticmethod
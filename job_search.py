@@ -13,6 +13,7 @@ import hashlib
 import json
 import logging
 import os
+import threading
 from datetime import datetime, timedelta
 
 import requests as http_requests
@@ -24,6 +25,12 @@ JSEARCH_HOST = 'jsearch.p.rapidapi.com'
 CACHE_TTL_HOURS = 24
 MONTHLY_QUOTA = int(os.environ.get('JSEARCH_MONTHLY_QUOTA', '200'))
 
+# Multi-provider search: hard limit per search, and the deadline-mode
+# latency budget / "enough results" threshold (see search_jobs_multi)
+PROVIDER_TIMEOUT_SECONDS = 30
+SEARCH_DEADLINE_SECONDS = float(os.environ.get('SEARCH_DEADLINE_SECONDS', '6'))
+SEARCH_ENOUGH_JOBS = int(os.environ.get('SEARCH_ENOUGH_JOBS', '20'))
+
 
 # ---------------------------------------------------------------------------
 # Quota helpers
@@ -351,104 +358,18 @@ def _format_date(date_str):
 # Multi-source search orchestrator
 # ---------------------------------------------------------------------------
 
-def search_jobs_multi(prefs, page=1, force_refresh=False,
-                      cache_key=None, normalized_params=None):
-    """Search multiple job API providers in parallel and merge results.
-
-    Args:
-        prefs: User preferences dict (from JobPreferences.to_dict())
-        page: Page number for pagination
-        force_refresh: Skip cache if True
-        cache_key: Pre-computed cache key
-        normalized_params: Normalized API params dict
-
-    Returns:
-        dict with 'jobs', 'total_count', 'sources', optional 'error'
-    """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    from job_providers import get_active_providers, PROVIDER_PRIORITY
-
-    providers = get_active_providers()
-    if not providers:
-        return {'jobs': [], 'total_count': 0, 'error': 'No job providers configured.'}
-
-    # Check cache first (skip if force refresh)
-    if cache_key and not force_refresh:
-        cached_result, _ = get_cached_search(cache_key)
-        if cached_result:
-            logger.info('Multi-source cache hit for hash=%s', cache_key[:8])
-            return cached_result
-
-    # Check quota per provider (main thread — DB access)
-    eligible = []
-    for p in providers:
-        if p.monthly_quota == 0:
-            eligible.append(p)  # Unlimited
-        else:
-            under, calls, limit = check_quota(p.name, p.monthly_quota)
-            if under:
-                eligible.append(p)
-            else:
-                logger.info('Provider %s over quota (%d/%d), skipping', p.name, calls, limit)
-
-    if not eligible:
-        # All providers exhausted — caller should try pool/stale cache
-        return {'jobs': [], 'total_count': 0, 'sources': [],
-                'error': 'All job providers have reached their quota limits.'}
-
-    # Build params for each provider (main thread)
-    provider_params = {}
-    for p in eligible:
-        try:
-            provider_params[p.name] = p.build_params(prefs)
-        except Exception as e:
-            logger.warning('Provider %s build_params failed: %s', p.name, e)
-
-    # Fetch from all providers in parallel (worker threads — HTTP only, no DB)
-    all_jobs = []
-    sources_used = []
-
-    def _fetch_one(provider):
-        try:
-            params = provider_params.get(provider.name, {})
-            jobs = provider.fetch(params, page=page)
-            return provider.name, jobs
-        except Exception as e:
-            logger.warning('Provider %s fetch failed: %s', provider.name, e)
-            return provider.name, []
-
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {
-            executor.submit(_fetch_one, p): p.name
-            for p in eligible
-            if p.name in provider_params
-        }
-        for future in as_completed(futures, timeout=30):
-            try:
-                name, jobs = future.result(timeout=25)
-                if jobs:
-                    all_jobs.extend(jobs)
-                    sources_used.append(name)
-                    logger.info('Provider %s returned %d jobs', name, len(jobs))
-            except Exception as e:
-                name = futures[future]
-                logger.warning('Provider %s timed out or failed: %s', name, e)
-
-    # Increment quota for providers that succeeded (main thread — DB access)
-    for name in sources_used:
-        provider = next((p for p in eligible if p.name == name), None)
-        if provider and provider.monthly_quota > 0:
-            increment_quota(name)
+def _dedupe_jobs(jobs):
+    """Provider-priority order, deduplicated by job_id then (title, company)."""
+    from job_providers import PROVIDER_PRIORITY
 
-    # Deduplicate: primary by job_id, secondary by (title, company)
     seen_ids = set()
     seen_titles = set()
     deduped = []
 
     # Sort by provider priority (lower = higher priority)
-    all_jobs.sort(key=lambda j: PROVIDER_PRIORITY.get(j.get('source', ''), 99))
+    jobs = sorted(jobs, key=lambda j: PROVIDER_PRIORITY.get(j.get('source', ''), 99))
 
-    for job in all_jobs:
+    for job in jobs:
         jid = job.get('job_id', '')
         if jid and jid in seen_ids:
             continue
@@ -462,7 +383,101 @@ def search_jobs_multi(prefs, page=1, force_refresh=False,
         if title_key[0] and title_key[1]:
             seen_titles.add(title_key)
         deduped.append(job)
+    return deduped
+
+
+def _collect_provider_results(results):
+    """({name: jobs or exception}) -> (all jobs, names of providers with jobs)."""
+    all_jobs = []
+    sources_used = []
+    for name, jobs in results.items():
+        if isinstance(jobs, BaseException):
+            logger.warning('Provider %s timed out or failed: %s', name, jobs)
+        elif jobs:
+            all_jobs.extend(jobs)
+            sources_used.append(name)
+            logger.info('Provider %s returned %d jobs', name, len(jobs))
+    return all_jobs, sources_used
+
+
+def _increment_provider_quotas(eligible, sources_used):
+    for name in sources_used:
+        provider = next((p for p in eligible if p.name == name), None)
+        if provider and provider.monthly_quota > 0:
+            increment_quota(name)
+
+
+def _complete_search_in_background(late, eligible, early_jobs, early_sources,
+                                   cache_key, normalized_params, page):
+    """When the late providers finish, fold their jobs into the cache entry
+    and the pool (in a background thread with its own app context)."""
+    from flask import current_app
+
+    app = current_app._get_current_object()
+
+    def _run(future):
+        try:
+            late_jobs, late_sources = _collect_provider_results(future.result())
+        except Exception as e:
+            logger.warning('Background provider completion failed: %s', e)
+            return
+        if not late_jobs:
+            return
+        with app.app_context():
+            _increment_provider_quotas(eligible, late_sources)
+            merged = _dedupe_jobs(early_jobs + late_jobs)
+            if cache_key:
+                store_search_cache(cache_key, normalized_params or {}, {
+                    'jobs': merged,
+                    'total_count': len(merged),
+                    'sources': sorted(set(early_sources + late_sources)),
+                }, page=page, source='multi')
+            _store_jobs_in_pool(late_jobs, (normalized_params or {}).get('query', ''))
+            logger.info('Late providers %s added %d jobs in the background',
+                        sorted(late_sources), len(late_jobs))
+
+    # Done-callbacks run on the transport loop; keep DB work off it
+    late.add_done_callback(lambda future: threading.Thread(
+        target=_run, args=(future,), daemon=True).start())
+
+
+_NO_PROVIDERS_ERROR = 'All job providers are over their quota limits or temporarily unavailable.'
+
+
+def _eligible_providers(providers):
+    """Providers under their monthly quota whose circuit breaker admits a
+    call (main thread — DB access)."""
+    import provider_health
 
+    eligible = []
+    for p in providers:
+        if p.monthly_quota:
+            under, calls, limit = check_quota(p.name, p.monthly_quota)
+            if not under:
+                logger.info('Provider %s over quota (%d/%d), skipping', p.name, calls, limit)
+                continue
+        if not p.bulk_catalog and not provider_health.get(p.name).allow():
+            logger.info('Provider %s circuit open, skipping', p.name)
+            continue
+        eligible.append(p)
+    return eligible
+
+
+def _provider_fetches(eligible, prefs, page):
+    """{name: fetch_async() coroutine}; params are built on the calling thread."""
+    fetches = {}
+    for p in eligible:
+        try:
+            params = p.build_params(prefs)
+        except Exception as e:
+            logger.warning('Provider %s build_params failed: %s', p.name, e)
+            continue
+        fetches[p.name] = p.fetch_async(params, page=page)
+    return fetches
+
+
+def _store_multi_result(deduped, sources_used, cache_key, normalized_params, page):
+    """Build the merged result, cache it and stock the pool with its jobs."""
     result = {
         'jobs': deduped,
         'total_count': len(deduped),
@@ -483,62 +498,433 @@ def search_jobs_multi(prefs, page=1, force_refresh=False,
     return result
 
 
+def search_jobs_multi(prefs, page=1, force_refresh=False,
+                      cache_key=None, normalized_params=None,
+                      deadline=None, enough=SEARCH_ENOUGH_JOBS):
+    """Search multiple job API providers in parallel and merge results.
+
+    Args:
+        prefs: User preferences dict (from JobPreferences.to_dict())
+        page: Page number for pagination
+        force_refresh: Skip cache if True
+        cache_key: Pre-computed cache key
+        normalized_params: Normalized API params dict
+        deadline: Latency budget in seconds (None waits for every provider).
+            Returns as soon as `enough` merged jobs pass apply_local_filters,
+            or when the budget runs out with some jobs in hand; slower
+            providers finish in the background and their jobs are added to
+            the cache entry and the pool for the next request.
+        enough: Deadline mode's early-return threshold
+
+    Returns:
+        dict with 'jobs', 'total_count', 'sources', optional 'error' and,
+        in deadline mode, 'pending_sources' (providers still running)
+    """
+    import provider_transport
+    from job_providers import get_active_providers
+
+    providers = get_active_providers()
+    if not providers:
+        return {'jobs': [], 'total_count': 0, 'error': 'No job providers configured.'}
+
+    # Check cache first (skip if force refresh)
+    if cache_key and not force_refresh:
+        cached_result, _ = get_cached_search(cache_key)
+        if cached_result:
+            logger.info('Multi-source cache hit for hash=%s', cache_key[:8])
+            return cached_result
+
+    eligible = _eligible_providers(providers)
+    if not eligible:
+        # All providers exhausted — caller should try pool/stale cache
+        return {'jobs': [], 'total_count': 0, 'sources': [], 'error': _NO_PROVIDERS_ERROR}
+
+    # Fetch from all providers concurrently on the shared transport loop
+    # (HTTP only, no DB; pooled keep-alive connections)
+    fetches = _provider_fetches(eligible, prefs, page)
+    late = None
+    if deadline is None:
+        results = provider_transport.gather(fetches, timeout=PROVIDER_TIMEOUT_SECONDS)
+    else:
+        from job_filter import apply_local_filters
+
+        def _ready(partial):
+            jobs = [job for r in partial.values() if isinstance(r, list) for job in r]
+            return len(apply_local_filters(_dedupe_jobs(jobs), prefs)) >= enough
+
+        results, late = provider_transport.gather_early(
+            fetches, timeout=PROVIDER_TIMEOUT_SECONDS, deadline=deadline, ready=_ready)
+    all_jobs, sources_used = _collect_provider_results(results)
+
+    # Increment quota for providers that succeeded (main thread — DB access)
+    _increment_provider_quotas(eligible, sources_used)
+
+    # Deduplicate: primary by job_id, secondary by (title, company)
+    deduped = _dedupe_jobs(all_jobs)
+
+    result = _store_multi_result(deduped, sources_used, cache_key, normalized_params, page)
+
+    # Registered only now so the late merge always lands after the writes above
+    if late is not None:
+        result = dict(result, pending_sources=sorted(set(fetches) - set(results)))
+        logger.info('Deadline search: %s still running in the background',
+                    result['pending_sources'])
+        _complete_search_in_background(late, eligible, deduped, sources_used,
+                                       cache_key, normalized_params, page)
+    return result
+
+
+class IncrementalDeduper:
+    """_dedupe_jobs() over a growing job list, reported as changes.
+
+    add(jobs) returns (added, removed_ids): the jobs that joined the
+    deduplicated set, and the job_ids of earlier jobs that left it because
+    a higher-priority provider returned the same job.  jobs() always equals
+    _dedupe_jobs() of everything added so far.
+    """
+
+    def __init__(self):
+        self._all = []
+        self._kept = []
+
+    def add(self, jobs):
+        previous = self._kept
+        self._all.extend(jobs)
+        self._kept = _dedupe_jobs(self._all)
+        before = {id(job) for job in previous}
+        after = {id(job) for job in self._kept}
+        added = [job for job in self._kept if id(job) not in before]
+        removed = [job.get('job_id', '') for job in previous if id(job) not in after]
+        return added, removed
+
+    def jobs(self):
+        return list(self._kept)
+
+
+def search_jobs_multi_stream(prefs, page=1, cache_key=None, normalized_params=None):
+    """search_jobs_multi() as a generator of per-provider updates.
+
+    Yields ('jobs', provider, added, removed_ids) as each provider answers
+    (see IncrementalDeduper), then ('done', result) with the dict
+    search_jobs_multi() would return; quota, cache and pool are updated
+    before 'done'.  Does not read the cache — callers check it first.
+    """
+    import provider_transport
+    from job_providers import get_active_providers
+
+    providers = get_active_providers()
+    if not providers:
+        yield 'done', {'jobs': [], 'total_count': 0, 'error': 'No job providers configured.'}
+        return
+    eligible = _eligible_providers(providers)
+    if not eligible:
+        yield 'done', {'jobs': [], 'total_count': 0, 'sources': [], 'error': _NO_PROVIDERS_ERROR}
+        return
+
+    deduper = IncrementalDeduper()
+    sources_used = []
+    for name, jobs in provider_transport.as_completed(
+            _provider_fetches(eligible, prefs, page), timeout=PROVIDER_TIMEOUT_SECONDS):
+        batch, names = _collect_provider_results({name: jobs})
+        if not batch:
+            continue
+        sources_used.extend(names)
+        added, removed = deduper.add(batch)
+        yield 'jobs', name, added, removed
+
+    _increment_provider_quotas(eligible, sources_used)
+    yield 'done', _store_multi_result(deduper.jobs(), sources_used,
+                                      cache_key, normalized_params, page)
+
+
 # ---------------------------------------------------------------------------
 # Job pool storage
 # ---------------------------------------------------------------------------
 
+_ingest_executor = None
+_ingest_pid = None
+_ingest_lock = threading.Lock()
+_INGEST_CHUNK = 200   # rows per INSERT (keeps bind parameters well under SQLite's limit)
+
+
 def _store_jobs_in_pool(jobs, query):
-    """Upsert individual jobs into the local JobPool for future local search.
+    """Queue jobs for the local JobPool (future local search).
 
-    Called after every successful API fetch. Jobs that already exist
-    get their fetched_at timestamp refreshed; new jobs are inserted.
+    Called after every successful API fetch.  The write happens off the
+    request thread: ingests run one at a time on a per-process background
+    thread with their own app context (see _ingest_jobs).
     """
-    from models import db, JobPool
+    global _ingest_executor, _ingest_pid
+    from concurrent.futures import ThreadPoolExecutor
+    from flask import current_app
 
     if not jobs:
         return
+    app = current_app._get_current_object()
+    jobs = list(jobs)
+
+    def _run():
+        with app.app_context():
+            try:
+                _ingest_jobs(jobs, query)
+            except Exception as e:
+                logger.error('Job pool ingest failed: %s', e)
+
+    with _ingest_lock:
+        if _ingest_executor is None or _ingest_pid != os.getpid():
+            _ingest_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pool-ingest')
+            _ingest_pid = os.getpid()
+        _ingest_executor.submit(_run)
+
 
-    stored = 0
+def _ingest_jobs(jobs, query):
+    """Bulk upsert jobs into the JobPool.
+
+    One IN query finds the jobs already pooled, one UPDATE refreshes their
+    fetched_at, and the rest go in with multi-row INSERT ... ON CONFLICT
+    DO NOTHING (so a concurrent ingest of the same job is harmless).  The
+    inserted rows are full-text indexed before the one commit.
+    """
+    from sqlalchemy import bindparam
+    from models import db, JobPool
+    from nlp_service import jd_text_hash
+
+    by_id = {}
     for job in jobs:
-        try:
-            existing = JobPool.query.filter_by(job_id=job['job_id']).first()
-            if existing:
-                existing.fetched_at = datetime.utcnow()
+        if job.get('job_id'):
+            by_id.setdefault(job['job_id'], job)
+    if not by_id:
+        return
+
+    now = datetime.utcnow()
+    hashes = {job_id: jd_text_hash(job.get('description', '') or '')
+              for job_id, job in by_id.items()}
+    source_query = query[:500] if query else ''
+    new_ids = []
+    try:
+        existing = dict(db.session.query(JobPool.job_id, JobPool.desc_hash)
+                        .filter(JobPool.job_id.in_(list(by_id))).all())
+        if existing:
+            JobPool.query.filter(JobPool.job_id.in_(list(existing))) \
+                .update({'fetched_at': now}, synchronize_session=False)
+            changed = [{'b_job_id': job_id, 'b_desc_hash': hashes[job_id]}
+                       for job_id, desc_hash in existing.items() if desc_hash != hashes[job_id]]
+            if changed:
+                table = JobPool.__table__
+                db.session.execute(table.update()
+                                   .where(table.c.job_id == bindparam('b_job_id'))
+                                   .values(desc_hash=bindparam('b_desc_hash')), changed)
+
+        rows = []
+        for job_id, job in by_id.items():
+            if job_id in existing:
                 continue
+            rows.append({
+                'job_id': job_id,
+                'title': job.get('title', ''),
+                'company': job.get('company', ''),
+                'company_logo': job.get('company_logo', ''),
+                'location': job.get('location', ''),
+                'description': job.get('description', ''),
+                'description_snippet': job.get('description_snippet', ''),
+                'employment_type': job.get('employment_type_raw', ''),
+                'employment_type_display': job.get('employment_type', ''),
+                'posted_date_raw': job.get('posted_date_raw', ''),
+                'posted_date_display': job.get('posted_date', ''),
+                'apply_url': job.get('apply_url', ''),
+                'is_remote': job.get('is_remote', False),
+                'salary_min': job.get('salary_min'),
+                'salary_max': job.get('salary_max'),
+                'salary_currency': job.get('salary_currency', ''),
+                'salary_period': job.get('salary_period', ''),
+                'fetched_at': now,
+                'source': job.get('source', 'jsearch'),
+                'source_query': source_query,
+                'title_lower': (job.get('title', '') or '').lower(),
+                'company_lower': (job.get('company', '') or '').lower(),
+                'description_lower': ((job.get('description', '') or '')[:3000]).lower(),
+                'desc_hash': hashes[job_id],
+            })
+        inserted = []
+        for i in range(0, len(rows), _INGEST_CHUNK):
+            inserted += _insert_ignore(JobPool, rows[i:i + _INGEST_CHUNK], return_ids=True)
+        # Index in the same transaction: rows are never committed unindexed
+        if inserted:
+            import job_pool_fts
+            job_pool_fts.index_jobs(inserted)
+        db.session.commit()
+        new_ids = inserted
+        if new_ids:
+            logger.info('Job pool: stored %d new jobs from query "%s"', len(new_ids), query[:50])
+    except Exception as e:
+        logger.error('Failed to store jobs in pool: %s', e)
+        db.session.rollback()
 
-            pool_entry = JobPool(
-                job_id=job['job_id'],
-                title=job.get('title', ''),
-                company=job.get('company', ''),
-                company_logo=job.get('company_logo', ''),
-                location=job.get('location', ''),
-                description=job.get('description', ''),
-                description_snippet=job.get('description_snippet', ''),
-                employment_type=job.get('employment_type_raw', ''),
-                employment_type_display=job.get('employment_type', ''),
-                posted_date_raw=job.get('posted_date_raw', ''),
-                posted_date_display=job.get('posted_date', ''),
-                apply_url=job.get('apply_url', ''),
-                is_remote=job.get('is_remote', False),
-                salary_min=job.get('salary_min'),
-                salary_max=job.get('salary_max'),
-                salary_currency=job.get('salary_currency', ''),
-                salary_period=job.get('salary_period', ''),
-                source=job.get('source', 'jsearch'),
-                source_query=query[:500] if query else '',
-                title_lower=(job.get('title', '') or '').lower(),
-                company_lower=(job.get('company', '') or '').lower(),
-                description_lower=((job.get('description', '') or '')[:3000]).lower(),
-            )
-            db.session.add(pool_entry)
-            stored += 1
-        except Exception:
+    # Parse descriptions once at ingest so searches only read features
+    try:
+        get_jd_features([job.get('description', '') or '' for job in jobs])
+    except Exception as e:
+        logger.warning('JD feature precompute failed: %s', e)
+
+    # Fold the new descriptions into the corpus keyword model (throttled)
+    import keyword_model
+    keyword_model.note_ingest(len(new_ids))
+
+    # Let this worker's best-match matrix pick the new rows up right away
+    import job_matrix
+    job_matrix.refresh_soon()
+
+
+# ---------------------------------------------------------------------------
+# JD feature cache
+# ---------------------------------------------------------------------------
+
+def _insert_ignore(model, rows, return_ids=False):
+    """Bulk INSERT rows, skipping any that hit a unique constraint.
+
+    Uses ON CONFLICT DO NOTHING on PostgreSQL and SQLite; other dialects
+    fall back to per-row inserts inside savepoints.  Caller commits.
+    With return_ids, returns the ids of the rows actually inserted (via
+    RETURNING, so skipped rows are not counted); otherwise [].
+    """
+    from models import db
+
+    if not rows:
+        return []
+    dialect = db.engine.dialect.name
+    if dialect in ('postgresql', 'sqlite'):
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(model.__table__).values(rows).on_conflict_do_nothing()
+        if not return_ids:
+            db.session.execute(stmt)
+            return []
+        return [row_id for (row_id,) in db.session.execute(stmt.returning(model.__table__.c.id))]
+    from sqlalchemy.exc import IntegrityError
+    ids = []
+    for row in rows:
+        try:
+            with db.session.begin_nested():
+                obj = model(**row)
+                db.session.add(obj)
+                db.session.flush()
+            ids.append(obj.id)
+        except IntegrityError:
+            pass
+    return ids if return_ids else []
+
+
+def lookup_jd_features(hashes):
+    """Return {desc_hash: features} for current-version cached JD features."""
+    from models import JDFeatures
+    from nlp_service import JD_FEATURES_VERSION
+
+    hashes = {h for h in hashes if h}
+    if not hashes:
+        return {}
+    try:
+        rows = JDFeatures.query.filter(
+            JDFeatures.desc_hash.in_(hashes),
+            JDFeatures.version == JD_FEATURES_VERSION,
+        ).all()
+    except Exception as e:
+        logger.warning('JD feature lookup failed: %s', e)
+        return {}
+    found = {}
+    for row in rows:
+        try:
+            found[row.desc_hash] = json.loads(row.features_json)
+        except (json.JSONDecodeError, TypeError):
             continue
+    return found
 
+
+def get_jd_features(descriptions):
+    """Return extract_jd_features() for each description, in order.
+
+    Cached features are read in one query; misses are computed and
+    written back so every later request (from any user) skips parsing.
+    """
+    import nlp_pool
+    from models import db, JDFeatures
+    from nlp_service import JD_FEATURES_VERSION, extract_jd_features_many, jd_text_hash
+
+    hashes = [jd_text_hash(d) for d in descriptions]
+    found = lookup_jd_features(hashes)
+
+    missing = {}
+    for desc_hash, desc in zip(hashes, descriptions):
+        if desc_hash not in found and desc_hash not in missing:
+            missing[desc_hash] = desc
+    computed = {}
+    if missing:
+        computed = dict(zip(missing, nlp_pool.submit(
+            extract_jd_features_many, list(missing.values()), timeout=30)))
+    if computed:
+        try:
+            # Drop rows from an older feature version so the insert can replace them
+            JDFeatures.query.filter(
+                JDFeatures.desc_hash.in_(list(computed)),
+                JDFeatures.version != JD_FEATURES_VERSION,
+            ).delete(synchronize_session=False)
+            _insert_ignore(JDFeatures, [
+                {'desc_hash': h, 'version': JD_FEATURES_VERSION,
+                 'features_json': json.dumps(f), 'created_at': datetime.utcnow()}
+                for h, f in computed.items()
+            ])
+            db.session.commit()
+        except Exception as e:
+            logger.warning('Failed to store JD features: %s', e)
+            db.session.rollback()
+        found.update(computed)
+
+    return [found[h] for h in hashes]
+
+
+# ---------------------------------------------------------------------------
+# Quick ATS score cache
+# ---------------------------------------------------------------------------
+
+def get_cached_quick_ats(resume_id, job_ids):
+    """Return {job_id: QuickATSCache} for the given jobs in a single query."""
+    from models import QuickATSCache
+
+    job_ids = {j for j in job_ids if j}
+    if not job_ids:
+        return {}
+    try:
+        rows = QuickATSCache.query.filter(
+            QuickATSCache.resume_id == resume_id,
+            QuickATSCache.job_id.in_(job_ids),
+        ).all()
+    except Exception as e:
+        logger.warning('Quick ATS cache lookup failed: %s', e)
+        return {}
+    return {row.job_id: row for row in rows}
+
+
+def store_quick_ats_scores(resume_id, scores):
+    """Bulk-save {job_id: quick ATS result} in one insert-or-ignore.
+
+    Rows already cached (e.g. by a concurrent request) are left untouched
+    thanks to uq_quick_ats_resume_job.
+    """
+    from models import db, QuickATSCache
+
+    if not scores:
+        return
+    now = datetime.utcnow()
     try:
+        _insert_ignore(QuickATSCache, [
+            {'resume_id': resume_id, 'job_id': job_id, 'score': ats['score'],
+             'matched_skills': json.dumps(ats['matched_skills'][:5]),
+             'missing_skills': json.dumps(ats['missing_skills'][:5]),
+             'created_at': now}
+            for job_id, ats in scores.items()
+        ])
         db.session.commit()
-        if stored:
-            logger.info('Job pool: stored %d new jobs from query "%s"', stored, query[:50])
     except Exception as e:
-        logger.error('Failed to store jobs in pool: %s', e)
+        logger.warning('Failed to store quick ATS scores: %s', e)
         db.session.rollback()
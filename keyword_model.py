@@ -0,0 +1,337 @@
+"""Corpus keyword model — document frequencies over JobPool descriptions.
+
+Gives nlp_service corpus statistics for keyword work:
+- extract_keywords() ranks CV phrases by TF-IDF instead of plain RAKE
+- quick ATS keyword overlap weights JD phrases by IDF, so rare, specific
+  phrases count more than boilerplate ones
+
+Storage:
+- The model is a compact zlib-compressed JSON blob in `corpus_keyword_models`
+  (shared across instances), mirrored to a local artifact file so NLP pool
+  processes (which have no DB session) can load it too.
+- refresh_from_pool() folds JobPool rows newer than the model's watermark
+  into the counts, so the model grows incrementally and never needs a full
+  refit.  Ids are not committed in order (concurrent ingests on
+  Postgres), so each refresh also re-checks the RESCAN_IDS ids below the
+  watermark and counts rows that committed late; the ids counted in that
+  window are kept in the model so none is counted twice.  Rows later
+  deleted by the pool cleanup stay counted — IDF only needs rough corpus
+  proportions.
+- Ingests call note_ingest(), which runs the refresh at most once per
+  REFRESH_SECONDS or once REFRESH_ROWS new rows have piled up, since each
+  refresh rewrites the whole blob.
+"""
+
+import calendar
+import json
+import logging
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = 'jobpool_idf'
+MODEL_VERSION = 1
+MIN_DOCS = int(os.environ.get('KEYWORD_MODEL_MIN_DOCS', '100'))   # below this, callers fall back
+MAX_TERMS = 200_000                                               # prune lowest-df terms past this
+ARTIFACT_PATH = os.environ.get(
+    'KEYWORD_MODEL_PATH',
+    os.path.join(tempfile.gettempdir(), 'cv_analyzer_keyword_model.bin'),
+)
+_RELOAD_CHECK_SECONDS = 60
+RESCAN_IDS = 5000                                                 # late-commit window below the watermark
+REFRESH_SECONDS = int(os.environ.get('KEYWORD_MODEL_REFRESH_SECONDS', '600'))
+REFRESH_ROWS = int(os.environ.get('KEYWORD_MODEL_REFRESH_ROWS', '2000'))
+
+_PUNCT = '.,;:!?()[]{}"\'`|/\\<>*•–—'
+_ALNUM_RE = re.compile(r'[a-z0-9]')
+
+
+def keyword_tokens(text_lower: str) -> list:
+    """Whitespace tokens with surrounding punctuation stripped (empties dropped)."""
+    tokens = []
+    for raw in text_lower.split():
+        tok = raw.strip(_PUNCT)
+        if tok and _ALNUM_RE.search(tok):
+            tokens.append(tok)
+    return tokens
+
+
+def keyword_chunks(text_lower: str) -> list:
+    """keyword_tokens() split into runs that do not cross punctuation.
+
+    "python, sql and aws." -> [['python'], ['sql', 'and', 'aws']]
+    """
+    chunks, current = [], []
+    for raw in text_lower.split():
+        tok = raw.strip(_PUNCT)
+        if tok and _ALNUM_RE.search(tok):
+            if current and raw[0] in _PUNCT:
+                chunks.append(current)
+                current = []
+            current.append(tok)
+        if raw[-1] in _PUNCT and current:
+            chunks.append(current)
+            current = []
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def normalize_phrase(phrase: str) -> str:
+    """Canonical vocabulary key for a raw phrase (e.g. a JD bigram)."""
+    return ' '.join(keyword_tokens(phrase.lower()))
+
+
+def _document_terms(text_lower: str) -> set:
+    """Distinct unigrams and bigrams of one document."""
+    tokens = keyword_tokens(text_lower)
+    terms = set(tokens)
+    terms.update(a + ' ' + b for a, b in zip(tokens, tokens[1:]))
+    return terms
+
+
+class KeywordModel:
+    """Document frequencies for unigrams and bigrams, plus a JobPool watermark.
+
+    recent_ids are the ids in the RESCAN_IDS window below last_job_id that
+    are already counted (None for models saved before it was tracked).
+    """
+
+    def __init__(self, df=None, doc_count=0, last_job_id=0, recent_ids=None):
+        self.df = df or {}
+        self.doc_count = doc_count
+        self.last_job_id = last_job_id
+        self.recent_ids = recent_ids
+
+    # -- statistics ----------------------------------------------------------
+
+    def idf(self, term: str) -> float:
+        """Smoothed IDF (same form as scikit-learn's TfidfTransformer)."""
+        return math.log((1 + self.doc_count) / (1 + self.df.get(term, 0))) + 1
+
+    def phrase_idf(self, phrase: str) -> float:
+        return self.idf(normalize_phrase(phrase))
+
+    # -- updates ---------------------------------------------------------------
+
+    def update(self, texts) -> int:
+        """Add documents (lowercased text) to the counts; returns how many."""
+        texts = [t for t in texts if t]
+        if not texts:
+            return 0
+        try:
+            from sklearn.feature_extraction.text import CountVectorizer
+            vectorizer = CountVectorizer(
+                tokenizer=keyword_tokens, token_pattern=None, lowercase=False,
+                ngram_range=(1, 2), binary=True,
+            )
+            matrix = vectorizer.fit_transform(texts)
+            counts = matrix.sum(axis=0).A1
+            for term, idx in vectorizer.vocabulary_.items():
+                self.df[term] = self.df.get(term, 0) + int(counts[idx])
+        except ImportError:
+            for text in texts:
+                for term in _document_terms(text):
+                    self.df[term] = self.df.get(term, 0) + 1
+        except ValueError:
+            pass  # every document was empty after tokenization
+        self.doc_count += len(texts)
+        if len(self.df) > MAX_TERMS:
+            keep = sorted(self.df.items(), key=lambda kv: kv[1], reverse=True)[:MAX_TERMS]
+            self.df = dict(keep)
+        return len(texts)
+
+    # -- (de)serialisation -----------------------------------------------------
+
+    def dumps(self) -> bytes:
+        payload = {
+            'version': MODEL_VERSION,
+            'doc_count': self.doc_count,
+            'last_job_id': self.last_job_id,
+            'recent_ids': self.recent_ids,
+            'df': self.df,
+        }
+        return zlib.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'), 6)
+
+    @classmethod
+    def loads(cls, blob: bytes):
+        """Decode a blob from dumps(); returns None if unreadable or outdated."""
+        try:
+            payload = json.loads(zlib.decompress(blob).decode('utf-8'))
+        except (zlib.error, ValueError, TypeError):
+            return None
+        if payload.get('version') != MODEL_VERSION:
+            return None
+        return cls(payload.get('df', {}), payload.get('doc_count', 0),
+                   payload.get('last_job_id', 0), payload.get('recent_ids'))
+
+
+# ---------------------------------------------------------------------------
+# Per-process access (reads the local artifact file; works in pool processes)
+# ---------------------------------------------------------------------------
+
+_model = None
+_model_mtime = None
+_last_check = 0.0
+_lock = threading.Lock()
+
+
+def get_model():
+    """Return the current KeywordModel, or None if absent or too small.
+
+    Re-reads the artifact file at most once a minute when it has changed.
+    """
+    global _model, _model_mtime, _last_check
+    now = time.monotonic()
+    if now - _last_check >= _RELOAD_CHECK_SECONDS or _last_check == 0.0:
+        with _lock:
+            _last_check = now
+            try:
+                mtime = os.path.getmtime(ARTIFACT_PATH)
+            except OSError:
+                mtime = None
+            if mtime != _model_mtime:
+                _model_mtime = mtime
+                _model = None
+                if mtime is not None:
+                    try:
+                        with open(ARTIFACT_PATH, 'rb') as f:
+                            _model = KeywordModel.loads(f.read())
+                    except OSError as e:
+                        logger.warning('Keyword model artifact unreadable: %s', e)
+    model = _model
+    if model is None or model.doc_count < MIN_DOCS:
+        return None
+    return model
+
+
+def _write_artifact(blob: bytes):
+    """Atomically replace the local artifact and make this process use it."""
+    global _last_check
+    tmp_path = f'{ARTIFACT_PATH}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp_path, ARTIFACT_PATH)
+    _last_check = 0.0  # force a reload on next get_model()
+
+
+# ---------------------------------------------------------------------------
+# DB persistence (needs an app context)
+# ---------------------------------------------------------------------------
+
+def sync_from_db():
+    """Copy the shared DB model to the local artifact if it is newer."""
+    from models import CorpusKeywordModel
+
+    try:
+        row = CorpusKeywordModel.query.filter_by(name=MODEL_NAME).first()
+    except Exception as e:
+        logger.warning('Keyword model sync failed: %s', e)
+        return
+    if row is None or not row.data:
+        return
+    try:
+        local_mtime = os.path.getmtime(ARTIFACT_PATH)
+    except OSError:
+        local_mtime = None
+    if local_mtime is None or calendar.timegm(row.updated_at.utctimetuple()) > local_mtime:
+        try:
+            _write_artifact(row.data)
+        except OSError as e:
+            logger.warning('Keyword model artifact write failed: %s', e)
+
+
+_pending_rows = 0
+_last_refresh = 0.0
+_pending_lock = threading.Lock()
+
+
+def note_ingest(new_rows: int) -> int:
+    """Count rows just added to the pool and refresh the model if due
+    (REFRESH_ROWS pending or REFRESH_SECONDS since the last refresh).
+    Returns the number of documents added."""
+    global _pending_rows, _last_refresh
+    with _pending_lock:
+        _pending_rows += new_rows
+        if not _pending_rows or (_pending_rows < REFRESH_ROWS and
+                                 time.monotonic() - _last_refresh < REFRESH_SECONDS):
+            return 0
+        _pending_rows = 0
+        _last_refresh = time.monotonic()
+    return refresh_from_pool()
+
+
+def refresh_from_pool(max_rows=5000):
+    """Fold uncounted JobPool rows (past the watermark, or late commits in
+    the RESCAN_IDS window below it) into the shared model.
+
+    Uses a compare-and-set on doc_count and last_job_id so concurrent
+    workers never count the same rows twice.  Returns the number of
+    documents added.
+    """
+    from models import db, JobPool, CorpusKeywordModel
+
+    try:
+        row = CorpusKeywordModel.query.filter_by(name=MODEL_NAME).first()
+        model = KeywordModel.loads(row.data) if row and row.data else None
+        if model is None:
+            model = KeywordModel(recent_ids=[])
+        start_id, start_count = model.last_job_id, model.doc_count
+
+        window = [i for (i,) in db.session.query(JobPool.id).filter(
+            JobPool.id > start_id - RESCAN_IDS, JobPool.id <= start_id)]
+        if model.recent_ids is None:
+            model.recent_ids = window   # older model: take the window as counted
+        late_ids = sorted(set(window) - set(model.recent_ids))
+        late_rows = (db.session.query(JobPool.id, JobPool.description_lower)
+                     .filter(JobPool.id.in_(late_ids)).all()) if late_ids else []
+        new_rows = (db.session.query(JobPool.id, JobPool.description_lower)
+                    .filter(JobPool.id > start_id)
+                    .order_by(JobPool.id)
+                    .limit(max_rows)
+                    .all())
+        if not new_rows and not late_rows:
+            return 0
+        added = model.update([r.description_lower or '' for r in late_rows + new_rows])
+        if new_rows:
+            model.last_job_id = new_rows[-1].id
+        counted = model.recent_ids + [r.id for r in late_rows + new_rows]
+        model.recent_ids = sorted(i for i in counted if i > model.last_job_id - RESCAN_IDS)
+        blob = model.dumps()
+        now = datetime.utcnow()
+
+        if row is None:
+            db.session.add(CorpusKeywordModel(
+                name=MODEL_NAME, data=blob, doc_count=model.doc_count,
+                last_job_id=model.last_job_id, updated_at=now,
+            ))
+        else:
+            updated = CorpusKeywordModel.query.filter_by(
+                name=MODEL_NAME, last_job_id=start_id, doc_count=start_count,
+            ).update({
+                'data': blob, 'doc_count': model.doc_count,
+                'last_job_id': model.last_job_id, 'updated_at': now,
+            }, synchronize_session=False)
+            if not updated:
+                db.session.rollback()
+                return 0  # another worker refreshed first
+        db.session.commit()
+    except Exception as e:
+        logger.warning('Keyword model refresh failed: %s', e)
+        db.session.rollback()
+        return 0
+
+    try:
+        _write_artifact(blob)
+    except OSError as e:
+        logger.warning('Keyword model artifact write failed: %s', e)
+    logger.info('Keyword model: +%d docs (%d total, %d terms)',
+                added, model.doc_count, len(model.df))
+    return added
@@ -1162,16 +1162,18 @@ Requirements:
 - NEVER use markdown formatting (no **, no ##, no *). All text must be plain text only."""
 
 
-def analyze_cv_only(cv_text: str) -> dict:
+def analyze_cv_only(cv_text: str, nlp_results: dict = None) -> dict:
     """Tier 1: CV-only analysis. NLP-heavy, minimal LLM.
 
     Returns a template-ready dict combining NLP analysis and optional
-    LLM qualitative feedback.
+    LLM qualitative feedback.  Pass ``nlp_results`` when the local NLP
+    analysis is already available (e.g. from the editor's section cache).
     """
-    import nlp_service
+    from analysis_cache import analyze_cv
 
-    # 1. Run all local NLP analysis
-    nlp_results = nlp_service.analyze_cv_standalone(cv_text)
+    # 1. Run all local NLP analysis (memoized; misses run in the NLP process pool)
+    if nlp_results is None:
+        nlp_results = analyze_cv(cv_text, timeout=60)
     logger.info('NLP analysis complete: quality_score=%d, %d skills, %d sections',
                 nlp_results.get('cv_quality_score', 0),
                 nlp_results.get('skills', {}).get('total_skills', 0),
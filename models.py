@@ -123,6 +123,9 @@ class UserResume(db.Model):
     analysis_results_json = db.Column(db.Text)                         # Full results as JSON
     last_analyzed_at = db.Column(db.DateTime)
 
+    # Cached resume-side quick ATS features (nlp_service.ResumeProfile)
+    nlp_profile_json = db.Column(db.Text)
+
     user = db.relationship('User', backref=db.backref('resumes', lazy='dynamic'))
 
     def __repr__(self):
@@ -330,6 +333,8 @@ class JobPool(db.Model):
     title_lower = db.Column(db.String(500), default='', index=True)
     company_lower = db.Column(db.String(300), default='')
     description_lower = db.Column(db.Text, default='')
+    # Key into jd_features (nlp_service.jd_text_hash of the description)
+    desc_hash = db.Column(db.String(64), default='', index=True)
 
     def __repr__(self):
         return f'<JobPool {self.job_id[:20]} {self.title[:30]}>'
@@ -358,6 +363,74 @@ class JobPool(db.Model):
         }
 
 
+class JDFeatures(db.Model):
+    """Precomputed JD-side NLP features, content-addressed by description.
+
+    Keyed on the hash of the normalized description so the same posting
+    seen via several providers (or re-fetched) is parsed only once.
+    Rows with an older ``version`` are recomputed on read.
+    """
+    __tablename__ = 'jd_features'
+
+    id = db.Column(db.Integer, primary_key=True)
+    desc_hash = db.Column(db.String(64), unique=True, nullable=False, index=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
+    features_json = db.Column(db.Text, nullable=False)                 # nlp_service.extract_jd_features()
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class CVAnalysisCache(db.Model):
+    """Memoized nlp_service.analyze_cv_standalone() output (see analysis_cache.py).
+
+    Keyed on (hash of the CV text, nlp_service.analysis_version()) so a
+    version bump makes every older row a miss.
+    """
+    __tablename__ = 'cv_analysis_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    text_hash = db.Column(db.String(64), nullable=False, index=True)
+    nlp_version = db.Column(db.String(32), nullable=False)
+    results_json = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('text_hash', 'nlp_version', name='uq_cv_analysis_hash_version'),
+    )
+
+
+class CorpusKeywordModel(db.Model):
+    """Shared corpus statistics artifact (see keyword_model.py).
+
+    ``data`` is a zlib-compressed JSON blob of document frequencies;
+    ``last_job_id`` is the JobPool.id watermark folded in so far (late
+    commits below it are tracked inside ``data``; see keyword_model.py).
+    """
+    __tablename__ = 'corpus_keyword_models'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), unique=True, nullable=False)
+    data = db.Column(db.LargeBinary, nullable=False)
+    doc_count = db.Column(db.Integer, default=0)
+    last_job_id = db.Column(db.Integer, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class JobCatalog(db.Model):
+    """Shared snapshot of a bulk provider catalog (see job_catalogs.py).
+
+    ``data`` is a zlib-compressed JSON list of normalized job dicts;
+    ``claimed_at`` is the refresh lease held by the worker fetching it.
+    """
+    __tablename__ = 'job_catalogs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(64), unique=True, nullable=False)
+    data = db.Column(db.LargeBinary, nullable=False)
+    job_count = db.Column(db.Integer, default=0)
+    fetched_at = db.Column(db.DateTime, nullable=False)
+    claimed_at = db.Column(db.DateTime, nullable=True)
+
+
 class UserJobSnapshot(db.Model):
     """Per-user cached job results with pre-computed quick ATS scores.
 
@@ -0,0 +1,136 @@
+"""Process pool for CPU-bound nlp_service work.
+
+Skill matching, fuzzy matching and CV analysis are pure Python and hold
+the GIL, so under gunicorn's gthread worker one heavy request stalls the
+other request thread on that worker.  This module runs such calls in a
+small per-worker process pool instead.
+
+Lifecycle:
+- start() is called from gunicorn's post_fork hook (see gunicorn.conf.py),
+  so every web worker owns its own pool.
+- Pool processes use the 'spawn' start method (never fork a threaded
+  worker) and preload the skill taxonomy, matchers and NLTK data once.
+- submit() runs the call inline when the pool is disabled or not started
+  (local `python app.py`, scripts, tests), so callers need no branching.
+- A call that times out while running is not left to finish: the pool is
+  recycled (its processes terminated, a fresh pool started), so one
+  pathological CV cannot make every later call queue behind it and time
+  out too.  Other calls in flight on the old pool then run inline.
+
+Config (env):
+- NLP_POOL_WORKERS: processes per web worker (default 1, 0 disables)
+- NLP_POOL_TIMEOUT: default deadline in seconds for submit() (default 20)
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as _FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+NLP_POOL_WORKERS = int(os.environ.get('NLP_POOL_WORKERS', '1'))
+NLP_POOL_TIMEOUT = float(os.environ.get('NLP_POOL_TIMEOUT', '20'))
+
+_executor = None
+_lock = threading.Lock()
+
+
+class NLPTimeout(TimeoutError):
+    """Raised by submit() when the call misses its deadline."""
+
+
+def _init_worker():
+    """Preload everything nlp_service builds lazily, once per pool process."""
+    import nlp_service
+    nlp_service.warm_up()
+
+
+def start(workers=None):
+    """Start this process's NLP pool (idempotent). Returns True if running."""
+    global _executor
+    workers = NLP_POOL_WORKERS if workers is None else workers
+    if workers <= 0:
+        logger.info('NLP pool disabled; running NLP work inline')
+        return False
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+            )
+            # Processes spawn lazily; kick one job so preloading starts now,
+            # not on the first user request
+            _executor.submit(int)
+            logger.info('NLP pool started: %d process(es) for pid %d', workers, os.getpid())
+    return True
+
+
+def shutdown(wait=False):
+    """Stop the pool; later submit() calls run inline."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def is_running():
+    return _executor is not None
+
+
+def submit(fn, *args, timeout=None, **kwargs):
+    """Run fn(*args, **kwargs) in the pool and wait up to `timeout` seconds.
+
+    fn and its arguments must be picklable (module-level functions, plain
+    data).  Raises NLPTimeout if the deadline passes; the pending call is
+    cancelled if it has not started yet, else the pool is recycled to stop
+    it.  Runs inline if no pool is running.
+    """
+    executor = _executor
+    if executor is None:
+        return fn(*args, **kwargs)
+
+    timeout = NLP_POOL_TIMEOUT if timeout is None else timeout
+    try:
+        future = executor.submit(fn, *args, **kwargs)
+    except (BrokenProcessPool, RuntimeError) as e:
+        logger.warning('NLP pool unavailable (%s); restarting and running inline', e)
+        _restart(executor)
+        return fn(*args, **kwargs)
+
+    try:
+        return future.result(timeout=timeout)
+    except _FutureTimeout:
+        if not future.cancel():
+            logger.warning('NLP pool call %s still running after %.1fs; recycling the pool',
+                           getattr(fn, '__name__', fn), timeout)
+            _restart(executor, terminate=True)
+        raise NLPTimeout(f'{getattr(fn, "__name__", fn)} exceeded {timeout:.1f}s')
+    except BrokenProcessPool as e:
+        # A pool process died (e.g. OOM-killed) — replace the pool, retry inline
+        logger.warning('NLP pool broken (%s); restarting and running inline', e)
+        _restart(executor)
+        return fn(*args, **kwargs)
+
+
+def _restart(broken, terminate=False):
+    """Replace a broken executor (only if nobody replaced it already).
+
+    With terminate, its processes are killed first: shutdown() alone lets a
+    running call finish.
+    """
+    global _executor
+    with _lock:
+        if _executor is not broken:
+            return
+        _executor = None
+    if terminate:
+        # No public API for this; _processes is {pid: Process}
+        for process in list((getattr(broken, '_processes', None) or {}).values()):
+            process.terminate()
+    broken.shutdown(wait=False, cancel_futures=True)
+    start()
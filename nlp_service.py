@@ -8,13 +8,26 @@ Used by Tier 1 (CV-only analysis) to minimise LLM token consumption.
 import logging
 import re
 from collections import Counter
+from functools import cached_property
+
+from skills_data import SKILL_TABLE_ID
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Lazy NLTK initialisation
+# NLTK initialisation
 # ---------------------------------------------------------------------------
+# Corpora are downloaded at build time into $NLTK_DATA (render.yaml sets
+# /opt/render/project/src/nltk_data), or NLTK's default ~/nltk_data when it
+# is unset (build.sh and nixpacks.toml).  At runtime we only look them up
+# and never hit the network.
+_NLTK_RESOURCES = (
+    ('tokenizers/punkt_tab', 'tokenizers/punkt'),
+    ('taggers/averaged_perceptron_tagger_eng', 'taggers/averaged_perceptron_tagger'),
+    ('corpora/stopwords',),
+)
 _nltk_ready = False
+_rake_stopwords = None
 
 
 def _ensure_nltk():
@@ -23,29 +36,91 @@ def _ensure_nltk():
         return
     try:
         import nltk
-        # Try to use punkt_tab first, fall back to punkt
-        try:
-            nltk.data.find('tokenizers/punkt_tab')
-        except LookupError:
-            try:
-                nltk.download('punkt_tab', quiet=True)
-            except Exception:
-                nltk.download('punkt', quiet=True)
-        try:
-            nltk.data.find('taggers/averaged_perceptron_tagger_eng')
-        except LookupError:
-            try:
-                nltk.download('averaged_perceptron_tagger_eng', quiet=True)
-            except Exception:
-                nltk.download('averaged_perceptron_tagger', quiet=True)
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords', quiet=True)
-        _nltk_ready = True
+        for candidates in _NLTK_RESOURCES:
+            for resource in candidates:
+                try:
+                    nltk.data.find(resource)
+                    break
+                except LookupError:
+                    continue
+            else:
+                logger.warning('NLTK data %s not found (run build.sh to bundle it); '
+                               'keyword extraction will use the fallback', candidates[0])
     except Exception as e:
         logger.warning('NLTK init failed: %s', e)
-        _nltk_ready = True  # Don't retry endlessly
+    _nltk_ready = True  # Don't retry endlessly
+
+
+def _get_rake_stopwords() -> set:
+    """English stopwords for RAKE, read from the corpus once per process.
+
+    Raises LookupError (every call, without re-reading) if the corpus is
+    not bundled.
+    """
+    global _rake_stopwords
+    if _rake_stopwords is None:
+        try:
+            from nltk.corpus import stopwords
+            _rake_stopwords = set(stopwords.words('english'))
+        except LookupError:
+            _rake_stopwords = frozenset()
+    if not _rake_stopwords:
+        raise LookupError('NLTK stopwords corpus not available')
+    return _rake_stopwords
+
+
+# ---------------------------------------------------------------------------
+# Parsed CV (shared tokenization for all analyzers)
+# ---------------------------------------------------------------------------
+
+
+class ParsedCV:
+    """A CV split, stripped and lowered once, shared by every analyzer.
+
+    All analyzers accept either raw text or a ParsedCV; pass the same
+    ParsedCV to several of them to avoid re-tokenizing.  Attributes are
+    computed on first access and cached.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @classmethod
+    def of(cls, cv) -> 'ParsedCV':
+        return cv if isinstance(cv, cls) else cls(cv)
+
+    @cached_property
+    def lines(self) -> list:
+        return self.text.split('\n')
+
+    @cached_property
+    def stripped_lines(self) -> list:
+        return [line.strip() for line in self.lines]
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def words(self) -> list:
+        """Whitespace-separated words of the original text."""
+        return self.text.split()
+
+    @cached_property
+    def tokens(self) -> list:
+        """Whitespace-separated words of the lowered text."""
+        return self.lower.split()
+
+    @cached_property
+    def bullets(self) -> list:
+        """Stripped lines that look like bullet points."""
+        return [s for s in self.stripped_lines
+                if _BULLET_RE.match(s) or _NUMBERED_BULLET_RE.match(s)]
+
+    @cached_property
+    def sections(self) -> dict:
+        """detect_sections() result (section spans are in 'section_details')."""
+        return detect_sections(self)
 
 
 # ---------------------------------------------------------------------------
@@ -70,36 +145,81 @@ _ESSENTIAL_SECTIONS = {'Summary', 'Experience', 'Education', 'Skills'}
 _RECOMMENDED_SECTIONS = {'Projects', 'Certifications'}
 
 
-def detect_sections(cv_text: str) -> dict:
-    """Detect standard CV sections using regex patterns."""
-    lines = cv_text.split('\n')
+def _leading_keyword_chars(pattern: str) -> set:
+    """First letters of the top-level keyword alternatives in a section pattern."""
+    body = pattern.split('(?:', 1)[1]
+    chars, depth, at_start = set(), 0, True
+    for ch in body:
+        if at_start:
+            chars.add(ch.lower())
+            at_start = False
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            if depth == 0:
+                break
+            depth -= 1
+        elif ch == '|' and depth == 0:
+            at_start = True
+    return chars
+
+
+# All section patterns as one alternation, one named group per section, in
+# _SECTION_PATTERNS order — so the first matching group is the same section
+# the per-pattern loop would have picked.
+_SECTION_HEADER_RE = re.compile('(?i)' + '|'.join(
+    f'(?P<{name}>{pattern[len("(?i)"):]})' for name, pattern in _SECTION_PATTERNS.items()
+))
+_SECTION_LEAD_RE = re.compile(r'[\s#*]*')
+# Fast reject: a header's first non-[\s#*] character must start some keyword.
+# Non-ASCII characters go to the full match (IGNORECASE folds e.g. U+017F to 's').
+_SECTION_FIRST_CHARS = frozenset().union(*map(_leading_keyword_chars, _SECTION_PATTERNS.values()))
+
+
+def _classify_section_header(stripped: str):
+    """Return the section a stripped line is a header for, or None."""
+    pos = _SECTION_LEAD_RE.match(stripped).end()
+    if pos >= len(stripped):
+        return None
+    first = stripped[pos]
+    if first.lower() not in _SECTION_FIRST_CHARS and first.isascii():
+        return None
+    m = _SECTION_HEADER_RE.match(stripped)
+    return m.lastgroup if m else None
+
+
+def detect_sections(cv_text) -> dict:
+    """Detect standard CV sections using regex patterns.
+
+    Accepts raw text or a ParsedCV.
+    """
+    doc = ParsedCV.of(cv_text)
+    lines = doc.lines
     sections_found = []
     section_details = {}
     current_section = None
     current_start = 0
 
-    for i, line in enumerate(lines):
-        stripped = line.strip()
+    for i, stripped in enumerate(doc.stripped_lines):
         if not stripped or len(stripped) > 80:
             continue
 
-        for section_name, pattern in _SECTION_PATTERNS.items():
-            if re.match(pattern, stripped):
-                # Close previous section
-                if current_section:
-                    section_details[current_section]['end_line'] = i - 1
-                    section_details[current_section]['line_count'] = i - current_start
-
-                if section_name not in sections_found:
-                    sections_found.append(section_name)
-                    section_details[section_name] = {
-                        'start_line': i,
-                        'end_line': len(lines) - 1,
-                        'line_count': 0,
-                    }
-                    current_section = section_name
-                    current_start = i
-                break
+        section_name = _classify_section_header(stripped)
+        if section_name:
+            # Close previous section
+            if current_section:
+                section_details[current_section]['end_line'] = i - 1
+                section_details[current_section]['line_count'] = i - current_start
+
+            if section_name not in sections_found:
+                sections_found.append(section_name)
+                section_details[section_name] = {
+                    'start_line': i,
+                    'end_line': len(lines) - 1,
+                    'line_count': 0,
+                }
+                current_section = section_name
+                current_start = i
 
     # Close last section
     if current_section and current_section in section_details:
@@ -140,14 +260,14 @@ _NOT_NAME_RE = re.compile(
 )
 
 
-def extract_candidate_name(cv_text: str) -> str:
+def extract_candidate_name(cv_text) -> str:
     """Extract candidate name from the first few lines of CV text.
 
     Heuristic: the name is typically the first non-empty line in the top
     10 lines that contains 1-5 alphabetic words, is not a section header,
     and does not contain contact info patterns.
     """
-    lines = cv_text.split('\n')[:10]
+    lines = ParsedCV.of(cv_text).lines[:10]
     for line in lines:
         stripped = line.strip().strip('#*_- \t')
         if not stripped or len(stripped) < 2:
@@ -191,10 +311,10 @@ _SECTION_DESCRIPTIONS = {
 }
 
 
-def extract_contact_info(cv_text: str) -> dict:
+def extract_contact_info(cv_text) -> dict:
     """Extract contact information using regex."""
     # Only search first ~30 lines (contact is usually at top)
-    top = '\n'.join(cv_text.split('\n')[:30])
+    top = '\n'.join(ParsedCV.of(cv_text).lines[:30])
 
     fields = {
         'email': bool(_EMAIL_RE.search(top)),
@@ -218,24 +338,15 @@ def extract_contact_info(cv_text: str) -> dict:
 # Formatting Score
 # ---------------------------------------------------------------------------
 
-def _extract_bullets(cv_text: str) -> list[str]:
-    """Extract lines that look like bullet points."""
-    bullets = []
-    for line in cv_text.split('\n'):
-        stripped = line.strip()
-        if re.match(r'^[\u2022\u2023\u25E6\u25AA\u25AB*\-\u2013\u2014]\s', stripped):
-            bullets.append(stripped)
-        elif re.match(r'^\d+[.)]\s', stripped):
-            bullets.append(stripped)
-    return bullets
+_BULLET_RE = re.compile(r'^[\u2022\u2023\u25E6\u25AA\u25AB*\-\u2013\u2014]\s')
+_NUMBERED_BULLET_RE = re.compile(r'^\d+[.)]\s')
 
 
-def compute_formatting_score(cv_text: str, sections: dict) -> dict:
+def compute_formatting_score(cv_text, sections: dict) -> dict:
     """Assess CV formatting quality."""
-    words = cv_text.split()
-    word_count = len(words)
-    lines = cv_text.split('\n')
-    bullets = _extract_bullets(cv_text)
+    doc = ParsedCV.of(cv_text)
+    word_count = len(doc.words)
+    bullets = doc.bullets
     bullet_count = len(bullets)
 
     issues = []
@@ -279,7 +390,7 @@ def compute_formatting_score(cv_text: str, sections: dict) -> dict:
         avg_bullet_words = 0
 
     # Long lines (wall of text)
-    long_lines = sum(1 for l in lines if len(l.strip()) > 120)
+    long_lines = sum(1 for l in doc.stripped_lines if len(l) > 120)
     if long_lines > 5:
         issues.append('Several very long lines — break text into shorter, readable chunks')
 
@@ -355,18 +466,24 @@ _VERB_REPLACEMENTS = {
 }
 
 
-def analyze_action_verbs(cv_text: str) -> dict:
+def analyze_action_verbs(cv_text) -> dict:
     """Analyse action verbs in CV bullet points."""
-    bullets = _extract_bullets(cv_text)
+    return _score_action_verbs([_bullet_lead(b) for b in ParsedCV.of(cv_text).bullets])
+
+
+def _bullet_lead(bullet: str) -> tuple:
+    """(first 1-3 lowered words, bullet text without its marker) of one bullet."""
+    clean = re.sub(r'^[\u2022\u2023\u25E6\u25AA\u25AB*\-\u2013\u2014\d.)\s]+', '', bullet)
+    return clean.lower().split()[:3], clean
+
+
+def _score_action_verbs(leads: list) -> dict:
+    """analyze_action_verbs() result from the _bullet_lead() of every bullet."""
     strong_found = []
     weak_found = []
     suggestions = []
 
-    for bullet in bullets:
-        # Get first 1-3 words
-        clean = re.sub(r'^[\u2022\u2023\u25E6\u25AA\u25AB*\-\u2013\u2014\d.)\s]+', '', bullet)
-        first_words = clean.lower().split()[:3]
-
+    for first_words, clean in leads:
         for word in first_words:
             word_clean = word.strip('.,;:')
             if word_clean in STRONG_VERBS and word_clean not in strong_found:
@@ -383,14 +500,14 @@ def analyze_action_verbs(cv_text: str) -> dict:
                     )
                 break
 
-    total = len(bullets) or 1
+    total = len(leads) or 1
     strong_ratio = len(strong_found) / total
     weak_ratio = len(weak_found) / total
 
     # Score: 100 if all strong, 0 if all weak
     score = int(min(100, max(0, (strong_ratio * 100) + ((1 - weak_ratio) * 30))))
     # Cap at reasonable levels
-    if not bullets:
+    if not leads:
         score = 20
     elif len(strong_found) == 0:
         score = min(score, 30)
@@ -401,7 +518,7 @@ def analyze_action_verbs(cv_text: str) -> dict:
         'weak_verbs_found': weak_found[:15],
         'strong_verb_count': len(strong_found),
         'weak_verb_count': len(weak_found),
-        'total_bullets_analyzed': len(bullets),
+        'total_bullets_analyzed': len(leads),
         'suggestions': suggestions[:5],
     }
 
@@ -423,24 +540,33 @@ _METRICS_RE = re.compile(
 )
 
 
-def check_quantification(cv_text: str) -> dict:
+def check_quantification(cv_text) -> dict:
     """Check how many bullet points contain metrics/numbers."""
-    bullets = _extract_bullets(cv_text)
+    return _score_quantification([_bullet_metric(b) for b in ParsedCV.of(cv_text).bullets])
+
+
+def _bullet_metric(bullet: str):
+    """First metric in a bullet, or None."""
+    matches = _METRICS_RE.findall(bullet)
+    return matches[0] if matches else None
+
+
+def _score_quantification(metrics: list) -> dict:
+    """check_quantification() result from the _bullet_metric() of every bullet."""
     with_metrics = 0
     metric_examples = []
 
-    for bullet in bullets:
-        matches = _METRICS_RE.findall(bullet)
-        if matches:
+    for metric in metrics:
+        if metric is not None:
             with_metrics += 1
             if len(metric_examples) < 5:
-                metric_examples.append(matches[0].strip())
+                metric_examples.append(metric.strip())
 
-    total = len(bullets) or 1
+    total = len(metrics) or 1
     ratio = with_metrics / total
     score = int(min(100, ratio * 150))  # 67% with metrics = 100
 
-    if not bullets:
+    if not metrics:
         suggestion = 'Add bullet points with quantified achievements to strengthen your CV.'
     elif ratio < 0.3:
         suggestion = (f'Only {int(ratio * 100)}% of your bullet points contain metrics. '
@@ -454,8 +580,8 @@ def check_quantification(cv_text: str) -> dict:
     return {
         'quantification_score': score,
         'bullets_with_metrics': with_metrics,
-        'bullets_without_metrics': len(bullets) - with_metrics,
-        'total_bullets': len(bullets),
+        'bullets_without_metrics': len(metrics) - with_metrics,
+        'total_bullets': len(metrics),
         'metric_examples': metric_examples,
         'suggestion': suggestion,
     }
@@ -465,13 +591,54 @@ def check_quantification(cv_text: str) -> dict:
 # Keyword / Skill Extraction
 # ---------------------------------------------------------------------------
 
+def _extract_keywords_idf(text: str, model, top_n: int) -> list[dict]:
+    """Rank 1-2 word phrases by TF x corpus IDF (see keyword_model).
+
+    Only phrases that occur in the job corpus are ranked, so names and
+    one-off words don't outrank terms employers actually use.
+    """
+    from keyword_model import keyword_chunks
+    try:
+        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS as stop
+    except ImportError:
+        stop = frozenset()
+
+    def _content(tok):
+        return tok not in stop and not tok.isdigit()
+
+    counts = Counter()
+    for chunk in keyword_chunks(text.lower()):
+        for i, tok in enumerate(chunk):
+            if not _content(tok):
+                continue
+            if len(tok) >= 3:
+                counts[tok] += 1
+            if i + 1 < len(chunk) and _content(chunk[i + 1]):
+                counts[tok + ' ' + chunk[i + 1]] += 1
+
+    scored = sorted(((tf * model.idf(term), term) for term, tf in counts.items()
+                     if term in model.df),
+                    key=lambda st: (-st[0], st[1]))
+    return [{'phrase': term, 'score': round(score, 2)} for score, term in scored[:top_n]]
+
+
 def extract_keywords(text: str, top_n: int = 20) -> list[dict]:
-    """Extract keywords using RAKE algorithm."""
+    """Extract keywords, ranked by corpus TF-IDF when the keyword model is
+    available, else by the RAKE algorithm."""
+    try:
+        from keyword_model import get_model
+        model = get_model()
+    except Exception as e:
+        logger.warning('Keyword model unavailable: %s', e)
+        model = None
+    if model is not None:
+        return _extract_keywords_idf(text, model, top_n)
+
     _ensure_nltk()
     keywords = []
     try:
         from rake_nltk import Rake
-        r = Rake(min_length=1, max_length=3)
+        r = Rake(min_length=1, max_length=3, stopwords=_get_rake_stopwords())
         r.extract_keywords_from_text(text)
         ranked = r.get_ranked_phrases_with_scores()
         for score, phrase in ranked[:top_n]:
@@ -488,32 +655,191 @@ def extract_keywords(text: str, top_n: int = 20) -> list[dict]:
     return keywords
 
 
-def extract_skills_from_cv(cv_text: str) -> dict:
+# ---------------------------------------------------------------------------
+# Skill Matcher (all skills + aliases in one scan)
+# ---------------------------------------------------------------------------
+
+_WORD_CHAR_RE = re.compile(r'\w')
+
+
+def _is_word_boundary(text: str, pos: int) -> bool:
+    """Same test as regex ``\\b`` at ``pos`` (works for pos == len(text))."""
+    before = pos > 0 and bool(_WORD_CHAR_RE.match(text[pos - 1]))
+    after = pos < len(text) and bool(_WORD_CHAR_RE.match(text[pos]))
+    return before != after
+
+
+def _trie_pattern(terms) -> str:
+    """Render terms as a prefix-factored alternation (longest branch first)."""
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def _render(node):
+        branches = [re.escape(ch) + _render(child)
+                    for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # Greedy optional: longer terms are tried before this one ends
+            return '(?:' + body + ')?' if len(branches) == 1 else body + '?'
+        return body
+
+    return _render(trie)
+
+
+class SkillMatcher:
+    """Find every known skill and alias in a single scan of the text.
+
+    Gives exactly the hits of running ``re.search(r'\\b' + skill + r'\\b')``
+    per term.  The lookahead lets hits overlap ('machine learning' and
+    'learning'); the trie alternation returns the longest term at each
+    start position, and the shorter terms that are word-bounded prefixes
+    of it ('spring' inside 'spring boot') come from a precomputed table.
+    """
+
+    def __init__(self, categories: dict, aliases: dict):
+        self.skill_categories = {
+            skill: category
+            for category, skills in categories.items()
+            for skill in skills
+        }
+        self.aliases = dict(aliases)
+        terms = set(self.skill_categories) | set(self.aliases)
+        self._pattern = re.compile(r'(?=\b(' + _trie_pattern(terms) + r')\b)')
+        self._implied = {
+            term: tuple(p for p in terms
+                        if len(p) < len(term) and term.startswith(p)
+                        and _is_word_boundary(term, len(p)))
+            for term in terms
+        }
+
+    # Pickled (taxonomy_artifact) as the pattern source: a compiled regex
+    # cannot be stored, so it is recompiled when the artifact is loaded
+    def __getstate__(self):
+        return dict(self.__dict__, _pattern=self._pattern.pattern)
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, _pattern=re.compile(state['_pattern']))
+
+    def find_terms(self, text_lower: str) -> set:
+        """Return every skill/alias string that occurs as a whole word."""
+        found = set()
+        for m in self._pattern.finditer(text_lower):
+            term = m.group(1)
+            if term not in found:
+                found.add(term)
+                found.update(self._implied[term])
+        return found
+
+    def match(self, text: str) -> dict:
+        """Return {canonical_skill: category} for skills and aliases in text.
+
+        Aliases resolve to their canonical skill; canonical names that are
+        not part of SKILL_CATEGORIES map to a category of None.
+        """
+        result = {}
+        for term in self.find_terms(text.lower()):
+            if term in self.skill_categories:
+                result[term] = self.skill_categories[term]
+            if term in self.aliases:
+                canonical = self.aliases[term]
+                result.setdefault(canonical, self.skill_categories.get(canonical))
+        return result
+
+
+_skill_matcher = None
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Return the shared SkillMatcher from the prebuilt taxonomy artifact."""
+    global _skill_matcher
+    if _skill_matcher is None:
+        import taxonomy_artifact
+        _skill_matcher = taxonomy_artifact.load()['skill_matcher']
+    return _skill_matcher
+
+
+class FuzzySkillIndex:
+    """Length-blocked fuzzy lookup: which skills score >= 85 against a phrase.
+
+    ``fuzz.ratio`` is 200 * LCS / (len_a + len_b), so a score of 85 needs
+    the longer string to be at most 23/17 of the shorter one, and skills
+    under 3 characters can never reach it against a 3+ character phrase.
+    Phrases are grouped by length and each group is scored in one
+    ``process.cdist`` call against the only skills that length admits.
+    """
+
+    CUTOFF = 85
+
+    def __init__(self, skills):
+        by_length = {}
+        for skill in sorted(skills):
+            if len(skill) >= 3:
+                by_length.setdefault(len(skill), []).append(skill)
+        self._blocks = {}
+        for length in range(3, 40):
+            self._blocks[length] = [
+                skill
+                for skill_len, group in sorted(by_length.items())
+                if 17 * max(length, skill_len) <= 23 * min(length, skill_len)
+                for skill in group
+            ]
+
+    def find(self, phrases) -> set:
+        """Return skills with fuzz.ratio >= 85 to some phrase other than itself."""
+        from rapidfuzz import fuzz, process
+
+        by_length = {}
+        for phrase in phrases:
+            by_length.setdefault(len(phrase), []).append(phrase)
+
+        found = set()
+        for length, group in by_length.items():
+            choices = self._blocks.get(length)
+            if not choices:
+                continue
+            scores = process.cdist(group, choices, scorer=fuzz.ratio,
+                                   score_cutoff=self.CUTOFF)
+            for row, col in zip(*scores.nonzero()):
+                if group[row] != choices[col]:
+                    found.add(choices[col])
+        return found
+
+
+_fuzzy_skill_index = None
+
+
+def get_fuzzy_skill_index() -> FuzzySkillIndex:
+    """Return the shared FuzzySkillIndex from the prebuilt taxonomy artifact."""
+    global _fuzzy_skill_index
+    if _fuzzy_skill_index is None:
+        import taxonomy_artifact
+        _fuzzy_skill_index = taxonomy_artifact.load()['fuzzy_index']
+    return _fuzzy_skill_index
+
+
+def extract_skills_from_cv(cv_text) -> dict:
     """Extract skills by fuzzy matching against known skill categories."""
-    from skills_data import SKILL_CATEGORIES, ALL_KNOWN_SKILLS
+    doc = ParsedCV.of(cv_text)
+    return _extract_skills(doc.lower, get_skill_matcher().find_terms(doc.lower), doc.tokens)
 
-    cv_lower = cv_text.lower()
-    skills_found = []
-    by_category = {}
-    category_coverage = {}
 
-    # Direct matching first (faster)
-    for category, skill_set in SKILL_CATEGORIES.items():
-        matched = []
-        for skill in skill_set:
-            # Word boundary check to avoid partial matches
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, cv_lower):
-                matched.append(skill.title() if len(skill) > 3 else skill.upper())
-        by_category[category] = matched
-        category_coverage[category] = len(matched)
-        skills_found.extend(matched)
+def _extract_skills(cv_lower: str, terms: set, words: list = None) -> dict:
+    """Build the extract_skills_from_cv result from precomputed term hits."""
+    return _skills_result(terms, _fuzzy_skill_hits(cv_lower, words))
 
-    # Fuzzy matching for skills not caught by exact match
+
+def _fuzzy_skill_hits(cv_lower: str, words: list = None) -> set:
+    """Known skills fuzzily matched by any 1-3 word phrase of the CV."""
     try:
-        from rapidfuzz import fuzz, process
         # Extract potential skill phrases from CV (1-3 word sequences)
-        words = cv_lower.split()
+        if words is None:
+            words = cv_lower.split()
         potential = set()
         for i in range(len(words)):
             for n in range(1, 4):
@@ -522,23 +848,37 @@ def extract_skills_from_cv(cv_text: str) -> dict:
                     if 2 < len(phrase) < 40:
                         potential.add(phrase)
 
-        for phrase in potential:
-            for skill in ALL_KNOWN_SKILLS:
-                if skill.lower() in [s.lower() for s in skills_found]:
-                    continue
-                score = fuzz.ratio(phrase, skill)
-                if score >= 85 and skill.lower() != phrase:
-                    display = skill.title() if len(skill) > 3 else skill.upper()
-                    if display not in skills_found:
-                        skills_found.append(display)
-                        # Find category
-                        for cat, cat_skills in SKILL_CATEGORIES.items():
-                            if skill in cat_skills:
-                                by_category.setdefault(cat, []).append(display)
-                                category_coverage[cat] = len(by_category[cat])
-                                break
+        return get_fuzzy_skill_index().find(potential)
     except ImportError:
-        pass  # rapidfuzz not available, skip fuzzy matching
+        return set()  # rapidfuzz not available, skip fuzzy matching
+
+
+def _skills_result(terms: set, fuzzy_hits: set) -> dict:
+    """extract_skills_from_cv result from exact term hits and fuzzy hits."""
+    from skills_data import CATEGORY_MASKS, skill_bits, skill_names
+
+    exact = skill_bits(terms)
+    fuzzy = skill_bits(fuzzy_hits) & ~exact
+
+    def _display(skill):
+        return skill.title() if len(skill) > 3 else skill.upper()
+
+    skills_found = []
+    by_category = {}
+    category_coverage = {}
+
+    # Direct matches first, then fuzzy matches for skills exact matching missed
+    for category, mask in CATEGORY_MASKS.items():
+        matched = [_display(sk) for sk in skill_names(exact & mask)]
+        by_category[category] = matched
+        category_coverage[category] = len(matched)
+        skills_found.extend(matched)
+    for category, mask in CATEGORY_MASKS.items():
+        extra = [_display(sk) for sk in skill_names(fuzzy & mask)]
+        if extra:
+            skills_found.extend(extra)
+            by_category[category].extend(extra)
+            category_coverage[category] = len(by_category[category])
 
     return {
         'skills_found': skills_found,
@@ -548,30 +888,61 @@ def extract_skills_from_cv(cv_text: str) -> dict:
     }
 
 
-def _estimate_experience_match(cv_text: str, jd_text: str) -> int:
-    """Estimate experience alignment from years mentioned in CV vs JD."""
-    from datetime import datetime as _dt
+# ---------------------------------------------------------------------------
+# Quick ATS factors — split into resume-side and JD-side halves so the
+# resume half can be computed once and reused across every job scored.
+# ---------------------------------------------------------------------------
 
-    # Extract years from JD (e.g., "3+ years", "5-7 years experience")
-    jd_years = re.findall(
-        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)?',
-        jd_text.lower(),
-    )
-    jd_min_years = min((int(y) for y in jd_years), default=0)
+# Bump the high part when the features change; the low 16 bits follow the
+# interned skill table, since both store skill bitsets
+RESUME_PROFILE_VERSION = (2 << 16) | SKILL_TABLE_ID
+JD_FEATURES_VERSION = (2 << 16) | SKILL_TABLE_ID
+
+_YEARS_RE = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)?')
+_CV_YEARS_RE = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)')
+_DATE_RANGE_RE = re.compile(r'(20\d{2})\s*[-\u2013\u2014]\s*(20\d{2}|[Pp]resent|[Cc]urrent)')
+
+_KEYWORD_FILLER = ('the ', 'and ', 'or ', 'we ', 'you ', 'our ', 'is ', 'are ',
+                   'will ', 'in ', 'to ', 'of ', 'a ', 'an ', 'for ', 'with ',
+                   'this ', 'that ', 'be ', 'as ', 'on ', 'at ')
+
+_EDU_KEYWORDS = {
+    'phd': 100, 'doctorate': 100, 'ph.d': 100,
+    'master': 85, 'mba': 85, 'ms ': 85, 'm.s.': 85, 'm.tech': 85, 'mtech': 85,
+    'bachelor': 70, 'b.tech': 70, 'btech': 70, 'b.s.': 70, 'bs ': 70, 'b.e.': 70,
+    'degree': 60, 'diploma': 50, 'certification': 45,
+    'computer science': 30, 'engineering': 25, 'mathematics': 20,
+}
+_JD_EDU_KEYWORDS = ('degree', 'bachelor', 'master', 'education', 'qualification',
+                    'b.tech', 'b.s.', 'phd', 'mba')
 
-    # Extract years from CV ("X years experience")
-    cv_years_explicit = re.findall(
-        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)',
-        cv_text.lower(),
-    )
-    cv_max_years = max((int(y) for y in cv_years_explicit), default=0)
+_ROLE_KEYWORDS = ('engineer', 'developer', 'analyst', 'manager', 'designer',
+                  'architect', 'lead', 'senior', 'junior', 'intern', 'consultant',
+                  'specialist', 'coordinator', 'scientist', 'administrator',
+                  'director')
+_ROLE_KEYWORD_RE = re.compile(r'\b(?:' + '|'.join(_ROLE_KEYWORDS) + r')\b')
+
+
+def _expanded_skill_bits(text_lower: str, words: list = None) -> int:
+    """Skill bitset (see skills_data) of the skills in text, expanded with alias hits."""
+    from skills_data import KNOWN_SKILLS_MASK, ALIAS_MASK, alias_targets, skill_bits
+
+    terms = skill_bits(get_skill_matcher().find_terms(text_lower))
+    found = (terms & KNOWN_SKILLS_MASK) | skill_bits(_fuzzy_skill_hits(text_lower, words))
+    aliases = terms & ALIAS_MASK
+    return found | aliases | alias_targets(aliases)
+
+
+def _cv_experience_years(cv_text: str) -> int:
+    """Years of experience claimed in the CV, or summed from date ranges."""
+    from datetime import datetime as _dt
+
+    # "X years experience"
+    cv_max_years = max((int(y) for y in _CV_YEARS_RE.findall(cv_text.lower())), default=0)
 
     # Fallback: date ranges like "2018 - 2023" or "2018 - Present"
     if cv_max_years == 0:
-        date_ranges = re.findall(
-            r'(20\d{2})\s*[-\u2013\u2014]\s*(20\d{2}|[Pp]resent|[Cc]urrent)',
-            cv_text,
-        )
+        date_ranges = _DATE_RANGE_RE.findall(cv_text)
         if date_ranges:
             now_year = _dt.utcnow().year
             spans = []
@@ -579,83 +950,267 @@ def _estimate_experience_match(cv_text: str, jd_text: str) -> int:
                 end_year = now_year if end.lower() in ('present', 'current') else int(end)
                 spans.append(max(0, end_year - int(start)))
             cv_max_years = sum(spans)
+    return cv_max_years
 
+
+def _experience_score(cv_years: int, jd_min_years: int) -> int:
     if jd_min_years == 0:
         return 60  # JD doesn't specify, average score
-    if cv_max_years >= jd_min_years:
-        return min(100, 70 + (cv_max_years - jd_min_years) * 5)
-    gap = jd_min_years - cv_max_years
+    if cv_years >= jd_min_years:
+        return min(100, 70 + (cv_years - jd_min_years) * 5)
+    gap = jd_min_years - cv_years
     return max(15, 60 - gap * 15)
 
 
-def _estimate_keyword_optimization(cv_text: str, jd_text: str) -> int:
-    """Check how many JD-specific bigram phrases appear in CV."""
-    jd_lower = jd_text.lower()
-    cv_lower = cv_text.lower()
-
-    _filler = {'the ', 'and ', 'or ', 'we ', 'you ', 'our ', 'is ', 'are ',
-               'will ', 'in ', 'to ', 'of ', 'a ', 'an ', 'for ', 'with ',
-               'this ', 'that ', 'be ', 'as ', 'on ', 'at '}
-
+def _jd_keyword_phrases(jd_lower: str) -> set:
+    """JD-specific bigram phrases (filler bigrams dropped)."""
     jd_words = jd_lower.split()
     phrases = set()
     for i in range(len(jd_words) - 1):
         bigram = jd_words[i] + ' ' + jd_words[i + 1]
-        if len(bigram) > 8 and not any(f in bigram for f in _filler):
+        if len(bigram) > 8 and not any(f in bigram for f in _KEYWORD_FILLER):
             phrases.add(bigram)
+    return phrases
 
-    if not phrases:
-        return 50
-    found = sum(1 for p in phrases if p in cv_lower)
-    ratio = found / len(phrases)
-    return min(100, int(ratio * 150))
-
-
-def _estimate_education_match(cv_text: str, jd_text: str) -> int:
-    """Estimate education match from degree keywords."""
-    _edu_keywords = {
-        'phd': 100, 'doctorate': 100, 'ph.d': 100,
-        'master': 85, 'mba': 85, 'ms ': 85, 'm.s.': 85, 'm.tech': 85, 'mtech': 85,
-        'bachelor': 70, 'b.tech': 70, 'btech': 70, 'b.s.': 70, 'bs ': 70, 'b.e.': 70,
-        'degree': 60, 'diploma': 50, 'certification': 45,
-        'computer science': 30, 'engineering': 25, 'mathematics': 20,
-    }
 
-    cv_lower = cv_text.lower()
+def _cv_education_score(cv_lower: str) -> int:
+    cv_edu_score = 0
+    for kw, score in _EDU_KEYWORDS.items():
+        if kw in cv_lower:
+            cv_edu_score = max(cv_edu_score, score)
+    return cv_edu_score
+
+
+def _jd_role_keywords(jd_text: str) -> set:
+    """Role keywords in the JD's first five lines (its title block)."""
+    jd_lines = jd_text.strip().split('\n')[:5]
+    return set(_ROLE_KEYWORD_RE.findall(' '.join(jd_lines).lower()))
+
+
+class ResumeProfile:
+    """Resume-side features for quick ATS scoring.
+
+    Built once per resume version and reused for every job scored against
+    it.  ``to_dict()`` is JSON-safe for persisting on ``UserResume``; the
+    lowered CV text is not stored and must be supplied to ``from_dict()``.
+    """
+
+    def __init__(self, cv_lower: str, skill_bits: int, experience_years: int,
+                 education_score: int, verb_score: int, section_score: int,
+                 role_keywords: set, text_hash: str, year: int):
+        self.cv_lower = cv_lower
+        self.skill_bits = skill_bits          # skills_data bitset
+        self.experience_years = experience_years
+        self.education_score = education_score
+        self.verb_score = verb_score
+        self.section_score = section_score
+        self.role_keywords = role_keywords
+        self.text_hash = text_hash
+        self.year = year
+
+    @staticmethod
+    def hash_text(cv_text: str) -> str:
+        import hashlib
+        return hashlib.sha256(cv_text.encode('utf-8', 'replace')).hexdigest()
+
+    @classmethod
+    def build(cls, cv_text) -> 'ResumeProfile':
+        from datetime import datetime as _dt
+
+        doc = ParsedCV.of(cv_text)
+        cv_text = doc.text
+        cv_lower = doc.lower
+
+        try:
+            verbs = analyze_action_verbs(doc)
+            verb_score = verbs.get('action_verb_score', 30)
+        except Exception:
+            verb_score = 30
+
+        try:
+            sections = doc.sections
+            essential_found = sum(
+                1 for s in _ESSENTIAL_SECTIONS
+                if s in sections.get('sections_found', [])
+            )
+            section_score = min(100, essential_found * 25)
+        except Exception:
+            section_score = 50
+
+        return cls(
+            cv_lower=cv_lower,
+            skill_bits=_expanded_skill_bits(cv_lower, doc.tokens),
+            experience_years=_cv_experience_years(cv_text),
+            education_score=_cv_education_score(cv_lower),
+            verb_score=verb_score,
+            section_score=section_score,
+            role_keywords={kw for kw in _ROLE_KEYWORDS if kw in cv_lower},
+            text_hash=cls.hash_text(cv_text),
+            year=_dt.utcnow().year,
+        )
+
+    def is_current(self, cv_text: str) -> bool:
+        """True if this profile still matches cv_text (and this year's date math)."""
+        from datetime import datetime as _dt
+        return self.year == _dt.utcnow().year and self.text_hash == self.hash_text(cv_text)
+
+    def to_dict(self) -> dict:
+        from skills_data import skill_bits_hex
+        return {
+            'version': RESUME_PROFILE_VERSION,
+            'text_hash': self.text_hash,
+            'year': self.year,
+            'skill_bits': skill_bits_hex(self.skill_bits),
+            'experience_years': self.experience_years,
+            'education_score': self.education_score,
+            'verb_score': self.verb_score,
+            'section_score': self.section_score,
+            'role_keywords': sorted(self.role_keywords),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, cv_text: str):
+        """Rebuild a stored profile; returns None if it is stale or malformed."""
+        from skills_data import skill_bits_from_hex
+        try:
+            if data.get('version') != RESUME_PROFILE_VERSION:
+                return None
+            profile = cls(
+                cv_lower=cv_text.lower(),
+                skill_bits=skill_bits_from_hex(data['skill_bits']),
+                experience_years=int(data['experience_years']),
+                education_score=int(data['education_score']),
+                verb_score=int(data['verb_score']),
+                section_score=int(data['section_score']),
+                role_keywords=set(data['role_keywords']),
+                text_hash=data['text_hash'],
+                year=int(data['year']),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return profile if profile.is_current(cv_text) else None
+
+
+def normalize_jd_text(jd_text: str) -> str:
+    """Canonical form of a JD for feature caching.
+
+    Every JD feature is computed on lowered text and ignores surrounding
+    whitespace, so descriptions that normalize equal share features.
+    """
+    return (jd_text or '').strip().lower()
+
+
+def jd_text_hash(jd_text: str) -> str:
+    """Content hash of a normalized JD (key for the JD feature cache)."""
+    import hashlib
+    return hashlib.sha256(normalize_jd_text(jd_text).encode('utf-8', 'replace')).hexdigest()
+
+
+def extract_jd_features(jd_text: str) -> dict:
+    """JD-side features for quick ATS scoring and local filters (JSON-safe).
+
+    Bump JD_FEATURES_VERSION whenever the returned features change.
+    """
+    from skills_data import skill_bits_hex
+
     jd_lower = jd_text.lower()
+    return {
+        'skill_bits': skill_bits_hex(_expanded_skill_bits(jd_lower)),
+        'min_years': min((int(y) for y in _YEARS_RE.findall(jd_lower)), default=0),
+        'keyword_phrases': sorted(_jd_keyword_phrases(jd_lower)),
+        'needs_education': any(kw in jd_lower for kw in _JD_EDU_KEYWORDS),
+        'role_keywords': sorted(_jd_role_keywords(jd_text)),
+        'mentions_hybrid': 'hybrid' in jd_lower,
+    }
+
+
+def _keyword_weights(phrases):
+    """Corpus IDF per JD phrase, or None when no keyword model is loaded."""
+    try:
+        from keyword_model import get_model
+        model = get_model()
+    except Exception:
+        model = None
+    if model is None:
+        return None
+    return [model.phrase_idf(p) for p in phrases]
+
+
+def extract_jd_features_many(jd_texts: list) -> list:
+    """extract_jd_features() over a list (one round trip through nlp_pool)."""
+    return [extract_jd_features(t) for t in jd_texts]
+
 
-    jd_needs_edu = any(
-        kw in jd_lower
-        for kw in ['degree', 'bachelor', 'master', 'education', 'qualification',
-                    'b.tech', 'b.s.', 'phd', 'mba']
+def quick_ats_score_profile(profile: ResumeProfile, jd) -> dict:
+    """Quick ATS score from a precomputed ResumeProfile.
+
+    ``jd`` is either raw JD text or the dict from ``extract_jd_features()``.
+    Only JD-side work happens here; see ``quick_ats_score`` for the factors.
+    """
+    from skills_data import skill_bits_from_hex, skill_names
+
+    features = extract_jd_features(jd) if isinstance(jd, str) else jd
+
+    # --- Factor 1: Skill Coverage (30%) ---
+    jd_bits = skill_bits_from_hex(features['skill_bits'])
+    matched = jd_bits & profile.skill_bits
+    missing = jd_bits & ~profile.skill_bits
+    skill_score = (
+        min(100, int(matched.bit_count() / max(jd_bits.bit_count(), 1) * 100))
+        if jd_bits else 50
     )
-    if not jd_needs_edu:
-        return 70  # JD doesn't emphasize education
 
-    cv_edu_score = 0
-    for kw, score in _edu_keywords.items():
-        if kw in cv_lower:
-            cv_edu_score = max(cv_edu_score, score)
+    # --- Factor 2: Experience Alignment (20%) ---
+    exp_score = _experience_score(profile.experience_years, features['min_years'])
 
-    return cv_edu_score if cv_edu_score > 0 else 30
+    # --- Factor 3: Keyword Optimization (15%) ---
+    phrases = features['keyword_phrases']
+    if phrases:
+        weights = _keyword_weights(phrases)
+        if weights is None:
+            found = sum(1 for p in phrases if p in profile.cv_lower)
+            kw_score = min(100, int(found / len(phrases) * 150))
+        else:
+            found = sum(w for p, w in zip(phrases, weights) if p in profile.cv_lower)
+            kw_score = min(100, int(found / sum(weights) * 150))
+    else:
+        kw_score = 50
 
+    # --- Factor 4: Education Match (10%) ---
+    if not features['needs_education']:
+        edu_score = 70  # JD doesn't emphasize education
+    else:
+        edu_score = profile.education_score if profile.education_score > 0 else 30
 
-def _estimate_role_relevance(cv_text: str, jd_text: str) -> int:
-    """Estimate overall role relevance from title/role keyword overlap."""
-    jd_lines = jd_text.strip().split('\n')[:5]
-    jd_title_text = ' '.join(jd_lines).lower()
-    cv_lower = cv_text.lower()
-
-    role_keywords = re.findall(
-        r'\b(?:engineer|developer|analyst|manager|designer|architect|lead|'
-        r'senior|junior|intern|consultant|specialist|coordinator|scientist|'
-        r'administrator|director)\b',
-        jd_title_text,
+    # --- Factors 5 & 6: Action Verbs / Section Structure (10% each) ---
+    verb_score = profile.verb_score
+    section_score = profile.section_score
+
+    # --- Factor 7: Overall Relevance (5%) ---
+    role_keywords = features['role_keywords']
+    if role_keywords:
+        found = sum(1 for kw in role_keywords if kw in profile.role_keywords)
+        relevance_score = min(100, int(found / len(role_keywords) * 100))
+    else:
+        relevance_score = 50
+
+    # --- Weighted composite (same weights as deep score) ---
+    composite = int(
+        skill_score * 0.30
+        + exp_score * 0.20
+        + kw_score * 0.15
+        + edu_score * 0.10
+        + verb_score * 0.10
+        + section_score * 0.10
+        + relevance_score * 0.05
     )
-    if not role_keywords:
-        return 50
-    found = sum(1 for kw in set(role_keywords) if kw in cv_lower)
-    return min(100, int(found / len(set(role_keywords)) * 100))
+    composite = min(100, max(0, composite))
+
+    return {
+        'score': composite,
+        'matched_skills': [s.title() for s in skill_names(matched, sort=True)][:10],
+        'missing_skills': [s.title() for s in skill_names(missing, sort=True)][:10],
+    }
 
 
 def quick_ats_score(cv_text: str, jd_text: str) -> dict:
@@ -674,86 +1229,140 @@ def quick_ats_score(cv_text: str, jd_text: str) -> dict:
     - section_structure (10%): essential section presence
     - overall_relevance (5%): title/role keyword overlap
 
+    When scoring many jobs against one resume, build a ``ResumeProfile``
+    once and call ``quick_ats_score_profile`` instead.
+
     Returns dict with: score (0-100), matched_skills, missing_skills.
     """
-    from skills_data import SKILL_ALIASES
+    return quick_ats_score_profile(ResumeProfile.build(cv_text), jd_text)
+
+
+def _incidence_matrix(rows: list, sparse, np):
+    """CSR job x term 0/1 matrix over the sorted vocabulary of ``rows``."""
+    vocab = sorted(set().union(*rows))
+    index = {term: i for i, term in enumerate(vocab)}
+    indptr = [0]
+    indices = []
+    for row in rows:
+        indices.extend(sorted(index[t] for t in set(row)))
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), indices, indptr),
+        shape=(len(rows), len(vocab)),
+    )
+    return matrix, vocab
 
-    # --- Factor 1: Skill Coverage (30%) ---
-    cv_skills_data = extract_skills_from_cv(cv_text)
-    jd_skills_data = extract_skills_from_cv(jd_text)
 
-    cv_skill_set = set(s.lower() for s in cv_skills_data.get('skills_found', []))
-    jd_skill_set = set(s.lower() for s in jd_skills_data.get('skills_found', []))
+def _skill_bool_array(hex_bits: list, np):
+    """Job x skill-ID bool array from skill_bits_hex() strings."""
+    from skills_data import NUM_SKILLS, SKILL_BYTES
+    packed = np.frombuffer(bytes.fromhex(''.join(hex_bits)), dtype=np.uint8)
+    packed = packed.reshape(len(hex_bits), SKILL_BYTES)
+    return np.unpackbits(packed, axis=1, bitorder='little')[:, :NUM_SKILLS].astype(bool)
 
-    # Expand both sets with aliases
-    cv_expanded = set(cv_skill_set)
-    jd_expanded = set(jd_skill_set)
-    cv_lower = cv_text.lower()
-    jd_lower = jd_text.lower()
 
-    for alias, canonical in SKILL_ALIASES.items():
-        pattern = r'\b' + re.escape(alias) + r'\b'
-        if re.search(pattern, cv_lower):
-            cv_expanded.add(canonical.lower())
-            cv_expanded.add(alias.lower())
-        if re.search(pattern, jd_lower):
-            jd_expanded.add(canonical.lower())
-            jd_expanded.add(alias.lower())
-
-    matched = cv_expanded & jd_expanded
-    missing = jd_expanded - cv_expanded
-    skill_score = (
-        min(100, int(len(matched) / max(len(jd_expanded), 1) * 100))
-        if jd_expanded else 50
+def batch_quick_ats(resume, jds: list) -> list:
+    """Quick ATS scores for a page of JDs against one resume.
+
+    ``resume`` is a ResumeProfile or raw CV text; each JD is raw text or an
+    ``extract_jd_features()`` dict.  Skill bitsets become a job x skill bool
+    array; JD bigrams and role keywords become sparse job x term matrices,
+    so each factor is one vectorized op over the page.  Returns the same dicts as ``quick_ats_score_profile``, in
+    order.
+    """
+    profile = resume if isinstance(resume, ResumeProfile) else ResumeProfile.build(resume)
+    features = [extract_jd_features(jd) if isinstance(jd, str) else jd for jd in jds]
+    if not features:
+        return []
+
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        return [quick_ats_score_profile(profile, f) for f in features]
+    from skills_data import SKILL_NAMES, SKILL_SORT_ORDER, skill_bits_hex
+
+    def _overlap(rows, present, scale, weigh=None):
+        """Per-job (optionally weighted) hit share, capped and scaled.
+
+        ``weigh`` maps the vocabulary to per-term weights (None = count).
+        """
+        matrix, vocab = _incidence_matrix(rows, sparse, np)
+        hit = np.fromiter((present(t) for t in vocab), dtype=np.int32, count=len(vocab))
+        weights = weigh(vocab) if weigh and vocab else None
+        if weights is None:
+            found = matrix @ hit
+            totals = np.diff(matrix.indptr)
+        else:
+            weights = np.asarray(weights, dtype=np.float64)
+            found = matrix @ (hit * weights)
+            totals = matrix @ weights
+        scores = np.where(
+            totals > 0,
+            np.minimum(100, (found / np.maximum(totals, 1) * scale).astype(np.int64)),
+            50,
+        )
+        return matrix, vocab, hit, scores
+
+    # --- Factor 1: Skill Coverage (30%) ---
+    # Columns in alphabetical order so matched / missing come out sorted
+    order = np.asarray(SKILL_SORT_ORDER)
+    jd_skills = _skill_bool_array([f['skill_bits'] for f in features], np)[:, order]
+    cv_skills = _skill_bool_array([skill_bits_hex(profile.skill_bits)], np)[0, order]
+    skill_hits = jd_skills & cv_skills
+    skill_totals = jd_skills.sum(axis=1)
+    skill_score = np.where(
+        skill_totals > 0,
+        np.minimum(100, (skill_hits.sum(axis=1) / np.maximum(skill_totals, 1) * 100).astype(np.int64)),
+        50,
     )
 
     # --- Factor 2: Experience Alignment (20%) ---
-    exp_score = _estimate_experience_match(cv_text, jd_text)
+    jd_years = np.array([f['min_years'] for f in features], dtype=np.int64)
+    cv_years = profile.experience_years
+    exp_score = np.where(
+        jd_years == 0, 60,
+        np.where(cv_years >= jd_years,
+                 np.minimum(100, 70 + (cv_years - jd_years) * 5),
+                 np.maximum(15, 60 - (jd_years - cv_years) * 15)),
+    )
 
     # --- Factor 3: Keyword Optimization (15%) ---
-    kw_score = _estimate_keyword_optimization(cv_text, jd_text)
+    # Each distinct phrase on the page is substring-checked (and IDF-weighted) once
+    _, _, _, kw_score = _overlap(
+        [f['keyword_phrases'] for f in features], profile.cv_lower.__contains__, 150,
+        weigh=_keyword_weights)
 
     # --- Factor 4: Education Match (10%) ---
-    edu_score = _estimate_education_match(cv_text, jd_text)
-
-    # --- Factor 5: Action Verb Quality (10%) ---
-    try:
-        verbs = analyze_action_verbs(cv_text)
-        verb_score = verbs.get('action_verb_score', 30)
-    except Exception:
-        verb_score = 30
-
-    # --- Factor 6: Section Structure (10%) ---
-    try:
-        sections = detect_sections(cv_text)
-        essential_found = sum(
-            1 for s in _ESSENTIAL_SECTIONS
-            if s in sections.get('sections_found', [])
-        )
-        section_score = min(100, essential_found * 25)
-    except Exception:
-        section_score = 50
+    needs_edu = np.array([bool(f['needs_education']) for f in features])
+    edu_score = np.where(needs_edu, profile.education_score or 30, 70)
 
     # --- Factor 7: Overall Relevance (5%) ---
-    relevance_score = _estimate_role_relevance(cv_text, jd_text)
+    _, _, _, relevance_score = _overlap(
+        [f['role_keywords'] for f in features], profile.role_keywords.__contains__, 100)
 
     # --- Weighted composite (same weights as deep score) ---
-    composite = int(
+    composite = (
         skill_score * 0.30
         + exp_score * 0.20
         + kw_score * 0.15
         + edu_score * 0.10
-        + verb_score * 0.10
-        + section_score * 0.10
+        + profile.verb_score * 0.10
+        + profile.section_score * 0.10
         + relevance_score * 0.05
-    )
-    composite = min(100, max(0, composite))
-
-    return {
-        'score': composite,
-        'matched_skills': [s.title() for s in sorted(matched)][:10],
-        'missing_skills': [s.title() for s in sorted(missing)][:10],
-    }
+    ).astype(np.int64)
+    composite = np.clip(composite, 0, 100)
+
+    results = []
+    names = np.array([SKILL_NAMES[i].title() for i in order], dtype=object)
+    skill_misses = jd_skills & ~cv_skills
+    for i in range(len(features)):
+        results.append({
+            'score': int(composite[i]),
+            'matched_skills': list(names[skill_hits[i]][:10]),
+            'missing_skills': list(names[skill_misses[i]][:10]),
+        })
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -896,10 +1505,11 @@ def _generate_rationale(key: str, score: int, formatting: dict, contact: dict,
 # Text Statistics
 # ---------------------------------------------------------------------------
 
-def compute_text_stats(cv_text: str) -> dict:
+def compute_text_stats(cv_text) -> dict:
     """Basic text statistics."""
-    words = cv_text.split()
-    sentences = re.split(r'[.!?]+', cv_text)
+    doc = ParsedCV.of(cv_text)
+    words = doc.words
+    sentences = re.split(r'[.!?]+', doc.text)
     sentences = [s.strip() for s in sentences if s.strip()]
 
     word_count = len(words)
@@ -912,7 +1522,7 @@ def compute_text_stats(cv_text: str) -> dict:
         'sentence_count': sentence_count,
         'avg_sentence_length': avg_sentence_length,
         'page_estimate': page_estimate,
-        'line_count': len(cv_text.split('\n')),
+        'line_count': len(doc.lines),
     }
 
 
@@ -920,19 +1530,49 @@ def compute_text_stats(cv_text: str) -> dict:
 # Master Function
 # ---------------------------------------------------------------------------
 
+# Bump whenever analyze_cv_standalone() output changes for the same text;
+# cached analyses (analysis_cache.py) from older versions are then ignored.
+# SKILL_TABLE_ID is folded in (as for RESUME_PROFILE_VERSION) so a taxonomy
+# edit retires cached skill lists without a manual bump.
+NLP_VERSION = 1
+_ANALYSIS_VERSION = (NLP_VERSION << 16) | SKILL_TABLE_ID
+
+
+def analysis_version() -> str:
+    """NLP_VERSION and SKILL_TABLE_ID plus the keyword backend
+    extract_keywords() will use."""
+    try:
+        from keyword_model import get_model
+        if get_model() is not None:
+            return f'{_ANALYSIS_VERSION}.idf'
+    except Exception:
+        pass
+    try:
+        _get_rake_stopwords()
+        return f'{_ANALYSIS_VERSION}.rake'
+    except LookupError:
+        return f'{_ANALYSIS_VERSION}.freq'
+
+
 def analyze_cv_standalone(cv_text: str) -> dict:
     """Run all local NLP analysis on a CV. Returns template-ready dict."""
     _ensure_nltk()
 
-    candidate_name = extract_candidate_name(cv_text)
-    sections = detect_sections(cv_text)
-    contact = extract_contact_info(cv_text)
-    formatting = compute_formatting_score(cv_text, sections)
-    verbs = analyze_action_verbs(cv_text)
-    quantification = check_quantification(cv_text)
-    keywords = extract_keywords(cv_text, top_n=20)
-    skills = extract_skills_from_cv(cv_text)
-    text_stats = compute_text_stats(cv_text)
+    # Tokenize once; every analyzer below reads from the same ParsedCV
+    doc = ParsedCV.of(cv_text)
+    return _assemble_analysis(
+        doc, analyze_action_verbs(doc), check_quantification(doc), extract_skills_from_cv(doc),
+    )
+
+
+def _assemble_analysis(doc: ParsedCV, verbs: dict, quantification: dict, skills: dict) -> dict:
+    """Run the whole-document analyzers and build the analyze_cv_standalone dict."""
+    candidate_name = extract_candidate_name(doc)
+    sections = doc.sections
+    contact = extract_contact_info(doc)
+    formatting = compute_formatting_score(doc, sections)
+    keywords = extract_keywords(doc.text, top_n=20)
+    text_stats = compute_text_stats(doc)
 
     cv_quality_score, quality_breakdown = compute_cv_quality_score(
         formatting, contact, sections, verbs, quantification, skills
@@ -960,3 +1600,112 @@ def analyze_cv_standalone(cv_text: str) -> dict:
         'skills': skills,
         'text_stats': text_stats,
     }
+
+
+# ---------------------------------------------------------------------------
+# Incremental (per-section) analysis — resume studio editor
+# ---------------------------------------------------------------------------
+# Verb, quantification and skill analysis only look at single lines or short
+# phrases, so their inputs can be computed per section and cached by section
+# hash.  An edit then re-scores just the changed sections; everything else is
+# cheap whole-document work re-run by _assemble_analysis().
+
+def analyze_section(section_text: str) -> dict:
+    """Line-local analysis facts for one CV section (reusable while it is unchanged)."""
+    doc = ParsedCV(section_text)
+    return {
+        'verb_leads': [_bullet_lead(b) for b in doc.bullets],
+        'metrics': [_bullet_metric(b) for b in doc.bullets],
+        'skill_terms': get_skill_matcher().find_terms(doc.lower),
+        'fuzzy_skills': _fuzzy_skill_hits(doc.lower, doc.tokens),
+    }
+
+
+def analyze_sections_many(section_texts: list) -> list:
+    """analyze_section() over a list (one round trip through nlp_pool)."""
+    return [analyze_section(t) for t in section_texts]
+
+
+def analyze_cv_incremental(section_texts: list, partials: list) -> dict:
+    """analyze_cv_standalone() for a CV given as sections.
+
+    ``partials[i]`` is ``analyze_section(section_texts[i])``.  Matches
+    analyze_cv_standalone() on the newline-joined text, except that skill
+    phrases spanning two sections are not picked up.
+    """
+    _ensure_nltk()
+
+    doc = ParsedCV('\n'.join(t for t in section_texts if t))
+    verbs = _score_action_verbs([lead for p in partials for lead in p['verb_leads']])
+    quantification = _score_quantification([m for p in partials for m in p['metrics']])
+    skills = _skills_result(set().union(*(p['skill_terms'] for p in partials)),
+                            set().union(*(p['fuzzy_skills'] for p in partials)))
+    return _assemble_analysis(doc, verbs, quantification, skills)
+
+
+# ---------------------------------------------------------------------------
+# Warm-up
+# ---------------------------------------------------------------------------
+
+_WARM_UP_CV = """Jane Doe
+jane@example.com | +1 555 123 4567 | linkedin.com/in/janedoe
+
+Summary
+Backend engineer with 5 years of experience in Python and AWS.
+
+Experience
+Senior Engineer, Acme (2019 - Present)
+- Built REST APIs in Python and Flask serving 2M users
+- Reduced AWS costs by 30% with Docker and Kubernetes
+
+Education
+B.Tech Computer Science
+
+Skills
+Python, SQL, PostgreSQL, React, Machine Learning
+"""
+
+
+def warm_up() -> dict:
+    """Pay every lazy initialisation cost up front (call at worker boot).
+
+    Verifies the bundled NLTK corpora, imports rapidfuzz / rake_nltk, builds
+    the skill matchers and runs each analyzer once on a small sample so
+    regex caches and corpus readers are hot.  Returns per-step timings (ms).
+    """
+    import time
+
+    timings = {}
+
+    def _step(name, fn):
+        start = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            logger.warning('NLP warm-up step %s failed: %s', name, e)
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    def _imports():
+        import skills_data  # noqa: F401
+        try:
+            import rapidfuzz  # noqa: F401
+            import rake_nltk  # noqa: F401
+        except ImportError as e:
+            logger.warning('NLP warm-up: optional dependency missing: %s', e)
+
+    def _matchers():
+        get_skill_matcher()
+        try:
+            get_fuzzy_skill_index()
+        except ImportError:
+            pass
+
+    _step('nltk', _ensure_nltk)
+    _step('imports', _imports)
+    _step('stopwords', _get_rake_stopwords)
+    _step('matchers', _matchers)
+    _step('analyzers', lambda: (analyze_cv_standalone(_WARM_UP_CV),
+                                quick_ats_score(_WARM_UP_CV, _WARM_UP_CV)))
+    timings['total'] = round(sum(timings.values()), 1)
+    logger.info('NLP warm-up done in %.0f ms: %s', timings['total'], timings)
+    return timings
@@ -0,0 +1,156 @@
+"""Per-provider health: rolling stats, circuit breakers, adaptive timeouts.
+
+Every HTTP attempt a provider makes through provider_transport.fetch_json()
+is recorded here (latency, success or failure).  From the last
+HEALTH_WINDOW attempts each provider gets:
+
+- a circuit breaker.  BREAKER_FAILURES consecutive failures, or an error
+  rate of BREAKER_ERROR_RATE over at least MIN_SAMPLES attempts, opens
+  it: searches skip the provider without calling it.  After the cooldown
+  one probe search is let through (half-open); success closes the
+  breaker, failure re-opens it with the cooldown doubled (up to
+  BREAKER_MAX_COOLDOWN_SECONDS).
+- a timeout derived from observed latency: TIMEOUT_MULTIPLIER x p95 of
+  recent successful calls, never below MIN_TIMEOUT_SECONDS nor above the
+  provider's configured timeout.
+
+State is per process and shared by all of its request threads and the
+transport loop.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+HEALTH_WINDOW = int(os.environ.get('PROVIDER_HEALTH_WINDOW', '50'))
+MIN_SAMPLES = 10
+BREAKER_FAILURES = int(os.environ.get('PROVIDER_BREAKER_FAILURES', '5'))
+BREAKER_ERROR_RATE = float(os.environ.get('PROVIDER_BREAKER_ERROR_RATE', '0.5'))
+BREAKER_COOLDOWN_SECONDS = float(os.environ.get('PROVIDER_BREAKER_COOLDOWN', '60'))
+BREAKER_MAX_COOLDOWN_SECONDS = 600
+TIMEOUT_MULTIPLIER = float(os.environ.get('PROVIDER_TIMEOUT_MULTIPLIER', '3'))
+MIN_TIMEOUT_SECONDS = float(os.environ.get('PROVIDER_MIN_TIMEOUT', '3'))
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+
+class ProviderHealth:
+    """Rolling stats and breaker state for one provider."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = deque(maxlen=HEALTH_WINDOW)   # (ok, latency seconds)
+        self._consecutive_failures = 0
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._cooldown = BREAKER_COOLDOWN_SECONDS
+        self._probe_started = None
+
+    def allow(self) -> bool:
+        """Whether a search may call the provider now.
+
+        An open breaker past its cooldown admits one probe; the probe slot
+        is freed again if no outcome is recorded within the cooldown.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if now - self._opened_at < self._cooldown:
+                    return False
+                self.state = HALF_OPEN
+                logger.info('Provider %s circuit half-open, probing', self.name)
+            elif self._probe_started is not None and now - self._probe_started < self._cooldown:
+                return False
+            self._probe_started = now
+            return True
+
+    def record(self, ok: bool, latency: float):
+        """Record one HTTP attempt."""
+        with self._lock:
+            self._calls.append((ok, latency))
+            self._consecutive_failures = 0 if ok else self._consecutive_failures + 1
+            if self.state == HALF_OPEN:
+                self._probe_started = None
+                if ok:
+                    self.state = CLOSED
+                    self._cooldown = BREAKER_COOLDOWN_SECONDS
+                    # Failures from before the outage must not re-trip it
+                    self._calls.clear()
+                    self._calls.append((ok, latency))
+                    logger.info('Provider %s circuit closed', self.name)
+                else:
+                    self._open(min(self._cooldown * 2, BREAKER_MAX_COOLDOWN_SECONDS))
+            elif self.state == CLOSED and not ok and self._should_trip():
+                self._open(BREAKER_COOLDOWN_SECONDS)
+
+    def _should_trip(self):
+        if self._consecutive_failures >= BREAKER_FAILURES:
+            return True
+        if len(self._calls) < MIN_SAMPLES:
+            return False
+        failures = sum(1 for ok, _ in self._calls if not ok)
+        return failures / len(self._calls) >= BREAKER_ERROR_RATE
+
+    def _open(self, cooldown):
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._cooldown = cooldown
+        logger.warning('Provider %s circuit open for %.0fs (%d consecutive failures)',
+                       self.name, cooldown, self._consecutive_failures)
+
+    def _p95(self):
+        latencies = sorted(latency for ok, latency in self._calls if ok)
+        if len(latencies) < MIN_SAMPLES:
+            return None
+        return latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+
+    def timeout(self, configured: float) -> float:
+        """Request timeout: TIMEOUT_MULTIPLIER x p95, within [MIN_TIMEOUT_SECONDS, configured]."""
+        with self._lock:
+            p95 = self._p95()
+        if p95 is None:
+            return configured
+        return min(configured, max(MIN_TIMEOUT_SECONDS, p95 * TIMEOUT_MULTIPLIER))
+
+    def stats(self) -> dict:
+        with self._lock:
+            calls = list(self._calls)
+            p95 = self._p95()
+            state = self.state
+            cooldown_left = (max(0.0, self._opened_at + self._cooldown - time.monotonic())
+                             if state == OPEN else 0.0)
+        latencies = sorted(latency for ok, latency in calls if ok)
+        return {
+            'state': state,
+            'calls': len(calls),
+            'error_rate': round(sum(1 for ok, _ in calls if not ok) / len(calls), 3) if calls else 0.0,
+            'consecutive_failures': self._consecutive_failures,
+            'p50_ms': round(latencies[len(latencies) // 2] * 1000) if latencies else None,
+            'p95_ms': round(p95 * 1000) if p95 is not None else None,
+            'cooldown_left_s': round(cooldown_left, 1),
+        }
+
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def get(name: str) -> ProviderHealth:
+    """The ProviderHealth for a provider name (created on first use)."""
+    health = _registry.get(name)
+    if health is None:
+        with _registry_lock:
+            health = _registry.setdefault(name, ProviderHealth(name))
+    return health
+
+
+def snapshot() -> dict:
+    """{provider name: stats()} for every provider seen so far."""
+    return {name: health.stats() for name, health in sorted(_registry.items())}
@@ -0,0 +1,283 @@
+"""Shared HTTP transport for job providers.
+
+All provider calls go through one long-lived ``httpx.AsyncClient`` (per
+process), so connections to each API host are kept alive and reused
+across searches instead of paying a TCP+TLS handshake per call.  The
+client lives on a background event loop thread; request threads hand it
+coroutines with run() / gather() and block on the result, so a search
+drives every provider concurrently without spawning threads.
+gather_early() returns once enough has arrived and leaves slower
+coroutines running on the loop.
+
+Providers describe a call as a request spec dict (see fetch_json()).
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+MAX_CONNECTIONS = int(os.environ.get('PROVIDER_MAX_CONNECTIONS', '50'))
+MAX_KEEPALIVE = int(os.environ.get('PROVIDER_MAX_KEEPALIVE', '20'))
+KEEPALIVE_EXPIRY_SECONDS = 90
+
+_lock = threading.Lock()
+_loop = None
+_loop_pid = None
+_client = None   # only touched on the loop thread
+
+
+def _get_loop():
+    """The background loop for this process (restarted after a fork)."""
+    global _loop, _loop_pid, _client
+    with _lock:
+        if _loop is None or _loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='provider-transport',
+                             daemon=True).start()
+            _loop, _loop_pid, _client = loop, os.getpid(), None
+        return _loop
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        import httpx
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS,
+                                max_keepalive_connections=MAX_KEEPALIVE,
+                                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS),
+            follow_redirects=True,
+        )
+    return _client
+
+
+def run(coro, timeout: float = None):
+    """Run a coroutine on the transport loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result(timeout)
+
+
+def _outcome(task):
+    return task.exception() if task.exception() is not None else task.result()
+
+
+def gather(coros: dict, timeout: float) -> dict:
+    """Run {name: coroutine} concurrently; wait at most `timeout` seconds.
+
+    Returns {name: result or exception}.  Coroutines still running at the
+    deadline are cancelled and reported as asyncio.TimeoutError.
+    """
+    async def _gather():
+        tasks = {name: asyncio.ensure_future(coro) for name, coro in coros.items()}
+        if not tasks:
+            return {}
+        await asyncio.wait(tasks.values(), timeout=timeout)
+        results = {}
+        for name, task in tasks.items():
+            if not task.done():
+                task.cancel()
+                results[name] = asyncio.TimeoutError(f'no result after {timeout}s')
+            else:
+                results[name] = _outcome(task)
+        return results
+
+    return run(_gather())
+
+
+def _start_tasks(coros: dict, finished):
+    """Schedule {name: coroutine} on the loop; each task puts (name, task)
+    on the `finished` queue when done.  Returns {name: task}."""
+    async def _start():
+        tasks = {}
+        for name, coro in coros.items():
+            task = asyncio.ensure_future(coro)
+            task.add_done_callback(lambda t, name=name: finished.put((name, t)))
+            tasks[name] = task
+        return tasks
+
+    return run(_start())
+
+
+def _cancel(tasks):
+    loop = _get_loop()
+    for task in tasks:
+        loop.call_soon_threadsafe(task.cancel)
+
+
+def as_completed(coros: dict, timeout: float):
+    """Run {name: coroutine} concurrently; yield (name, result or exception)
+    as each finishes.
+
+    Coroutines still running after `timeout` seconds (or when the caller
+    stops iterating) are cancelled; the former are yielded with
+    asyncio.TimeoutError.
+    """
+    finished = queue.Queue()
+    tasks = _start_tasks(coros, finished)
+    remaining = dict(tasks)
+    end = time.monotonic() + timeout
+    try:
+        while remaining:
+            try:
+                name, task = finished.get(timeout=max(0.0, end - time.monotonic()))
+            except queue.Empty:
+                break
+            del remaining[name]
+            yield name, _outcome(task)
+        for name in list(remaining):
+            del remaining[name]
+            yield name, asyncio.TimeoutError(f'no result after {timeout}s')
+    finally:
+        _cancel(tasks.values())
+
+
+def gather_early(coros: dict, timeout: float, deadline: float, ready):
+    """Run {name: coroutine} concurrently and return as soon as possible.
+
+    Returns (results, late) once ready(results) is true, or once
+    `deadline` seconds have passed and some coroutine has returned a truthy
+    result (with nothing yet, it keeps waiting up to `timeout`).  `results`
+    is {name: result or exception} for the coroutines done by then.  The
+    rest keep running in the background, still bounded by `timeout` from
+    the start: `late` is a concurrent.futures.Future of their results (in
+    the same form), or None when nothing was left running.
+
+    ready() runs on the calling thread, never on the loop, so it may do
+    CPU work; if it raises, the results count as not ready yet.
+    """
+    finished = queue.Queue()
+    start = time.monotonic()
+    tasks = _start_tasks(coros, finished)
+    pending = dict(tasks)
+    results = {}
+    try:
+        while pending:
+            elapsed = time.monotonic() - start
+            expired = elapsed >= deadline
+            if expired and any(r and not isinstance(r, BaseException) for r in results.values()):
+                break
+            remaining = (timeout if expired else deadline) - elapsed
+            if remaining <= 0:
+                break
+            try:
+                name, task = finished.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            # Take everything that finished meanwhile before checking readiness
+            while True:
+                del pending[name]
+                results[name] = _outcome(task)
+                try:
+                    name, task = finished.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if ready(results):
+                    break
+            except Exception as e:
+                logger.warning('gather_early: ready() failed, treating as not ready: %s', e)
+    except BaseException:
+        _cancel(tasks.values())
+        raise
+
+    if not pending:
+        return results, None
+    left = timeout - (time.monotonic() - start)
+    if left <= 0:
+        _cancel(pending.values())
+        for name in pending:
+            results[name] = asyncio.TimeoutError(f'no result after {timeout}s')
+        return results, None
+
+    async def _rest():
+        await asyncio.wait(pending.values(), timeout=left)
+        rest = {}
+        for name, task in pending.items():
+            if not task.done():
+                task.cancel()
+                rest[name] = asyncio.TimeoutError(f'no result after {timeout}s')
+            else:
+                rest[name] = _outcome(task)
+        return rest
+
+    return results, asyncio.run_coroutine_threadsafe(_rest(), _get_loop())
+
+
+async def fetch_json(spec: dict, label: str, health=None):
+    """Perform a request spec; return the decoded JSON body or None.
+
+    Spec keys: method (default GET), url, params, json, headers,
+    timeout (seconds, default 20), retries (extra attempts on timeout,
+    default 0).  Errors are logged under `label` and yield None.
+
+    With a provider_health.ProviderHealth, each attempt is recorded there
+    and the timeout is the one it derives from recent latency.  An attempt
+    cancelled by the caller's deadline (gather, gather_early, as_completed)
+    counts as a failure, so a provider that hangs past it trips its breaker
+    and resolves a half-open probe.
+    """
+    import httpx
+
+    timeout = spec.get('timeout', 20)
+    if health is not None:
+        timeout = health.timeout(timeout)
+    attempts = 1 + spec.get('retries', 0)
+    for attempt in range(attempts):
+        start = time.monotonic()
+        try:
+            resp = await _get_client().request(
+                spec.get('method', 'GET'),
+                spec['url'],
+                params=spec.get('params'),
+                json=spec.get('json'),
+                headers=spec.get('headers'),
+                timeout=timeout,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+        except httpx.TimeoutException:
+            logger.warning('%s timeout after %.1fs (attempt %d/%d)', label, timeout,
+                           attempt + 1, attempts)
+            if health is not None:
+                health.record(False, time.monotonic() - start)
+        except asyncio.CancelledError:
+            logger.warning('%s cancelled after %.1fs (attempt %d/%d)', label,
+                           time.monotonic() - start, attempt + 1, attempts)
+            if health is not None:
+                health.record(False, time.monotonic() - start)
+            raise
+        except Exception as e:
+            logger.error('%s error: %s', label, e)
+            if health is not None:
+                health.record(False, time.monotonic() - start)
+            return None
+        else:
+            if health is not None:
+                health.record(True, time.monotonic() - start)
+            return data
+    return None
+
+
+def close():
+    """Close pooled connections and stop the loop (worker shutdown)."""
+    global _loop
+    with _lock:
+        loop, _loop = _loop, None
+    if loop is None or _loop_pid != os.getpid():
+        return
+
+    async def _close():
+        global _client
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+
+    try:
+        asyncio.run_coroutine_threadsafe(_close(), loop).result(5)
+    except Exception as e:
+        logger.warning('Provider transport close failed: %s', e)
+    loop.call_soon_threadsafe(loop.stop)
@@ -1,3 +1,5 @@
+import zlib
+
 SKILL_CATEGORIES = {
     'programming_languages': {
         'python', 'java', 'javascript', 'typescript', 'c++', 'c#',
@@ -109,6 +111,82 @@ SKILL_ALIASES = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Interned skill table: every category skill, alias and alias target gets a
+# stable integer ID, assigned category by category (sorted within each) so a
+# category is one contiguous ID range; alias-only names come last.
+#
+# Skill sets are int bitsets (bit i = SKILL_NAMES[i]): matched / missing /
+# coverage are &, & ~ and bit_count().  Caches store them as fixed-width hex
+# (skill_bits_hex).  SKILL_TABLE_ID changes whenever any ID shifts, so code
+# that persists bitsets folds it into its cache version.
+# ---------------------------------------------------------------------------
+def _intern_skills():
+    names, ranges = [], {}
+    for _category, _skills in SKILL_CATEGORIES.items():
+        start = len(names)
+        names.extend(sorted(_skills))
+        ranges[_category] = range(start, len(names))
+    names.extend(sorted((set(SKILL_ALIASES) | set(SKILL_ALIASES.values())) - ALL_KNOWN_SKILLS))
+    return tuple(names), ranges
+
+
+SKILL_NAMES, CATEGORY_RANGES = _intern_skills()
+SKILL_IDS = {name: i for i, name in enumerate(SKILL_NAMES)}
+ALIAS_IDS = {alias: SKILL_IDS[canonical] for alias, canonical in SKILL_ALIASES.items()}
+NUM_SKILLS = len(SKILL_NAMES)
+SKILL_BYTES = (NUM_SKILLS + 7) // 8
+SKILL_TABLE_ID = zlib.crc32('\n'.join(SKILL_NAMES).encode('utf-8')) & 0xFFFF
+
+CATEGORY_MASKS = {c: ((1 << r.stop) - 1) ^ ((1 << r.start) - 1) for c, r in CATEGORY_RANGES.items()}
+KNOWN_SKILLS_MASK = (1 << len(ALL_KNOWN_SKILLS)) - 1       # category skills = the first IDs
+ALIAS_MASK = sum(1 << SKILL_IDS[a] for a in SKILL_ALIASES)
+# Rank of each ID in alphabetical order (matched/missing lists are shown sorted)
+SKILL_SORT_ORDER = tuple(sorted(range(NUM_SKILLS), key=SKILL_NAMES.__getitem__))
+
+
+def skill_bits(names) -> int:
+    """Bitset of the interned skills among names (unknown names are ignored)."""
+    bits = 0
+    for name in names:
+        i = SKILL_IDS.get(name)
+        if i is not None:
+            bits |= 1 << i
+    return bits
+
+
+def skill_ids(bits: int) -> list:
+    """IDs set in a bitset, ascending."""
+    ids = []
+    while bits:
+        low = bits & -bits
+        ids.append(low.bit_length() - 1)
+        bits ^= low
+    return ids
+
+
+def skill_names(bits: int, sort=False) -> list:
+    """Names in a bitset, by ID (or alphabetically with sort=True)."""
+    names = [SKILL_NAMES[i] for i in skill_ids(bits)]
+    return sorted(names) if sort else names
+
+
+def alias_targets(bits: int) -> int:
+    """Bitset of the canonical skills for the aliases set in bits."""
+    targets = 0
+    for i in skill_ids(bits & ALIAS_MASK):
+        targets |= 1 << ALIAS_IDS[SKILL_NAMES[i]]
+    return targets
+
+
+def skill_bits_hex(bits: int) -> str:
+    return bits.to_bytes(SKILL_BYTES, 'little').hex()
+
+
+def skill_bits_from_hex(text: str) -> int:
+    return int.from_bytes(bytes.fromhex(text), 'little')
+
+
 # ---------------------------------------------------------------------------
 # Global seniority levels — same for every function
 # ---------------------------------------------------------------------------
@@ -67,6 +67,7 @@ function initEditor(serverData) {
     // Render first section and preview
     switchSection('basics');
     renderPreview();
+    refreshScore();
 
     // Warn on unsaved changes
     window.addEventListener('beforeunload', function(e) {
@@ -537,6 +538,41 @@ let previewTimer = null;
 function debouncedPreview() {
     clearTimeout(previewTimer);
     previewTimer = setTimeout(renderPreview, 300);
+    debouncedScore();
+}
+
+/* ═══════════════════════════════════════════════════════
+   LIVE SCORE (server re-scores only the edited sections)
+   ═══════════════════════════════════════════════════════ */
+
+let scoreTimer = null;
+function debouncedScore() {
+    clearTimeout(scoreTimer);
+    scoreTimer = setTimeout(refreshScore, 1500);
+}
+
+async function refreshScore() {
+    const badge = document.getElementById('live-score');
+    if (!badge) return;
+    collectFormData();
+    try {
+        const res = await fetch('/resume-studio/editor/score', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ resume_json: editorState.data })
+        });
+        const result = await res.json();
+        if (result.success) updateScoreBadge(result.cv_quality_score);
+    } catch (e) {
+        console.warn('Live score error:', e);
+    }
+}
+
+function updateScoreBadge(score) {
+    const badge = document.getElementById('live-score');
+    if (!badge || score === undefined) return;
+    badge.textContent = `Score ${score}`;
+    badge.classList.remove('hidden');
 }
 
 function renderPreview() {
@@ -616,6 +652,7 @@ async function saveResume() {
         if (result.success) {
             editorState.resumeId = result.resume_id;
             editorState.dirty = false;
+            updateScoreBadge(result.cv_quality_score);
             // Update URL without reload if new resume
             if (!window.location.pathname.includes(result.resume_id.toString())) {
                 window.history.replaceState({}, '', `/resume-studio/editor/${result.resume_id}`);
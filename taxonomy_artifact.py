@@ -0,0 +1,134 @@
+"""Prebuilt taxonomy artifact.
+
+Built once at deploy time (`python -m taxonomy_artifact`, run from build.sh
+and nixpacks.toml) and loaded at startup instead of being rebuilt in every
+process:
+
+- the SkillMatcher: its trie pattern source and implied-prefix table over
+  skills/aliases.  The regex itself is not cached: pickle stores a pattern
+  as its source, so load() recompiles it (about 3.5 ms of a ~4 ms load,
+  against ~13.5 ms to build everything from scratch).
+- the FuzzySkillIndex length blocks
+- the pre-rendered /jobs/category-tree JSON and its ETag
+
+The file is a pickle header (format version + hash of the source files it
+was built from) followed by the payload.  A missing or stale file is not an
+error: load() just builds the same objects in memory.  gunicorn.conf.py
+loads it in the master before forking, so workers share it copy-on-write.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_VERSION = 2
+ARTIFACT_PATH = os.environ.get(
+    'TAXONOMY_ARTIFACT_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'taxonomy.pkl'),
+)
+# The artifact is stale when any of these change
+_SOURCES = ('skills_data.py', 'nlp_service.py', 'taxonomy_artifact.py')
+
+_artifact = None
+
+
+def source_hash() -> str:
+    digest = hashlib.sha256(str(ARTIFACT_VERSION).encode())
+    base = os.path.dirname(os.path.abspath(__file__))
+    for name in _SOURCES:
+        with open(os.path.join(base, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def render_category_tree() -> bytes:
+    """The /jobs/category-tree response body."""
+    from skills_data import TAXONOMY, GLOBAL_LEVELS, INDIAN_CITIES
+
+    functions = {}
+    for func_id, func_data in TAXONOMY.items():
+        role_families = {}
+        for rf_id, rf_data in func_data['role_families'].items():
+            role_families[rf_id] = {
+                'label': rf_data['label'],
+                'skills': rf_data['skills'][:8],
+                'title_patterns': rf_data.get('title_patterns', []),
+            }
+        functions[func_id] = {
+            'label': func_data['label'],
+            'role_families': role_families,
+        }
+
+    levels = [{'id': lv['id'], 'label': lv['label']} for lv in GLOBAL_LEVELS]
+
+    # Same key order and separators as Flask's jsonify
+    return json.dumps({
+        'functions': functions,
+        'levels': levels,
+        'locations': INDIAN_CITIES,
+    }, sort_keys=True, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def build() -> dict:
+    from nlp_service import FuzzySkillIndex, SkillMatcher
+    from skills_data import ALL_KNOWN_SKILLS, SKILL_ALIASES, SKILL_CATEGORIES
+
+    tree = render_category_tree()
+    return {
+        'skill_matcher': SkillMatcher(SKILL_CATEGORIES, SKILL_ALIASES),
+        'fuzzy_index': FuzzySkillIndex(ALL_KNOWN_SKILLS),
+        'category_tree_json': tree,
+        'category_tree_etag': hashlib.sha256(tree).hexdigest()[:32],
+    }
+
+
+def compile_artifact(path: str = None) -> str:
+    """Build and write the artifact atomically; returns its path."""
+    path = path or ARTIFACT_PATH
+    header = {'version': ARTIFACT_VERSION, 'source_hash': source_hash()}
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(build(), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _read(path):
+    """Payload of a current artifact file, or None."""
+    try:
+        with open(path, 'rb') as f:
+            header = pickle.load(f)
+            if header != {'version': ARTIFACT_VERSION, 'source_hash': source_hash()}:
+                logger.info('Taxonomy artifact %s is stale; building in memory', path)
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning('Taxonomy artifact unreadable (%s); building in memory', e)
+        return None
+
+
+def load() -> dict:
+    """The process-wide artifact payload (read or built on first call)."""
+    global _artifact
+    if _artifact is None:
+        start = time.perf_counter()
+        payload = _read(ARTIFACT_PATH)
+        source = 'loaded'
+        if payload is None:
+            payload, source = build(), 'built'
+        _artifact = payload
+        logger.info('Taxonomy artifact %s in %.1f ms', source, (time.perf_counter() - start) * 1000)
+    return _artifact
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    print(compile_artifact())